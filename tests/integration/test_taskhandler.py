@@ -37,6 +37,7 @@ import threading
 
 from tests.support_.test_data import data_queues, mock_jobqueue_class
 from unmanic.libs.taskhandler import TaskHandler
+from unmanic.libs.unmodels.libraries import Libraries
 from unmanic.libs.unmodels.tasks import Tasks
 
 
@@ -73,14 +74,15 @@ class TestClass(object):
         app_dir = os.path.dirname(os.path.abspath(__file__))
         database_settings = {
             "TYPE":           "SQLITE",
-            "FILE":           ':memory:',
+            "FILE":           os.path.join(config_path, 'unmanic.db'),
             "MIGRATIONS_DIR": os.path.join(app_dir, 'migrations'),
         }
         from unmanic.libs.unmodels.lib import Database
         self.db_connection = Database.select_database(database_settings)
 
         # Create required tables
-        self.db_connection.create_tables([Tasks])
+        self.db_connection.create_tables([Tasks, Libraries])
+        Libraries.create(id=1, name='Default', path=config_path, priority_score=100)
 
         # import config
         from unmanic import config
@@ -147,6 +149,27 @@ class TestClass(object):
         self.task_handler.process_inotifytasks_queue()
         assert (test_path_string == self.task_queue.added_item)
 
+    @pytest.mark.integrationtest
+    def test_task_handler_can_bulk_add_paths_to_task_queue(self):
+        self.task_handler.stop()
+        self.task_handler.join()
+        items = [{'pathname': '/library/bulk/{}.mkv'.format(i), 'library_id': 1, 'priority_score': i} for i in range(250)]
+        # Add an existing task and a duplicate path within the batch
+        self.task_handler.create_task_from_path('/library/bulk/0.mkv', 1)
+        items.append({'pathname': '/library/bulk/1.mkv', 'library_id': 1, 'priority_score': 0})
+
+        added_paths = self.task_handler.add_paths_to_task_queue(items)
+        assert len(added_paths) == 249
+        assert '/library/bulk/0.mkv' not in added_paths
+
+        tasks = Tasks.select().where(Tasks.abspath.startswith('/library/bulk/'))
+        assert tasks.count() == 250
+        for bulk_task in tasks.where(Tasks.abspath != '/library/bulk/0.mkv'):
+            priority_score = int(os.path.splitext(os.path.basename(bulk_task.abspath))[0])
+            assert bulk_task.status == 'pending'
+            assert bulk_task.cache_path
+            assert bulk_task.priority == bulk_task.id + 100 + priority_score
+
 
 if __name__ == '__main__':
     pytest.main(['-s', '--log-cli-level=INFO', __file__])
@@ -46,3 +46,6 @@ class MockJobQueue(object):
     def add_item(self, pathname):
         self.added_item = pathname
         return True
+
+    def trigger_dispatch(self):
+        pass
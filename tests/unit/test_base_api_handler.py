@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_base_api_handler.py
+ 
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (03:10 PM)
+ 
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+ 
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+  
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+  
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import asyncio
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+import tornado.escape
+import tornado.httpserver
+import tornado.web
+from tornado.ioloop import IOLoop
+
+from unmanic.webserver.api_v2.base_api_handler import BaseApiHandler
+
+
+class ApiEchoHandler(BaseApiHandler):
+    finished_count = 0
+    routes = [
+        {
+            "path_pattern":      r"/echo/(?P<value>[a-z0-9]+)",
+            "supported_methods": ["GET"],
+            "call_method":       "echo",
+        },
+    ]
+
+    def echo(self, value=None):
+        self.write_success({'value': tornado.escape.to_unicode(value), 'thread': threading.current_thread().name})
+
+    def on_finish(self):
+        ApiEchoHandler.finished_count += 1
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Runs unit tests against API routes executed in the thread pool
+
+    """
+
+    def setup_class(self):
+        self.io_loop = None
+        self.port = None
+        ready = threading.Event()
+
+        def serve():
+            asyncio.set_event_loop(asyncio.new_event_loop())
+            self.io_loop = IOLoop.current()
+            app = tornado.web.Application([(r"/unmanic/api/v2/(.*)", ApiEchoHandler)])
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind(('127.0.0.1', 0))
+            sock.listen(8)
+            sock.setblocking(False)
+            self.port = sock.getsockname()[1]
+            server = tornado.httpserver.HTTPServer(app)
+            server.add_sockets([sock])
+            ready.set()
+            self.io_loop.start()
+
+        self.server_thread = threading.Thread(target=serve, daemon=True)
+        self.server_thread.start()
+        ready.wait(5)
+
+    def teardown_class(self):
+        self.io_loop.add_callback(self.io_loop.stop)
+        self.server_thread.join(5)
+
+    @pytest.mark.unittest
+    def test_executor_routes_write_one_response_each_over_a_reused_connection(self):
+        ApiEchoHandler.finished_count = 0
+        conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=5)
+        conn.connect()
+        first_sock = conn.sock
+        for i in range(20):
+            conn.request('GET', '/unmanic/api/v2/echo/value{}'.format(i))
+            res = conn.getresponse()
+            assert res.status == 200
+            assert res.getheader('Connection', '').lower() != 'close'
+            data = json.loads(res.read())
+            assert data['value'] == 'value{}'.format(i)
+            # The route was run in the thread pool, not on the IOLoop
+            assert data['thread'] != self.server_thread.name
+            # The same keep-alive connection was reused for every request
+            assert conn.sock is first_sock
+
+        # Nothing further was written to the connection after the last response
+        first_sock.settimeout(0.5)
+        with pytest.raises(socket.timeout):
+            first_sock.recv(1)
+        conn.close()
+        assert ApiEchoHandler.finished_count == 20
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_chunkedtransfer.py
+ 
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (11:40 AM)
+ 
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+ 
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+  
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+  
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.chunkedtransfer import ChunkedTransferError, UploadSessions, chunk_hash, merge_ranges, \
+    parse_range_header, split_ranges
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Runs unit tests against the resumable upload sessions
+
+    """
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+        :return:
+        """
+        self.tmp_directory = tempfile.mkdtemp(prefix='unmanic_tests_')
+        self.upload_sessions = UploadSessions()
+        self.upload_sessions.sessions_directory = os.path.join(self.tmp_directory, 'upload_sessions')
+
+    @pytest.mark.unittest
+    def test_upload_session_reassembles_chunks_in_any_order(self):
+        data = os.urandom(3000)
+        session_data = self.upload_sessions.create_session('../test.mkv', len(data))
+        session_id = session_data.get('session_id')
+        assert session_data.get('filename') == 'test.mkv'
+        assert session_data.get('offset') == 0
+
+        # A chunk received out of order is recorded without moving the offset
+        self.upload_sessions.write_chunk(session_id, 2000, data[2000:], expected_hash=chunk_hash(data[2000:]))
+        self.upload_sessions.write_chunk(session_id, 0, data[:1000], expected_hash=chunk_hash(data[:1000]))
+        session_data = self.upload_sessions.get_session(session_id)
+        assert session_data.get('offset') == 1000
+        assert split_ranges(len(data), 1000, session_data.get('received')) == [(1000, 2000)]
+
+        # A corrupt chunk is rejected
+        with pytest.raises(ChunkedTransferError):
+            self.upload_sessions.write_chunk(session_id, 1000, data[1000:2000], expected_hash=chunk_hash(b'corrupt'))
+        # The upload can not be completed until all bytes are received
+        destination_directory = os.path.join(self.tmp_directory, 'complete')
+        with pytest.raises(ChunkedTransferError):
+            self.upload_sessions.complete_session(session_id, destination_directory)
+
+        session_data = self.upload_sessions.write_chunk(session_id, 1000, data[1000:2000])
+        assert session_data.get('offset') == len(data)
+        path = self.upload_sessions.complete_session(session_id, destination_directory)
+        with open(path, 'rb') as f:
+            assert f.read() == data
+        with pytest.raises(ChunkedTransferError):
+            self.upload_sessions.get_session(session_id)
+
+    @pytest.mark.unittest
+    def test_out_of_order_chunks_are_merged_into_the_received_ranges(self):
+        data = os.urandom(5000)
+        session_id = self.upload_sessions.create_session('test.mkv', len(data)).get('session_id')
+
+        session_data = self.upload_sessions.write_chunk(session_id, 3000, data[3000:4000])
+        assert session_data.get('received') == [[3000, 4000]]
+        assert session_data.get('offset') == 0
+        session_data = self.upload_sessions.write_chunk(session_id, 1000, data[1000:2000])
+        assert session_data.get('received') == [[1000, 2000], [3000, 4000]]
+        assert session_data.get('offset') == 0
+        # A chunk that fills a gap joins the ranges on either side of it
+        session_data = self.upload_sessions.write_chunk(session_id, 2000, data[2000:3000])
+        assert session_data.get('received') == [[1000, 4000]]
+        assert session_data.get('offset') == 0
+        # A chunk that is sent again does not change the received ranges
+        session_data = self.upload_sessions.write_chunk(session_id, 2000, data[2000:3000])
+        assert session_data.get('received') == [[1000, 4000]]
+        # The offset only moves once the start of the file has been received
+        session_data = self.upload_sessions.write_chunk(session_id, 0, data[:1000])
+        assert session_data.get('received') == [[0, 4000]]
+        assert session_data.get('offset') == 4000
+        session_data = self.upload_sessions.write_chunk(session_id, 4000, data[4000:])
+        assert session_data.get('received') == [[0, 5000]]
+        assert session_data.get('offset') == 5000
+        self.upload_sessions.remove_session(session_id)
+
+    @pytest.mark.unittest
+    def test_merge_ranges(self):
+        assert merge_ranges([]) == []
+        assert merge_ranges([[20, 30], [0, 10]]) == [[0, 10], [20, 30]]
+        assert merge_ranges([[0, 10], [10, 20]]) == [[0, 20]]
+        assert merge_ranges([[0, 15], [10, 20], [5, 8]]) == [[0, 20]]
+
+    @pytest.mark.unittest
+    def test_upload_resumes_with_a_different_chunk_size(self):
+        data = os.urandom(10000)
+        session_id = self.upload_sessions.create_session('test.mkv', len(data)).get('session_id')
+
+        # The first attempt sent some of its 1000 byte chunks before it was interrupted
+        for start, end in split_ranges(len(data), 1000):
+            if start in (0, 1000, 2000, 6000):
+                self.upload_sessions.write_chunk(session_id, start, data[start:end])
+        received = self.upload_sessions.get_session(session_id).get('received')
+        assert received == [[0, 3000], [6000, 7000]]
+
+        # The second attempt uses 1500 byte chunks and skips any chunk that was already received
+        chunks = split_ranges(len(data), 1500, received)
+        assert chunks == [(3000, 4500), (4500, 6000), (6000, 7500), (7500, 9000), (9000, 10000)]
+        assert split_ranges(len(data), 4000, received) == [(0, 4000), (4000, 8000), (8000, 10000)]
+        for start, end in chunks:
+            self.upload_sessions.write_chunk(session_id, start, data[start:end])
+        assert self.upload_sessions.get_session(session_id).get('offset') == len(data)
+        assert split_ranges(len(data), 1500, self.upload_sessions.get_session(session_id).get('received')) == []
+
+        path = self.upload_sessions.complete_session(session_id, os.path.join(self.tmp_directory, 'resumed'))
+        with open(path, 'rb') as f:
+            assert f.read() == data
+
+    @pytest.mark.unittest
+    def test_parse_range_header(self):
+        assert parse_range_header(None, 100) is None
+        assert parse_range_header('bytes=10-19', 100) == (10, 19)
+        assert parse_range_header('bytes=90-', 100) == (90, 99)
+        assert parse_range_header('bytes=-10', 100) == (90, 99)
+        assert parse_range_header('bytes=50-500', 100) == (50, 99)
+        assert parse_range_header('bytes=100-199', 100) == (100, 99)
+        assert parse_range_header('items=0-1', 100) is None
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_installation_link.py
+ 
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (03:40 PM)
+ 
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+ 
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+  
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+  
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import tempfile
+import threading
+from unittest import mock
+
+import pytest
+import requests
+
+from unmanic.libs.installation_link import Links
+
+
+class Response(object):
+
+    def __init__(self, status_code, json_data=None):
+        self.status_code = status_code
+        self.json_data = json_data or {}
+
+    def json(self):
+        return self.json_data
+
+
+class ChunkRequestHandler(object):
+    """
+    Stands in for the RequestHandler of a remote installation that always fails to receive one chunk
+    """
+
+    def __init__(self, failing_offset):
+        self.failing_offset = failing_offset
+        self.lock = threading.Lock()
+        self.put_offsets = []
+        self.posted_urls = []
+
+    def get(self, url, **kwargs):
+        return Response(404)
+
+    def post(self, url, **kwargs):
+        self.posted_urls.append(url)
+        if url.endswith('/complete'):
+            return Response(200, {'success': True})
+        return Response(200, {'session_id': 'abc', 'offset': 0, 'received': []})
+
+    def put(self, url, **kwargs):
+        offset = int(url.rsplit('/', 1)[-1])
+        with self.lock:
+            self.put_offsets.append(offset)
+        if offset == self.failing_offset:
+            raise requests.exceptions.ConnectionError("Connection reset")
+        return Response(200, {'success': True})
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Runs unit tests against the installation link file transfers
+
+    """
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+        :return:
+        """
+        self.tmp_directory = tempfile.mkdtemp(prefix='unmanic_tests_')
+        self.links = Links.__new__(Links)
+        self.links.logger = mock.MagicMock()
+        self.links.transfer_retries = 2
+        self.links.transfer_retry_delay = 0
+
+    def teardown_class(self):
+        Links._upload_sessions.clear()
+
+    @pytest.mark.unittest
+    def test_chunked_upload_is_abandoned_when_a_chunk_runs_out_of_retries(self):
+        path = os.path.join(self.tmp_directory, 'test.mkv')
+        with open(path, 'wb') as f:
+            f.write(os.urandom(5 * 1024 * 1024))
+        remote_config = {
+            'address':                'http://remote:8888',
+            'transfer_chunk_size_mb': 1,
+            'transfer_stream_count':  1,
+        }
+        request_handler = ChunkRequestHandler(failing_offset=2 * 1024 * 1024)
+        with mock.patch('unmanic.libs.installation_link.RequestHandler', return_value=request_handler):
+            result = self.links.remote_api_post_file_chunked(remote_config, path)
+
+        assert result == {}
+        # The failing chunk was sent once and then retried until it ran out of retries
+        assert request_handler.put_offsets == [0, 1024 * 1024] + [2 * 1024 * 1024] * (self.links.transfer_retries + 1)
+        # The chunks after it were never sent and the upload was not completed
+        assert not any(url.endswith('/complete') for url in request_handler.posted_urls)
+        # The session is kept so that the next attempt can resume it
+        assert 'abc' in Links._upload_sessions.values()
+
+    @pytest.mark.unittest
+    def test_link_sync_state_only_returns_sections_that_changed(self):
+        self.links.settings = mock.MagicMock()
+        self.links.settings.get_remote_installations.return_value = []
+        self.links.settings.get_installation_name.return_value = 'Local'
+        self.links.settings.read_version.return_value = '1.0.0'
+        self.links.session = mock.MagicMock(uuid='local-uuid')
+        libraries = [{'name': 'Movies'}]
+        with mock.patch('unmanic.libs.installation_link.Library.get_all_libraries', side_effect=lambda: libraries), \
+                mock.patch('unmanic.libs.installation_link.task.Task') as task_class:
+            task_class.return_value.get_total_task_list_count.return_value = 3
+
+            # Without revisions, every section is returned
+            state = self.links.read_remote_installation_link_sync_state('remote-uuid')
+            assert sorted(state.get('sections')) == ['installation', 'libraries', 'link_config']
+            assert state.get('sections').get('libraries') == ['Movies']
+            assert state.get('task_count') == 3
+
+            # With unchanged revisions, no section data is returned
+            unchanged_state = self.links.read_remote_installation_link_sync_state('remote-uuid', state.get('revisions'))
+            assert unchanged_state.get('sections') == {}
+            assert unchanged_state.get('revisions') == state.get('revisions')
+            assert unchanged_state.get('revision') == state.get('revision')
+
+            # Only the section that changed is returned
+            libraries.append({'name': 'TV'})
+            changed_state = self.links.read_remote_installation_link_sync_state('remote-uuid', state.get('revisions'))
+            assert changed_state.get('sections') == {'libraries': ['Movies', 'TV']}
+            assert changed_state.get('revision') != state.get('revision')
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_librarywalker.py
+ 
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (11:40 AM)
+ 
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+ 
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+  
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+  
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+
+import os
+import tempfile
+import threading
+
+import pytest
+
+from unmanic.libs.librarywalker import LibraryWalker
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Runs unit tests against the threaded library walker
+
+    """
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+        :return:
+        """
+        self.library_path = tempfile.mkdtemp(prefix='unmanic_tests_')
+        os.makedirs(os.path.join(self.library_path, 'Shared'))
+        with open(os.path.join(self.library_path, 'Shared', 'episode 01.mkv'), 'w') as f:
+            f.write('data')
+        # A directory that can be reached through two symlinks, and a symlink back to the library root
+        os.symlink(os.path.join(self.library_path, 'Shared'), os.path.join(self.library_path, 'Link A'))
+        os.symlink(os.path.join(self.library_path, 'Shared'), os.path.join(self.library_path, 'Link B'))
+        os.symlink(self.library_path, os.path.join(self.library_path, 'Shared', 'Loop'))
+
+    def walk(self, **kwargs):
+        found = {}
+        lock = threading.Lock()
+
+        def file_callback(path, file_stat):
+            with lock:
+                found[path] = file_stat
+
+        walker = LibraryWalker(self.library_path, file_callback, threading.Event(), concurrency=4, **kwargs)
+        walker.start()
+        walker.join(10)
+        assert walker.is_finished()
+        return found
+
+    @pytest.mark.unittest
+    def test_symlinked_directories_are_walked_under_each_path_without_looping(self):
+        found = self.walk(stat_files=True)
+        assert sorted(os.path.relpath(path, self.library_path) for path in found) == [
+            os.path.join('Link A', 'episode 01.mkv'),
+            os.path.join('Link B', 'episode 01.mkv'),
+            os.path.join('Shared', 'episode 01.mkv'),
+        ]
+        for file_stat in found.values():
+            assert file_stat.st_size == 4
+
+    @pytest.mark.unittest
+    def test_files_are_reported_without_a_stat_unless_requested(self):
+        found = self.walk(follow_symlinks=False)
+        assert list(found.values()) == [None]
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_pending_tasks.py
+ 
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (04:15 PM)
+ 
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+ 
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+  
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+  
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+
+import pytest
+
+from unmanic.webserver.helpers.pending_tasks import InvalidCursorError, decode_cursor, encode_cursor
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Runs unit tests against the pending task list cursors
+
+    """
+
+    @pytest.mark.unittest
+    def test_cursor_round_trip(self):
+        cursor = encode_cursor({'priority': -5, 'id': 1003}, 'priority')
+        assert cursor == '-5:1003'
+        assert decode_cursor(cursor) == (-5, 1003)
+        assert decode_cursor(None) is None
+        assert decode_cursor('') is None
+
+    @pytest.mark.unittest
+    def test_malformed_cursor_is_rejected(self):
+        for cursor in ['1003', 'abc:1003', '5:', '5:1003:1', 1003]:
+            with pytest.raises(InvalidCursorError):
+                decode_cursor(cursor)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_postprocessor.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (11:20 AM)
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+
+import os
+import tempfile
+import threading
+from unittest import mock
+
+import pytest
+
+from unmanic.libs import unlogger
+from unmanic.libs.postprocessor import PostProcessor
+
+
+class TaskLog(object):
+
+    def __init__(self):
+        self.lines = []
+
+    def save_command_log(self, log):
+        self.lines += log
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Runs unit tests against the post-processor file movements
+
+    """
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+        :return:
+        """
+        self.directory = tempfile.mkdtemp(prefix='unmanic_tests_')
+        data_queues = {
+            'logging': unlogger.UnmanicLogger.__call__(),
+        }
+        # Do not load the config from disk
+        with mock.patch('unmanic.libs.postprocessor.config.Config') as mock_config:
+            mock_config.return_value.get_file_copy_buffer_size_mb.return_value = 1
+            mock_config.return_value.get_file_checksum_algorithm.return_value = 'md5'
+            self.postprocessor = PostProcessor(data_queues, None, threading.Event())
+
+    def copy_file(self, file_in, file_out, move=False):
+        self.postprocessor.current_task = TaskLog()
+        destination_files = []
+        success = self.postprocessor._PostProcessor__copy_file(file_in, file_out, destination_files, 'test_plugin',
+                                                               move=move)
+        return success, destination_files
+
+    @pytest.mark.unittest
+    def test_copy_and_move_write_the_destination_and_record_the_summary(self):
+        data = os.urandom(3 * 1024 * 1024 + 7)
+        file_in = os.path.join(self.directory, 'in.mkv')
+        with open(file_in, 'wb') as f:
+            f.write(data)
+
+        file_out = os.path.join(self.directory, 'copy.mkv')
+        success, destination_files = self.copy_file(file_in, file_out)
+        assert success
+        assert destination_files == [file_out]
+        assert not os.path.exists("{}.unmanic.part".format(file_out))
+        with open(file_out, 'rb') as f:
+            assert f.read() == data
+        assert os.path.exists(file_in)
+        assert 'POST-PROCESSOR FILE COPY' in self.postprocessor.current_task.lines[0]
+        assert self.postprocessor.current_task_checksum.startswith('md5:')
+
+        file_out = os.path.join(self.directory, 'move.mkv')
+        success, destination_files = self.copy_file(file_in, file_out, move=True)
+        assert success
+        assert not os.path.exists(file_in)
+        with open(file_out, 'rb') as f:
+            assert f.read() == data
+        assert 'method: rename' in self.postprocessor.current_task.lines[0]
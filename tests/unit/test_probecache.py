@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_probecache.py
+ 
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (10:41 AM)
+ 
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+ 
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+  
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+  
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.probecache import ProbeCache
+from tests.support_.test_data import ffprobe_mkv
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Runs unit tests against the ffprobe result cache
+
+    """
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+        :return:
+        """
+        self.tmp_directory = tempfile.mkdtemp(prefix='unmanic_tests_')
+        self.probe_cache = ProbeCache()
+        self.probe_cache.cache_directory = os.path.join(self.tmp_directory, 'probe_cache')
+
+    @pytest.mark.unittest
+    def test_cached_probe_is_invalidated_when_file_changes(self):
+        path = os.path.join(self.tmp_directory, 'test.mkv')
+        with open(path, 'wb') as f:
+            f.write(b'\0' * 1024)
+        probe = dict(ffprobe_mkv.mkv_stereo_aac_audio_ffprobe)
+        probe['format'] = dict(probe['format'], filename=path)
+
+        self.probe_cache.store_shared_info(path, {'ffprobe': probe})
+        assert self.probe_cache.get(path) == probe
+
+        # The disk tier survives the memory tier being cleared
+        self.probe_cache.memory.clear()
+        shared_info = {}
+        self.probe_cache.populate_shared_info(path, shared_info)
+        assert shared_info.get('ffprobe') == probe
+
+        # Modifying the file invalidates both tiers
+        with open(path, 'ab') as f:
+            f.write(b'\0')
+        assert self.probe_cache.get(path) is None
+        self.probe_cache.memory.clear()
+        assert self.probe_cache.get(path) is None
+
+    @pytest.mark.unittest
+    def test_probes_of_other_files_are_not_stored(self):
+        path = os.path.join(self.tmp_directory, 'other.mkv')
+        with open(path, 'wb') as f:
+            f.write(b'\0' * 1024)
+        probe = dict(ffprobe_mkv.mkv_stereo_aac_audio_ffprobe)
+        probe['format'] = dict(probe['format'], filename='/library/different.mkv')
+        self.probe_cache.store_shared_info(path, {'ffprobe': probe})
+        assert self.probe_cache.get(path) is None
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_searchindex.py
+ 
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (11:04 AM)
+ 
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+ 
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+  
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+  
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+
+import pytest
+from peewee import SqliteDatabase
+
+from unmanic.libs import searchindex
+from unmanic.libs.unmodels.tasks import Tasks
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Runs unit tests against the full text search indexes
+
+    """
+
+    @pytest.mark.unittest
+    def test_search_index_matches_substrings_and_follows_table_changes(self):
+        database = SqliteDatabase(':memory:')
+        with database.bind_ctx([Tasks]):
+            database.create_tables([Tasks])
+            Tasks.create(abspath='/library/Existing Show/episode.mkv', status='pending')
+            searchindex.create_search_indexes(database)
+            searchindex._available_indexes.pop('tasks', None)
+            if not searchindex.search_index_available(Tasks):
+                pytest.skip("SQLite build does not support FTS5 trigram indexes")
+
+            Tasks.insert_many([
+                {'abspath': '/library/Show {}/Episode "{}".mkv'.format(i % 3, i), 'status': 'pending'} for i in range(30)
+            ]).execute()
+            Tasks.delete().where(Tasks.abspath.contains('Show 2/')).execute()
+            Tasks.update(abspath='/library/Renamed.mkv').where(Tasks.abspath == '/library/Show 0/Episode "0".mkv').execute()
+
+            for search_value in ['existing', 'show 1/', 'show 2/', 'e "1', 'renamed', 'Sh']:
+                indexed = Tasks.select().where(searchindex.search_condition(Tasks, search_value))
+                expected = Tasks.select().where(Tasks.abspath.contains(search_value))
+                assert sorted(t.id for t in indexed) == sorted(t.id for t in expected)
+        searchindex._available_indexes.pop('tasks', None)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_unmanicignore.py
+ 
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (12:10 PM)
+ 
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+ 
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+  
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+  
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.unmanicignore import UnmanicIgnoreCache, UnmanicIgnoreRules
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Runs unit tests against the unmanicignore cache
+
+    """
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+        :return:
+        """
+        self.library_path = tempfile.mkdtemp(prefix='unmanic_tests_')
+        UnmanicIgnoreCache().clear()
+
+    def write_ignore_file(self, lines):
+        ignore_file = os.path.join(self.library_path, '.unmanicignore')
+        with open(ignore_file, 'w') as f:
+            f.write("\n".join(lines))
+        # Ensure the mtime changes between writes on filesystems with coarse timestamps
+        stat = os.stat(ignore_file)
+        os.utime(ignore_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    @pytest.mark.unittest
+    def test_rules_match_exact_names_and_globs(self):
+        rules = UnmanicIgnoreRules(["# comment", "", "episode 01.mkv", "*.nfo", "Extras/"])
+        assert rules.matches("episode 01.mkv")
+        assert not rules.matches("episode 01.mk")
+        assert rules.matches("movie.nfo")
+        assert rules.matches("Extras", is_dir=True)
+        assert not rules.matches("Extras", is_dir=False)
+        assert not rules.matches("# comment")
+
+    @pytest.mark.unittest
+    def test_cache_reloads_when_ignore_file_changes(self):
+        cache = UnmanicIgnoreCache()
+        file_path = os.path.join(self.library_path, 'episode 01.mkv')
+        self.write_ignore_file(["episode 01.mkv"])
+        assert cache.file_is_ignored(file_path)
+        self.write_ignore_file(["episode 02.mkv"])
+        assert not cache.file_is_ignored(file_path)
+        os.remove(os.path.join(self.library_path, '.unmanicignore'))
+        assert not cache.file_is_ignored(file_path)
+        assert cache.get_rules(self.library_path) is None
+
+    @pytest.mark.unittest
+    def test_files_within_ignored_directories_are_ignored(self):
+        cache = UnmanicIgnoreCache()
+        file_path = os.path.join(self.library_path, 'Extras', 'Season 1', 'episode 01.mkv')
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        self.write_ignore_file(["Extras/"])
+        assert cache.parent_directory_is_ignored(file_path, self.library_path)
+        self.write_ignore_file(["Other/"])
+        assert not cache.parent_directory_is_ignored(file_path, self.library_path)
+        # Directories above the library path are not checked
+        assert not cache.parent_directory_is_ignored(file_path, os.path.join(self.library_path, 'Extras'))
+        os.remove(os.path.join(self.library_path, '.unmanicignore'))
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_workerlog.py
+ 
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (12:10 PM)
+ 
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+ 
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+  
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+  
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.workerlog import WorkerLog
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Runs unit tests against the bounded worker log
+
+    """
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+        :return:
+        """
+        self.spill_directory = tempfile.mkdtemp(prefix='unmanic_tests_')
+
+    @pytest.mark.unittest
+    def test_log_keeps_tail_in_memory_and_full_log_on_disk(self):
+        worker_log = WorkerLog(max_lines=10, spill_directory=self.spill_directory)
+        worker_log += ['COMMAND:\n', 'ffmpeg\n']
+        for i in range(1000):
+            worker_log.append("frame={}\n".format(i))
+        assert len(worker_log) == 1002
+        assert len(worker_log.lines) == 10
+        assert worker_log.tail(2) == ['frame=998\n', 'frame=999\n']
+        assert worker_log[-1:] == ['frame=999\n']
+        full_log = worker_log.read()
+        assert full_log.startswith('COMMAND:\nffmpeg\nframe=0\n')
+        assert len(full_log.splitlines()) == 1002
+        spill_path = worker_log.spill_path
+        worker_log.close()
+        assert not os.path.exists(spill_path)
+        assert len(worker_log) == 0
+        assert worker_log.read() == ''
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_workerstatus.py
+ 
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (11:48 AM)
+ 
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+ 
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+  
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+  
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+
+import pytest
+
+from unmanic.libs.workerstatus import diff_all_worker_status
+
+
+def worker_status(worker_id, sequence, log_count, percent='0', runners_info=None, current_task=10):
+    log_lines = ['line {}\n'.format(i) for i in range(log_count)]
+    return {
+        'id':               worker_id,
+        'sequence':         sequence,
+        'idle':             False,
+        'current_task':     current_task,
+        'worker_log_count': log_count,
+        'worker_log_tail':  log_lines[-19:],
+        'runners_info':     runners_info or {},
+        'subprocess':       {'pid': 1, 'percent': percent, 'elapsed': '0'},
+    }
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Runs unit tests against the worker status diffs
+
+    """
+
+    @pytest.mark.unittest
+    def test_only_changed_fields_and_new_log_lines_are_returned(self):
+        previous = [worker_status('1', 1, 5), worker_status('2', 1, 0)]
+        current = [worker_status('1', 2, 7, percent='10'), worker_status('2', 1, 0)]
+        changes = diff_all_worker_status(previous, current)
+        assert changes == {
+            'workers': {
+                '1': {
+                    'sequence':          2,
+                    'subprocess':        {'percent': '10'},
+                    'worker_log_append': ['line 5\n', 'line 6\n'],
+                    'worker_log_count':  7,
+                },
+            },
+            'removed': [],
+        }
+        assert diff_all_worker_status(current, current) is None
+
+    @pytest.mark.unittest
+    def test_log_tail_is_resent_when_too_many_lines_were_added_or_the_log_was_reset(self):
+        previous = [worker_status('1', 1, 5, runners_info={'a': {'status': 'complete'}})]
+        changes = diff_all_worker_status(previous, [worker_status('1', 2, 50)])
+        assert changes['workers']['1']['worker_log_tail'] == ['line {}\n'.format(i) for i in range(31, 50)]
+        assert changes['workers']['1']['runners_info'] == {'a': None}
+        changes = diff_all_worker_status(previous, [worker_status('1', 2, 2)])
+        assert changes['workers']['1']['worker_log_tail'] == ['line 0\n', 'line 1\n']
+
+    @pytest.mark.unittest
+    def test_log_tail_is_resent_when_the_worker_started_another_task(self):
+        previous = [worker_status('1', 1, 3, current_task=10)]
+        changes = diff_all_worker_status(previous, [worker_status('1', 2, 5, current_task=11)])
+        assert changes['workers']['1']['current_task'] == 11
+        assert changes['workers']['1']['worker_log_tail'] == ['line {}\n'.format(i) for i in range(5)]
+        assert 'worker_log_append' not in changes['workers']['1']
+
+    @pytest.mark.unittest
+    def test_added_and_removed_workers(self):
+        previous = [worker_status('1', 1, 0)]
+        current = [worker_status('2', 1, 0)]
+        changes = diff_all_worker_status(previous, current)
+        assert changes['workers'] == {'2': current[0]}
+        assert changes['removed'] == ['1']
@@ -75,6 +75,8 @@ class Config(object, metaclass=SingletonType):
         self.schedule_full_scan_minutes = 1440
         self.follow_symlinks = True
         self.concurrent_file_testers = 2
+        self.concurrent_directory_scanners = 4
+        self.enable_file_test_process_pool = False
         self.run_full_scan_on_start = False
         self.clear_pending_tasks_on_restart = True
         self.auto_manage_completed_tasks = False
@@ -83,6 +85,9 @@ class Config(object, metaclass=SingletonType):
 
         # Worker settings
         self.cache_path = common.get_default_cache_path()
+        self.worker_progress_parser_rate = 4
+        self.file_copy_buffer_size_mb = 16
+        self.file_checksum_algorithm = ''
 
         # Link settings
         self.installation_name = ''
@@ -327,6 +332,30 @@ class Config(object, metaclass=SingletonType):
             cache_path = common.get_default_cache_path()
         self.cache_path = cache_path
 
+    def get_worker_progress_parser_rate(self):
+        """
+        Get setting - worker_progress_parser_rate
+
+        :return:
+        """
+        return self.worker_progress_parser_rate
+
+    def get_file_copy_buffer_size_mb(self):
+        """
+        Get setting - file_copy_buffer_size_mb
+
+        :return:
+        """
+        return self.file_copy_buffer_size_mb
+
+    def get_file_checksum_algorithm(self):
+        """
+        Get setting - file_checksum_algorithm
+
+        :return:
+        """
+        return self.file_checksum_algorithm
+
     def get_config_path(self):
         """
         Get setting - config_path
@@ -478,6 +507,22 @@ class Config(object, metaclass=SingletonType):
         """
         return self.concurrent_file_testers
 
+    def get_concurrent_directory_scanners(self):
+        """
+        Get setting - concurrent_directory_scanners
+
+        :return:
+        """
+        return self.concurrent_directory_scanners
+
+    def get_enable_file_test_process_pool(self):
+        """
+        Get setting - enable_file_test_process_pool
+
+        :return:
+        """
+        return self.enable_file_test_process_pool
+
     def get_plugins_path(self):
         """
         Get setting - config_path
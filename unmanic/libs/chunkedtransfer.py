@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.chunkedtransfer.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (10:40 AM)
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+
+from unmanic import config
+from unmanic.libs import common, unlogger
+from unmanic.libs.singleton import SingletonType
+
+# Size of each chunk sent or requested by the client
+CHUNK_SIZE = 8 * 1024 * 1024
+# Largest chunk the server will accept or serve in a single request
+MAX_CHUNK_SIZE = 64 * 1024 * 1024
+# Header carrying the SHA-256 hex digest of a chunk body
+CHUNK_HASH_HEADER = 'X-Unmanic-Chunk-Sha256'
+
+
+class ChunkedTransferError(Exception):
+    """
+    Raised when a chunk is rejected by an upload session
+    """
+
+    def __init__(self, message, offset=None):
+        super(ChunkedTransferError, self).__init__(message)
+        self.offset = offset
+
+
+def chunk_hash(data):
+    """
+    Return the SHA-256 hex digest of a chunk
+
+    :param data:
+    :return:
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def merge_ranges(ranges):
+    """
+    Merge a list of [start, end) byte ranges into a sorted list of non-overlapping ranges
+
+    :param ranges:
+    :return:
+    """
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def split_ranges(size, chunk_size, received=None):
+    """
+    Split a file of the given size into [start, end) chunks of chunk_size bytes,
+    skipping any chunk that is already covered by the received ranges
+
+    :param size:
+    :param chunk_size:
+    :param received:
+    :return:
+    """
+    received = merge_ranges(received or [])
+    chunks = []
+    for start in range(0, size, chunk_size):
+        end = min(start + chunk_size, size)
+        if any(r_start <= start and end <= r_end for r_start, r_end in received):
+            continue
+        chunks.append((start, end))
+    return chunks
+
+
+def parse_range_header(range_header, file_size):
+    """
+    Parse a single 'bytes=start-end' Range header against a file size.
+    Returns a (start, end) tuple of inclusive byte positions or None if the
+    header is missing or can not be parsed. Returns (file_size, file_size - 1)
+    when the range starts at or after the end of the file.
+
+    :param range_header:
+    :param file_size:
+    :return:
+    """
+    if not range_header:
+        return None
+    match = re.match(r'^bytes=(\d*)-(\d*)$', range_header.strip())
+    if not match or (not match.group(1) and not match.group(2)):
+        return None
+    if not match.group(1):
+        # Suffix range. Return the last X bytes of the file
+        start = max(file_size - int(match.group(2)), 0)
+        end = file_size - 1
+    else:
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else file_size - 1
+    if start >= file_size:
+        return file_size, file_size - 1
+    end = min(end, file_size - 1, start + MAX_CHUNK_SIZE - 1)
+    if end < start:
+        return None
+    return start, end
+
+
+class UploadSessions(object, metaclass=SingletonType):
+    """
+    UploadSessions
+
+    Resumable upload sessions for files sent by remote installations.
+
+    Each session is a directory in the cache path holding a 'session.json'
+    description of the file, a 'data' file that chunks are written into and
+    a 'received.json' list of the byte ranges that have been written.
+    Chunks may arrive in any order and over several connections at once.
+    The offset of a session is the end of the range received from the
+    start of the file, so an interrupted upload can be resumed from the
+    last chunk that was written, even after a restart.
+
+    """
+
+    session_expiry_seconds = 86400
+
+    def __init__(self):
+        self.logger = None
+        self.lock = threading.Lock()
+        self.session_locks = {}
+        self.sessions_directory = None
+
+    def _log(self, message, message2='', level="info"):
+        if not self.logger:
+            unmanic_logging = unlogger.UnmanicLogger.__call__()
+            self.logger = unmanic_logging.get_logger(__class__.__name__)
+        message = common.format_message(message, message2)
+        getattr(self.logger, level)(message)
+
+    def get_sessions_directory(self):
+        if not self.sessions_directory:
+            settings = config.Config()
+            self.sessions_directory = os.path.join(settings.get_cache_path(), 'remote_library', 'upload_sessions')
+        return self.sessions_directory
+
+    def __get_session_directory(self, session_id):
+        if not re.match(r'^[0-9a-f]{32}$', str(session_id)):
+            raise ChunkedTransferError("Invalid upload session ID '{}'".format(session_id))
+        return os.path.join(self.get_sessions_directory(), session_id)
+
+    def __get_session_lock(self, session_id):
+        with self.lock:
+            if session_id not in self.session_locks:
+                self.session_locks[session_id] = threading.Lock()
+            return self.session_locks[session_id]
+
+    def __read_session(self, session_id):
+        session_directory = self.__get_session_directory(session_id)
+        try:
+            with open(os.path.join(session_directory, 'session.json')) as f:
+                session_data = json.load(f)
+        except (OSError, ValueError):
+            raise ChunkedTransferError("Upload session '{}' does not exist".format(session_id))
+        try:
+            with open(os.path.join(session_directory, 'received.json')) as f:
+                received = json.load(f)
+        except (OSError, ValueError):
+            received = []
+        session_data['received'] = received
+        session_data['offset'] = received[0][1] if received and received[0][0] == 0 else 0
+        return session_data
+
+    def __write_received(self, session_id, received):
+        session_directory = self.__get_session_directory(session_id)
+        tmp_path = os.path.join(session_directory, 'received.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(received, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, os.path.join(session_directory, 'received.json'))
+
+    def remove_expired_sessions(self):
+        """
+        Remove sessions that have not received a chunk within the expiry time
+
+        :return:
+        """
+        sessions_directory = self.get_sessions_directory()
+        if not os.path.exists(sessions_directory):
+            return
+        expiry_time = time.time() - self.session_expiry_seconds
+        for session_id in os.listdir(sessions_directory):
+            session_directory = os.path.join(sessions_directory, session_id)
+            data_path = os.path.join(session_directory, 'data')
+            last_modified = os.path.getmtime(data_path if os.path.exists(data_path) else session_directory)
+            if last_modified < expiry_time:
+                self._log("Removing expired upload session '{}'".format(session_id), level='debug')
+                self.remove_session(session_id)
+
+    def create_session(self, filename, size):
+        """
+        Create a new upload session for a file of the given size
+
+        :param filename:
+        :param size:
+        :return:
+        """
+        filename = os.path.basename(filename)
+        if not filename or filename in ['.', '..']:
+            raise ChunkedTransferError("Invalid upload file name '{}'".format(filename))
+        self.remove_expired_sessions()
+        session_id = uuid.uuid4().hex
+        session_directory = self.__get_session_directory(session_id)
+        os.makedirs(session_directory)
+        session_data = {
+            'session_id': session_id,
+            'filename':   filename,
+            'size':       int(size),
+            'chunk_size': CHUNK_SIZE,
+        }
+        with open(os.path.join(session_directory, 'session.json'), 'w') as f:
+            json.dump(session_data, f)
+        open(os.path.join(session_directory, 'data'), 'wb').close()
+        return self.__read_session(session_id)
+
+    def get_session(self, session_id):
+        """
+        Return the details of an upload session, including the current offset
+
+        :param session_id:
+        :return:
+        """
+        return self.__read_session(session_id)
+
+    def write_chunk(self, session_id, offset, data, expected_hash=None):
+        """
+        Write a chunk into an upload session at the given offset.
+        The chunk must fit within the size of the file and match the expected
+        hash if one is given. Returns the updated session.
+
+        :param session_id:
+        :param offset:
+        :param data:
+        :param expected_hash:
+        :return:
+        """
+        offset = int(offset)
+        session_data = self.__read_session(session_id)
+        if len(data) > MAX_CHUNK_SIZE:
+            raise ChunkedTransferError("Chunk exceeds the maximum size of {} bytes".format(MAX_CHUNK_SIZE),
+                                       offset=session_data.get('offset'))
+        if offset < 0 or (offset + len(data)) > session_data.get('size'):
+            raise ChunkedTransferError("Chunk exceeds the size of the uploaded file", offset=session_data.get('offset'))
+        if expected_hash and chunk_hash(data) != expected_hash.lower():
+            raise ChunkedTransferError("Chunk at offset {} failed hash verification".format(offset),
+                                       offset=session_data.get('offset'))
+        # Chunks do not overlap, so several can be written to the file at once
+        data_path = os.path.join(self.__get_session_directory(session_id), 'data')
+        fd = os.open(data_path, os.O_WRONLY)
+        try:
+            os.pwrite(fd, data, offset)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        # Only record the range once the data is on disk
+        with self.__get_session_lock(session_id):
+            session_data = self.__read_session(session_id)
+            received = merge_ranges(session_data.get('received') + [[offset, offset + len(data)]])
+            self.__write_received(session_id, received)
+        return self.__read_session(session_id)
+
+    def complete_session(self, session_id, destination_directory):
+        """
+        Move the uploaded file of a completed session into the destination
+        directory and remove the session. Returns the path of the file.
+
+        :param session_id:
+        :param destination_directory:
+        :return:
+        """
+        with self.__get_session_lock(session_id):
+            session_data = self.__read_session(session_id)
+            if session_data.get('offset') != session_data.get('size'):
+                raise ChunkedTransferError(
+                    "Upload session is incomplete. Received {} of {} bytes".format(
+                        sum(end - start for start, end in session_data.get('received')), session_data.get('size')),
+                    offset=session_data.get('offset'))
+            if not os.path.exists(destination_directory):
+                os.makedirs(destination_directory)
+            destination = os.path.join(destination_directory, session_data.get('filename'))
+            shutil.move(os.path.join(self.__get_session_directory(session_id), 'data'), destination)
+        self.remove_session(session_id)
+        return destination
+
+    def remove_session(self, session_id):
+        """
+        Remove an upload session and any data received
+
+        :param session_id:
+        :return:
+        """
+        shutil.rmtree(self.__get_session_directory(session_id), ignore_errors=True)
+        with self.lock:
+            self.session_locks.pop(session_id, None)
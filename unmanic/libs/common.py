@@ -37,6 +37,11 @@ import random
 import string
 import shutil
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 
 def get_home_dir():
     # Attempt to get the HOME_DIR environment variable
@@ -194,6 +199,12 @@ def clean_files_in_cache_dir(cache_directory):
                     shutil.rmtree(root)
                 except Exception as e:
                     print("Exception while clearing remote library cache path - {}".format(str(e)))
+            elif root_bn == "worker_logs":
+                try:
+                    print("Clearing worker log cache path - {}".format(root))
+                    shutil.rmtree(root)
+                except Exception as e:
+                    print("Exception while clearing worker log cache path - {}".format(str(e)))
 
 
 def random_string(string_length=5):
@@ -273,7 +284,27 @@ def extract_video_codecs_from_file_properties(file_properties: dict):
     return codecs
 
 
-def get_file_checksum(path):
+def get_file_hasher(algorithm='md5'):
+    """
+    Return a new hash object for the given checksum algorithm.
+    Supports 'md5', 'blake2' and 'xxhash' (requires the optional 'xxhash' module).
+    Raises a ValueError if the algorithm can not be used.
+
+    :param algorithm:
+    :return:
+    """
+    if algorithm == 'md5':
+        return hashlib.md5()
+    elif algorithm in ['blake2', 'blake2b']:
+        return hashlib.blake2b()
+    elif algorithm == 'xxhash':
+        if xxhash is None:
+            raise ValueError("Unable to create an xxhash checksum. The 'xxhash' module is not installed")
+        return xxhash.xxh64()
+    raise ValueError("Unsupported checksum algorithm '{}'".format(algorithm))
+
+
+def get_file_checksum(path, algorithm='md5'):
     """
     Read a checksum of a file.
 
@@ -281,10 +312,11 @@ def get_file_checksum(path):
     This is slightly slower, but allows working on systems with limited memory.
 
     :param path:
+    :param algorithm:
     :return:
     """
-    file_hash = hashlib.md5()
+    file_hash = get_file_hasher(algorithm)
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b''):
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
             file_hash.update(chunk)
     return copy.copy(file_hash.hexdigest())
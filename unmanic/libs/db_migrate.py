@@ -37,7 +37,7 @@ import sys
 from peewee import Model, SqliteDatabase, Field
 from peewee_migrate import Migrator, Router
 
-from unmanic.libs import unlogger
+from unmanic.libs import searchindex, unlogger
 from unmanic.libs.unmodels.lib import BaseModel
 
 
@@ -140,3 +140,7 @@ class Migrations(object):
                                 self.database.rollback()
                                 self.__log("Update failed", level='exception')
                                 raise
+
+        # Ensure the full text search indexes exist
+        self.__log("Updating search indexes")
+        searchindex.create_search_indexes(self.database, logger=self.logger)
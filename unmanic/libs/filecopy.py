@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.filecopy.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (1:40 PM)
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import errno
+import os
+import time
+
+from unmanic.libs import common
+
+# Linux ioctl request used to clone (reflink) a file on filesystems that support it (btrfs, XFS)
+FICLONE = 0x40049409
+
+# Errors raised by the zero-copy methods when they are not supported for the given files.
+# These are safe to fall back from as long as no data has been written yet.
+UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EBADF,
+    errno.EPERM,
+    getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP),
+}
+
+
+class ZeroCopyUnsupported(Exception):
+    pass
+
+
+def _check_copied_size(copied, size):
+    # Never leave a truncated destination without raising an error
+    if copied != size:
+        raise OSError(errno.EIO, "Copied {} of {} bytes before the source reached EOF".format(copied, size))
+
+
+def _reflink(fd_in, fd_out, size):
+    try:
+        import fcntl
+    except ImportError:
+        raise ZeroCopyUnsupported('fcntl is not available')
+    try:
+        fcntl.ioctl(fd_out, FICLONE, fd_in)
+    except OSError as e:
+        if e.errno in UNSUPPORTED_ERRNOS:
+            raise ZeroCopyUnsupported(str(e))
+        raise
+    return size
+
+
+def _copy_file_range(fd_in, fd_out, size):
+    if not hasattr(os, 'copy_file_range'):
+        raise ZeroCopyUnsupported('copy_file_range is not available')
+    copied = 0
+    while copied < size:
+        try:
+            count = os.copy_file_range(fd_in, fd_out, size - copied)
+        except OSError as e:
+            if copied == 0 and e.errno in UNSUPPORTED_ERRNOS:
+                raise ZeroCopyUnsupported(str(e))
+            raise
+        if count == 0:
+            if copied == 0:
+                raise ZeroCopyUnsupported('no data was copied')
+            break
+        copied += count
+    _check_copied_size(copied, size)
+    return copied
+
+
+def _sendfile(fd_in, fd_out, size):
+    if not hasattr(os, 'sendfile'):
+        raise ZeroCopyUnsupported('sendfile is not available')
+    copied = 0
+    while copied < size:
+        try:
+            count = os.sendfile(fd_out, fd_in, copied, size - copied)
+        except OSError as e:
+            if copied == 0 and e.errno in UNSUPPORTED_ERRNOS:
+                raise ZeroCopyUnsupported(str(e))
+            raise
+        if count == 0:
+            if copied == 0:
+                raise ZeroCopyUnsupported('no data was copied')
+            break
+        copied += count
+    _check_copied_size(copied, size)
+    return copied
+
+
+def _buffered_copy(fd_in, fd_out, size, buffer_size, file_hash=None):
+    copied = 0
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with open(fd_in, 'rb', buffering=0, closefd=False) as f_in, open(fd_out, 'wb', buffering=0, closefd=False) as f_out:
+        while True:
+            count = f_in.readinto(buffer)
+            if not count:
+                break
+            f_out.write(view[:count])
+            if file_hash is not None:
+                file_hash.update(view[:count])
+            copied += count
+    return copied
+
+
+def copy_file_data(file_in, file_out, buffer_size=16 * 1024 * 1024, zero_copy=True, checksum_algorithm=None):
+    """
+    Copy the contents of one file to another using the fastest method available.
+    Tries, in order, a reflink clone, copy_file_range, sendfile and finally a buffered copy.
+    A method is only skipped if it fails before any data is written, so the data is copied exactly once.
+
+    If a checksum algorithm is given, the data is hashed as it streams through a buffered copy.
+    If the algorithm can not be used, the data is copied without a checksum.
+
+    Returns a dict with the 'method' used, the number of 'bytes' copied, the 'duration' in seconds
+    and the 'checksum' of the data (if requested).
+
+    :param file_in:
+    :param file_out:
+    :param buffer_size:
+    :param zero_copy:
+    :param checksum_algorithm:
+    :return:
+    """
+    start_time = time.monotonic()
+    file_hash = None
+    if checksum_algorithm:
+        try:
+            file_hash = common.get_file_hasher(checksum_algorithm)
+            # Zero-copy methods never pass the data through userspace, so the data cannot be hashed inline
+            zero_copy = False
+        except ValueError:
+            file_hash = None
+    methods = []
+    if zero_copy:
+        methods = [
+            ('reflink', _reflink),
+            ('copy_file_range', _copy_file_range),
+            ('sendfile', _sendfile),
+        ]
+    with open(file_in, 'rb') as f_in, open(file_out, 'wb') as f_out:
+        fd_in = f_in.fileno()
+        fd_out = f_out.fileno()
+        size = os.fstat(fd_in).st_size
+        for method, copy_function in methods:
+            try:
+                copied = copy_function(fd_in, fd_out, size)
+            except ZeroCopyUnsupported:
+                continue
+            return {
+                'method':   method,
+                'bytes':    copied,
+                'duration': time.monotonic() - start_time,
+                'checksum': None,
+            }
+        copied = _buffered_copy(fd_in, fd_out, size, buffer_size, file_hash=file_hash)
+        return {
+            'method':   'buffered',
+            'bytes':    copied,
+            'duration': time.monotonic() - start_time,
+            'checksum': file_hash.hexdigest() if file_hash is not None else None,
+        }
+
+
+def move_file_data(file_in, file_out, buffer_size=16 * 1024 * 1024, zero_copy=True, checksum_algorithm=None):
+    """
+    Move a file. A rename is attempted first. If the rename fails (for example, if the
+    source and destination are on different filesystems), the data is copied once and the source removed.
+
+    A rename does not read the data, so if a checksum is requested after a rename
+    it is read from the moved file in a single pass. A failure to read the checksum
+    does not fail the move, the checksum is returned as None instead.
+
+    Returns the same dict as copy_file_data().
+
+    :param file_in:
+    :param file_out:
+    :param buffer_size:
+    :param zero_copy:
+    :param checksum_algorithm:
+    :return:
+    """
+    start_time = time.monotonic()
+    size = os.path.getsize(file_in)
+    try:
+        os.rename(file_in, file_out)
+    except OSError:
+        # As with shutil.move(), fall back to a copy on any rename error, not only across filesystems.
+        # Network and FUSE mounts may also refuse a rename with errors such as EPERM, EACCES or EBUSY
+        result = copy_file_data(file_in, file_out, buffer_size=buffer_size, zero_copy=zero_copy,
+                                checksum_algorithm=checksum_algorithm)
+        os.remove(file_in)
+        return result
+    checksum = None
+    if checksum_algorithm:
+        try:
+            checksum = common.get_file_checksum(file_out, algorithm=checksum_algorithm)
+        except (ValueError, OSError):
+            # The file has already been moved. Do not fail the move over its checksum
+            checksum = None
+    return {
+        'method':   'rename',
+        'bytes':    size,
+        'duration': time.monotonic() - start_time,
+        'checksum': checksum,
+    }
+
+
+def format_copy_result(result):
+    """
+    Return a human readable summary of a copy result including the throughput
+
+    :param result:
+    :return:
+    """
+    size_mb = result.get('bytes', 0) / (1024 * 1024)
+    duration = result.get('duration', 0)
+    if result.get('method') == 'rename' or duration <= 0:
+        throughput = 'n/a'
+    else:
+        throughput = '{:.2f} MB/s'.format(size_mb / duration)
+    summary = "method: {}, size: {:.2f} MB, duration: {:.2f}s, throughput: {}".format(
+        result.get('method'), size_mb, duration, throughput)
+    if result.get('checksum'):
+        summary += ", checksum: {}".format(result.get('checksum'))
+    return summary
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.filestateindex.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (10:20 AM)
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import hashlib
+import json
+import os
+import threading
+
+from unmanic.libs import common, unlogger
+from unmanic.libs.plugins import PluginsHandler
+from unmanic.libs.unmodels import LibraryFileIndex
+from unmanic.libs.unplugins import PluginExecutor
+
+
+class FileStateIndex(object):
+    """
+    FileStateIndex
+
+    Persistent per-library record of the size, mtime and inode of every
+    file tested during a library scan along with the verdict returned by
+    the 'library_management.file_test' plugin flow.
+
+    Entries are tied to a hash of the library's file test plugin flow
+    (plugins, versions and settings). Changing any of these invalidates
+    the whole index for that library.
+
+    """
+
+    flush_batch_size = 500
+
+    def __init__(self, library_id: int):
+        unmanic_logging = unlogger.UnmanicLogger.__call__()
+        self.logger = unmanic_logging.get_logger(__class__.__name__)
+
+        self.library_id = library_id
+        self.flow_hash = ''
+        self.entries = {}
+        self.unseen_paths = set()
+        self.pending_writes = {}
+        self.skipped_count = 0
+        self.lock = threading.Lock()
+
+    def _log(self, message, message2='', level="info"):
+        message = common.format_message(message, message2)
+        getattr(self.logger, level)(message)
+
+    @staticmethod
+    def generate_flow_hash(library_id: int):
+        """
+        Generate a hash of the file test plugin flow configured for a library.
+        This includes the order of the plugins, their versions and their settings.
+
+        :param library_id:
+        :return:
+        """
+        plugin_handler = PluginsHandler()
+        plugin_executor = PluginExecutor()
+        flow = []
+        plugin_modules = plugin_handler.get_enabled_plugin_modules_by_type('library_management.file_test',
+                                                                           library_id=library_id)
+        for plugin_module in plugin_modules:
+            plugin_settings, plugin_settings_meta = plugin_executor.get_plugin_settings(plugin_module.get('plugin_id'),
+                                                                                        library_id=library_id)
+            flow.append({
+                'plugin_id': plugin_module.get('plugin_id'),
+                'version':   plugin_module.get('version'),
+                'settings':  plugin_settings,
+            })
+        flow_string = json.dumps(flow, sort_keys=True, default=str)
+        return hashlib.md5(flow_string.encode('utf8')).hexdigest()
+
+    @staticmethod
+    def stat_file(path, file_stat=None):
+        """
+        Return the (size, mtime, inode) tuple used to detect changes to a file.
+        If the file's os.stat_result is already known, it may be given to avoid reading it again.
+        Returns None if the file could not be read.
+
+        :param path:
+        :param file_stat:
+        :return:
+        """
+        if file_stat is None:
+            try:
+                file_stat = os.stat(path)
+            except OSError:
+                return None
+        return file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino
+
+    def load(self):
+        """
+        Load the index for this library.
+        Entries built against a different plugin flow are removed.
+
+        :return:
+        """
+        self.flow_hash = self.generate_flow_hash(self.library_id)
+
+        # Drop any entries that were recorded with a different plugin flow
+        delete_query = LibraryFileIndex.delete().where(
+            (LibraryFileIndex.library_id == self.library_id) & (LibraryFileIndex.flow_hash != self.flow_hash))
+        removed = delete_query.execute()
+        if removed:
+            self._log("Plugin flow changed for library ID {}. Invalidated {} file index entries".format(
+                self.library_id, removed))
+
+        query = LibraryFileIndex.select(
+            LibraryFileIndex.abspath,
+            LibraryFileIndex.size,
+            LibraryFileIndex.mtime,
+            LibraryFileIndex.inode,
+            LibraryFileIndex.add_file_to_pending_tasks,
+        ).where(LibraryFileIndex.library_id == self.library_id)
+        with self.lock:
+            self.entries = {}
+            for abspath, size, mtime, inode, verdict in query.tuples():
+                self.entries[abspath] = ((size, mtime, inode), verdict)
+            self.unseen_paths = set(self.entries)
+            self.skipped_count = 0
+
+    def file_can_be_skipped(self, path, file_stat):
+        """
+        Check if a file is unchanged since it was last tested and was not
+        added to the pending tasks at that time.
+
+        :param path:
+        :param file_stat:
+        :return:
+        """
+        with self.lock:
+            self.unseen_paths.discard(path)
+            entry = self.entries.get(path)
+            if entry is None or file_stat is None:
+                return False
+            indexed_stat, verdict = entry
+            if indexed_stat != file_stat or verdict:
+                return False
+            self.skipped_count += 1
+            return True
+
+    def mark_seen(self, path):
+        """
+        Mark a file as seen in this scan without testing it against the index.
+        Its entry will then not be pruned when the scan finishes.
+
+        :param path:
+        :return:
+        """
+        with self.lock:
+            self.unseen_paths.discard(path)
+
+    def record(self, path, file_stat, verdict):
+        """
+        Record the verdict of the file test plugin flow for a file.
+
+        :param path:
+        :param file_stat:
+        :param verdict:
+        :return:
+        """
+        if file_stat is None:
+            return
+        with self.lock:
+            if self.entries.get(path) == (file_stat, verdict):
+                # Nothing has changed
+                return
+            self.entries[path] = (file_stat, verdict)
+            self.pending_writes[path] = {
+                'library_id':                self.library_id,
+                'abspath':                   path,
+                'size':                      file_stat[0],
+                'mtime':                     file_stat[1],
+                'inode':                     file_stat[2],
+                'add_file_to_pending_tasks': verdict,
+                'flow_hash':                 self.flow_hash,
+            }
+            if len(self.pending_writes) < self.flush_batch_size:
+                return
+            rows = list(self.pending_writes.values())
+            self.pending_writes = {}
+        self.__write_rows(rows)
+
+    def flush(self):
+        """
+        Write all pending entries to the database
+
+        :return:
+        """
+        with self.lock:
+            rows = list(self.pending_writes.values())
+            self.pending_writes = {}
+        self.__write_rows(rows)
+
+    def __write_rows(self, rows):
+        for i in range(0, len(rows), self.flush_batch_size):
+            try:
+                LibraryFileIndex.insert_many(rows[i:i + self.flush_batch_size]).on_conflict_replace().execute()
+            except Exception as e:
+                self._log("Failed to write library file index entries", message2=str(e), level="exception")
+
+    def finish(self, prune=True):
+        """
+        Flush all pending entries.
+        If pruning, also remove entries for files that were not seen in this scan.
+
+        :param prune:
+        :return:
+        """
+        self.flush()
+        if not prune:
+            return
+        with self.lock:
+            unseen_paths = list(self.unseen_paths)
+            self.unseen_paths = set()
+            for path in unseen_paths:
+                self.entries.pop(path, None)
+        for i in range(0, len(unseen_paths), self.flush_batch_size):
+            LibraryFileIndex.delete().where(
+                (LibraryFileIndex.library_id == self.library_id),
+                (LibraryFileIndex.abspath.in_(unseen_paths[i:i + self.flush_batch_size]))
+            ).execute()
@@ -29,15 +29,20 @@
            OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
+import multiprocessing
 import os
 import queue
 import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 
 from unmanic import config
 from unmanic.libs import history, common, unlogger
+from unmanic.libs.library import Library
 from unmanic.libs.plugins import PluginsHandler
+from unmanic.libs.probecache import ProbeCache
+from unmanic.libs.unmanicignore import UnmanicIgnoreCache
 
 
 class FileTest(object):
@@ -49,19 +54,24 @@ class FileTest(object):
 
     """
 
-    def __init__(self, library_id: int):
+    def __init__(self, library_id: int, file_index=None, process_pool=None, refresh_session=True):
         self.settings = config.Config()
         unmanic_logging = unlogger.UnmanicLogger.__call__()
         self.logger = unmanic_logging.get_logger(__class__.__name__)
 
         # Init plugins
         self.library_id = library_id
+        self.library_path = Library(library_id).get_path()
         self.plugin_handler = PluginsHandler()
         self.plugin_modules = self.plugin_handler.get_enabled_plugin_modules_by_type('library_management.file_test',
-                                                                                     library_id=library_id)
+                                                                                     library_id=library_id,
+                                                                                     refresh_session=refresh_session)
 
-        # List of filed tasks
-        self.failed_paths = []
+        # Optional persistent index of previously tested files
+        self.file_index = file_index
+
+        # Optional pool of worker processes to run the plugin tests in
+        self.process_pool = process_pool
 
     def _log(self, message, message2='', level="info"):
         message = common.format_message(message, message2)
@@ -76,13 +86,8 @@ class FileTest(object):
 
         :return:
         """
-        # Fetch historical tasks
-        history_logging = history.History()
-        if not self.failed_paths:
-            failed_tasks = history_logging.get_historic_tasks_list_with_source_probe(task_success=False)
-            for task in failed_tasks:
-                self.failed_paths.append(task.get('abspath'))
-        if path in self.failed_paths:
+        # Check the process-wide cache of failed historical task paths
+        if history.History.path_failed_in_history(path):
             # That pathname was found in the results of failed historic tasks
             return True
         # No results were found matching that pathname
@@ -90,28 +95,23 @@ class FileTest(object):
 
     def file_in_unmanic_ignore_lockfile(self, path):
         """
-        Check if folder contains a '.unmanicignore' lockfile
+        Check if file is listed in a '.unmanicignore' lockfile in its directory,
+        or if any of its parent directories within the library are ignored
 
         :return:
         """
-        # Get file parent directory
-        dirname = os.path.dirname(path)
-        # Check if lockfile (.unmanicignore) exists
-        unmanic_ignore_file = os.path.join(dirname, '.unmanicignore')
-        if os.path.exists(unmanic_ignore_file):
-            # Get file basename
-            basename = os.path.basename(path)
-            # Read the file and check for any entry with this file name
-            with open(unmanic_ignore_file) as f:
-                for line in f:
-                    if basename in line:
-                        return True
-        return False
+        ignore_cache = UnmanicIgnoreCache()
+        if ignore_cache.file_is_ignored(path):
+            return True
+        return ignore_cache.parent_directory_is_ignored(path, self.library_path)
 
-    def should_file_be_added_to_task_list(self, path):
+    def should_file_be_added_to_task_list(self, path, file_stat=None):
         """
-        Test if this file needs to be added to the task list
+        Test if this file needs to be added to the task list.
+        The file's os.stat_result may be given if it is already known.
 
+        :param path:
+        :param file_stat:
         :return:
         """
         return_value = None
@@ -133,43 +133,156 @@ class FileTest(object):
             })
             return_value = False
 
+        # Files rejected by the checks above are still in the library. Keep their index entries
+        if return_value is not None and self.file_index is not None:
+            self.file_index.mark_seen(path)
+
+        # Skip files that are unchanged since they were last rejected by the plugin flow
+        index_stat = None
+        if return_value is None and self.file_index is not None:
+            index_stat = self.file_index.stat_file(path, file_stat=file_stat)
+            if self.file_index.file_can_be_skipped(path, index_stat):
+                return False, file_issues, 0
+
         # Only run checks with plugins if other tests were not conclusive
         priority_score_modification = 0
         if return_value is None:
-            # Set the initial data with just the priority score.
-            data = {
-                'priority_score': 0,
-                'shared_info':    {},
-            }
-            # Run tests against plugins
-            for plugin_module in self.plugin_modules:
-                data['library_id'] = self.library_id
-                data['path'] = path
-                data['issues'] = deepcopy(file_issues)
-                data['add_file_to_pending_tasks'] = None
-
-                # Run plugin to update data
-                if not self.plugin_handler.exec_plugin_runner(data, plugin_module.get('plugin_id'),
-                                                              'library_management.file_test'):
-                    continue
-
-                # Append any file issues found during previous tests
-                file_issues = data.get('issues')
-
-                # Set the return_value based on the plugin results
-                # If the add_file_to_pending_tasks returned an answer (True/False) then break the loop.
-                # No need to continue.
-                if data.get('add_file_to_pending_tasks') is not None:
-                    return_value = data.get('add_file_to_pending_tasks')
-                    break
-            # Set the priority score modification
-            priority_score_modification = data.get('priority_score', 0)
+            if self.process_pool is not None:
+                return_value, file_issues, priority_score_modification = self.process_pool.run_file_test_plugins(
+                    path, file_issues)
+            else:
+                return_value, file_issues, priority_score_modification = self.run_file_test_plugins(path, file_issues)
+
+            # Record the verdict of the plugin flow for this file
+            if self.file_index is not None:
+                self.file_index.record(path, index_stat, return_value)
 
         return return_value, file_issues, priority_score_modification
 
+    def run_file_test_plugins(self, path, file_issues):
+        """
+        Run the 'library_management.file_test' plugin flow against a file
+
+        :param path:
+        :param file_issues:
+        :return:
+        """
+        return_value = None
+        # Set the initial data with just the priority score.
+        data = {
+            'priority_score': 0,
+            'shared_info':    {},
+        }
+        # Provide any previous probe of this file to the plugins
+        probe_cache = ProbeCache()
+        probe_cache.populate_shared_info(path, data['shared_info'])
+        # Run tests against plugins
+        for plugin_module in self.plugin_modules:
+            data['library_id'] = self.library_id
+            data['path'] = path
+            data['issues'] = deepcopy(file_issues)
+            data['add_file_to_pending_tasks'] = None
+
+            # Run plugin to update data
+            if not self.plugin_handler.exec_plugin_runner(data, plugin_module.get('plugin_id'),
+                                                          'library_management.file_test'):
+                continue
+
+            # Append any file issues found during previous tests
+            file_issues = data.get('issues')
+
+            # Set the return_value based on the plugin results
+            # If the add_file_to_pending_tasks returned an answer (True/False) then break the loop.
+            # No need to continue.
+            if data.get('add_file_to_pending_tasks') is not None:
+                return_value = data.get('add_file_to_pending_tasks')
+                break
+
+        # Keep any probe of this file made by the plugins for later tests and the worker
+        probe_cache.store_shared_info(path, data['shared_info'])
+
+        return return_value, file_issues, data.get('priority_score', 0)
+
+
+# The FileTest instance used by each process in a FileTestProcessPool
+_process_file_test = None
+
+
+def _init_file_test_process(config_path, library_id, path_settings):
+    """
+    Initialise a FileTestProcessPool worker process.
+    Connects to the database and resolves the library's file test plugin flow once for the life of the process.
+
+    The config is rebuilt from the config file, so the parent's resolved paths are given in 'path_settings'.
+    These may have been set from command params and are not saved to the config file.
+
+    :param config_path:
+    :param library_id:
+    :param path_settings:
+    :return:
+    """
+    global _process_file_test
+    from unmanic.libs.unmodels.lib import Database
+    # The logger must exist before the config is loaded
+    unlogger.UnmanicLogger.__call__()
+    settings = config.Config(config_path=config_path)
+    settings.set_bulk_config_items(path_settings, save_settings=False)
+    app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    Database.select_database({
+        "TYPE":           "SQLITE",
+        "FILE":           os.path.join(settings.get_config_path(), 'unmanic.db'),
+        "MIGRATIONS_DIR": os.path.join(app_dir, 'migrations_v1'),
+    })
+    _process_file_test = FileTest(library_id, refresh_session=False)
+
+
+def _run_file_test_plugins_in_process(path, file_issues):
+    return _process_file_test.run_file_test_plugins(path, file_issues)
+
+
+class FileTestProcessPool(object):
+    """
+    FileTestProcessPool
+
+    Pool of worker processes used to run the 'library_management.file_test'
+    plugin flow outside of the main process. Each process keeps its own
+    loaded plugin modules for the life of the pool.
+
+    """
+
+    def __init__(self, library_id: int, processes: int):
+        self.settings = config.Config()
+        self.library_id = library_id
+        self.executor = ProcessPoolExecutor(
+            max_workers=max(1, int(processes)),
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_file_test_process,
+            initargs=(self.settings.get_config_path(), library_id, {
+                'plugins_path':  self.settings.get_plugins_path(),
+                'userdata_path': self.settings.get_userdata_path(),
+                'cache_path':    self.settings.get_cache_path(),
+            }),
+        )
+
+    def run_file_test_plugins(self, path, file_issues):
+        """
+        Run the file test plugin flow against a file in one of the pool's processes.
+        Blocks until the result is returned.
+
+        :param path:
+        :param file_issues:
+        :return:
+        """
+        future = self.executor.submit(_run_file_test_plugins_in_process, path, file_issues)
+        return future.result()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
+
 
 class FileTesterThread(threading.Thread):
-    def __init__(self, name, files_to_test, files_to_process, status_updates, library_id, event):
+    def __init__(self, name, files_to_test, files_to_process, status_updates, library_id, event, file_index=None,
+                 process_pool=None):
         super(FileTesterThread, self).__init__(name=name)
         self.settings = config.Config()
         self.logger = None
@@ -177,6 +290,8 @@ class FileTesterThread(threading.Thread):
         self.files_to_test = files_to_test
         self.files_to_process = files_to_process
         self.library_id = library_id
+        self.file_index = file_index
+        self.process_pool = process_pool
         self.status_updates = status_updates
         self.abort_flag = threading.Event()
         self.abort_flag.clear()
@@ -193,11 +308,11 @@ class FileTesterThread(threading.Thread):
 
     def run(self):
         self._log("Starting {}".format(self.name))
-        file_test = FileTest(self.library_id)
+        file_test = FileTest(self.library_id, file_index=self.file_index, process_pool=self.process_pool)
         while not self.abort_flag.is_set():
             try:
                 # Pending task queue has an item available. Fetch it.
-                next_file = self.files_to_test.get_nowait()
+                next_file, next_file_stat = self.files_to_test.get_nowait()
                 self.status_updates.put(next_file)
             except queue.Empty:
                 self.event.wait(2)
@@ -208,7 +323,8 @@ class FileTesterThread(threading.Thread):
 
             # Test file to be added to task list. Add it if required
             try:
-                result, issues, priority_score = file_test.should_file_be_added_to_task_list(next_file)
+                result, issues, priority_score = file_test.should_file_be_added_to_task_list(next_file,
+                                                                                             file_stat=next_file_stat)
                 # Log any error messages
                 for issue in issues:
                     if type(issue) is dict:
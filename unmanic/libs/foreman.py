@@ -70,15 +70,26 @@ class Foreman(threading.Thread):
         self.last_schedule_run = datetime.today().strftime('%H:%M')
 
         self.links = installation_link.Links()
+        self.remote_capacity_poller = None
         self.link_heartbeat_last_run = 0
         self.available_remote_managers = {}
 
+        # Intervals (in seconds) for the periodic checks run by the Foreman.
+        # Tasks are otherwise dispatched as soon as the task queue triggers a dispatch.
+        self.dispatch_check_interval = 2
+        self.housekeeping_interval = 5
+
     def _log(self, message, message2=None, level="info"):
         message = common.format_message(message, message2)
         getattr(self.logger, level)(message)
 
     def stop(self):
         self.abort_flag.set()
+        # Wake the main loop
+        self.task_queue.trigger_dispatch()
+        # Stop polling linked installations
+        if self.remote_capacity_poller is not None:
+            self.remote_capacity_poller.stop()
         # Stop all workers
         # To avoid having the dictionary change size during iteration,
         #   we need to first get the thread_keys, then iterate through that
@@ -307,7 +318,8 @@ class Foreman(threading.Thread):
     def init_remote_task_manager_thread(self, library_name=None):
         # Fetch the installation ID and info
         installation_id, installation_info = self.fetch_available_remote_installation(library_name=library_name)
-        del self.available_remote_managers[installation_id]
+        if installation_id in self.available_remote_managers:
+            del self.available_remote_managers[installation_id]
 
         # Ensure a worker was assigned
         if not installation_info:
@@ -387,7 +399,8 @@ class Foreman(threading.Thread):
 
     def update_remote_worker_availability_status(self):
         """
-        Updates the list of available remote managers that can be started
+        Updates the list of available remote managers that can be started.
+        The list of installations with available workers is read from the RemoteCapacityPoller cache.
 
         :return:
         """
@@ -417,7 +430,7 @@ class Foreman(threading.Thread):
 
     def start_worker_thread(self, worker_id, worker_name, worker_group):
         thread = Worker(worker_id, worker_name, worker_group, self.workers_pending_task_queue,
-                        self.complete_queue, self.event)
+                        self.complete_queue, self.event, dispatch_event=self.task_queue.dispatch_event)
         thread.daemon = True
         thread.start()
         self.worker_threads[worker_id] = thread
@@ -532,6 +545,8 @@ class Foreman(threading.Thread):
             return False
 
         self.worker_threads[worker_id].paused_flag.clear()
+        # Wake the worker so it can announce that it is ready for a task
+        self.worker_threads[worker_id].task_event.set()
         return True
 
     def resume_all_worker_threads(self, worker_group_id=None):
@@ -576,11 +591,18 @@ class Foreman(threading.Thread):
     def mark_remote_task_manager_thread_as_redundant(self, link_manager_id):
         self.remote_task_manager_threads[link_manager_id].redundant_flag.set()
 
-    def hand_task_to_workers(self, item, local=True, library_name=None, worker_id=None):
+    def hand_task_to_workers(self, item, local=True, library_name=None, worker_id=None, reserved=False):
         if local:
             # Assign the task to the worker id provided
             if worker_id in self.worker_threads and self.worker_threads[worker_id].is_alive():
-                self.worker_threads[worker_id].set_task(item)
+                # Mark the task as in progress straight away so that it is not handed to another idle worker
+                if not reserved:
+                    self.task_queue.mark_item_in_progress(item)
+                if not self.worker_threads[worker_id].set_task(item):
+                    item.set_status('pending')
+            elif reserved:
+                # Release the reservation on this task
+                item.set_status('pending')
             # If the worker thread specified was not available to collect this task, it will be fetched again in the next loop
         else:
             # Place into queue for a remote link manager thread to collect
@@ -619,140 +641,194 @@ class Foreman(threading.Thread):
         # Mark this as the last time run
         self.link_heartbeat_last_run = time_now
 
-    def run(self):
-        self._log("Starting Foreman Monitor loop")
+    def process_completed_tasks(self):
+        """
+        Mark all tasks that have been completed by workers as 'processed' so the post-processor can pick them up
+
+        :return:
+        """
+        while not self.abort_flag.is_set() and not self.complete_queue.empty():
+            try:
+                task_item = self.complete_queue.get_nowait()
+                task_item.set_status('processed')
+            except queue.Empty:
+                continue
+            except Exception as e:
+                self._log("Exception when fetching completed task report from worker", message2=str(e),
+                          level="exception")
+
+    def run_housekeeping(self):
+        """
+        Periodic management of the worker threads and configuration.
+        Returns False if the worker configuration is not currently valid.
 
+        :return:
+        """
+        # Setup the correct number of workers
+        if not self.abort_flag.is_set():
+            self.init_worker_threads()
+
+        # If the worker config is not valid, then pause all workers until it is
+        if not self.validate_worker_config():
+            # Pause all workers
+            self.pause_all_worker_threads()
+            return False
+
+        # Manage worker event schedules
+        self.manage_event_schedules()
+        return True
+
+    def dispatch_pending_tasks(self):
+        """
+        Hand out pending tasks until there are no more idle workers or no more matching tasks
+
+        :return:
+        """
         # Flag to force checking for idle remote workers when set to False.
         # This will prevent always looping on idle local workers when the local worker's
         # tags prevent them from taking up tasks
         allow_local_idle_worker_check = True
 
-        while not self.abort_flag.is_set():
-            self.event.wait(2)
-
-            try:
-                # Fetch all completed tasks from workers
-                while not self.abort_flag.is_set() and not self.complete_queue.empty():
-                    self.event.wait(.5)
+        while not self.abort_flag.is_set() and not self.task_queue.task_list_pending_is_empty():
+
+            # Check the status of all link manager threads (close dead ones)
+            self.link_manager_tread_heartbeat()
+
+            # Check if we are able to start up a worker for another encoding job
+            # These queues holds only one task at a time and is used to hand tasks to the workers
+            if self.workers_pending_task_queue.full() or self.remote_workers_pending_task_queue.full():
+                # In order to simplify the process and run the foreman management in a single thread, if either of
+                # these are full, it means the thread that is assigned to pick up the item has not done so.
+                # In order to prevent a second thread starting and taking the first thread's task, we should not
+                # process any more pending tasks until that first thread is ready and has taken its task out of the
+                # queue.
+                return
+
+            # Check if there are any free workers
+            worker_ids = []
+            if allow_local_idle_worker_check and self.check_for_idle_workers():
+                # Local workers are available
+                process_local = True
+                # For local workers, process either local tasks or tasks provided from a remote installation
+                get_local_pending_tasks_only = False
+                # Specify the worker ID that will handle the next task
+                worker_ids = self.fetch_available_worker_ids()
+                # If not workers were available (possibly due to being recycled), wait for the next trigger
+                if not worker_ids:
+                    return
+            elif self.check_for_idle_remote_workers():
+                # Remote workers are available
+                process_local = False
+                # For remote workers, only process local tasks. Don't hand remote tasks to another remote installation
+                get_local_pending_tasks_only = True
+            else:
+                # All workers are currently busy. Wait for one of them to become idle
+                return
+
+            # Check if postprocessor task queue is full. Wait for it to drain
+            if self.postprocessor_queue_full():
+                return
+
+            # Fetch the next item in the queue
+            if process_local:
+                # For local processing, ensure tags match the available library and worker.
+                # Collect the tags of all idle workers so that tasks can be reserved for them all at once.
+                worker_tags = {}
+                for worker_id in worker_ids:
                     try:
-                        task_item = self.complete_queue.get_nowait()
-                        task_item.set_status('processed')
-                    except queue.Empty:
-                        continue
+                        worker_tags[worker_id] = set(self.get_tags_configured_for_worker(worker_id))
                     except Exception as e:
-                        self._log("Exception when fetching completed task report from worker", message2=str(e),
-                                  level="exception")
-
-                # Setup the correct number of workers
-                if not self.abort_flag.is_set():
-                    self.init_worker_threads()
-
-                # If the worker config is not valid, then pause all workers until it is
-                if not self.validate_worker_config():
-                    # Pause all workers
-                    self.pause_all_worker_threads()
+                        # This will happen if the worker group is deleted
+                        self._log("Error while fetching the tags for the configured worker", str(e), level='debug')
+                        # Skip this worker. The housekeeping will clean up these workers on the next pass
+                        continue
+                reserved_tasks = self.task_queue.reserve_next_pending_tasks(worker_tags,
+                                                                            local_only=get_local_pending_tasks_only)
+                # If no local worker ID was assigned to any item, then try the remote workers
+                if not reserved_tasks:
+                    allow_local_idle_worker_check = False
                     continue
+                for worker_id, next_item_to_process in reserved_tasks:
+                    self._log("Processing item - {}".format(next_item_to_process.get_source_abspath()))
+                    self.hand_task_to_workers(next_item_to_process, local=True, worker_id=worker_id, reserved=True)
+                continue
+            else:
+                # For remote items, run a search matching an available remote installation library
+                remote_library_names = self.get_available_remote_library_names()
+                next_item_to_process = self.task_queue.get_next_pending_tasks(local_only=get_local_pending_tasks_only,
+                                                                              library_names=remote_library_names)
+                if not next_item_to_process:
+                    # Nothing can currently be handed out to the remote workers
+                    return
 
-                # Manage worker event schedules
-                self.manage_event_schedules()
+            try:
+                source_abspath = next_item_to_process.get_source_abspath()
+                task_library_name = next_item_to_process.get_task_library_name()
+            except Exception as e:
+                self._log("Exception in fetching task details", message2=str(e), level="exception")
+                return
 
-                if not self.abort_flag.is_set() and not self.task_queue.task_list_pending_is_empty():
+            self._log("Processing item - {}".format(source_abspath))
+            success = self.hand_task_to_workers(next_item_to_process, local=False, library_name=task_library_name)
+            if not success:
+                self._log("Re-queueing tasks. Unable to find worker capable of processing task '{}'".format(
+                    next_item_to_process.get_source_abspath()), level="warning")
+                # Re-queue item at the bottom
+                self.task_queue.requeue_tasks_at_bottom(next_item_to_process.get_task_id())
 
-                    # Check the status of all link manager threads (close dead ones)
-                    self.link_manager_tread_heartbeat()
+    def run(self):
+        self._log("Starting Foreman Monitor loop")
 
-                    # Check if we are able to start up a worker for another encoding job
-                    # These queues holds only one task at a time and is used to hand tasks to the workers
-                    if self.workers_pending_task_queue.full() or self.remote_workers_pending_task_queue.full():
-                        # In order to simplify the process and run the foreman management in a single thread, if either of
-                        # these are full, it means the thread that is assigned to pick up the item has not done so.
-                        # In order to prevent a second thread starting and taking the first thread's task, we should not
-                        # process any more pending tasks until that first thread is ready and has taken its task out of the
-                        # queue.
-                        continue
+        # Poll the capacity of linked installations in the background
+        self.remote_capacity_poller = installation_link.RemoteCapacityPoller()
+        self.remote_capacity_poller.daemon = True
+        self.remote_capacity_poller.start()
 
-                    # Check if there are any free workers
-                    worker_ids = []
-                    if allow_local_idle_worker_check and self.check_for_idle_workers():
-                        # Local workers are available
-                        process_local = True
-                        # For local workers, process either local tasks or tasks provided from a remote installation
-                        get_local_pending_tasks_only = False
-                        # Specify the worker ID that will handle the next task
-                        worker_ids = self.fetch_available_worker_ids()
-                        # If not workers were available (possibly due to being recycled), just continue loop
-                        if not worker_ids:
-                            continue
-                    elif self.check_for_idle_remote_workers():
-                        allow_local_idle_worker_check = True
-                        # Remote workers are available
-                        process_local = False
-                        # For remote workers, only process local tasks. Don't hand remote tasks to another remote installation
-                        get_local_pending_tasks_only = True
-                    else:
-                        allow_local_idle_worker_check = True
-                        # All workers are currently busy
-                        self.event.wait(1)
-                        continue
+        last_housekeeping_run = 0
+        worker_config_valid = False
+        while not self.abort_flag.is_set():
+            # Wait for a worker to become idle, a task to be queued or the post-processor to drain.
+            # Timeout so that remote workers and housekeeping are still checked periodically.
+            self.task_queue.wait_for_dispatch_trigger(self.dispatch_check_interval)
 
-                    # Check if postprocessor task queue is full
-                    if self.postprocessor_queue_full():
-                        self.event.wait(5)
-                        continue
+            try:
+                # Fetch all completed tasks from workers
+                self.process_completed_tasks()
+
+                # Run the periodic housekeeping on its own slower cadence
+                time_now = time.time()
+                if (time_now - last_housekeeping_run) >= self.housekeeping_interval:
+                    last_housekeeping_run = time_now
+                    worker_config_valid = self.run_housekeeping()
+                if not worker_config_valid:
+                    continue
 
-                    # Fetch the next item in the queue
-                    available_worker_id = None
-                    next_item_to_process = None
-                    if process_local:
-                        # For local processing, ensure tags match the available library and worker
-                        for worker_id in worker_ids:
-                            try:
-                                library_tags = self.get_tags_configured_for_worker(worker_id)
-                            except Exception as e:
-                                # This will happen if the worker group is deleted
-                                self._log("Error while fetching the tags for the configured worker", str(e), level='debug')
-                                # Break this fore loop. The main while loop wil clean up these workers on the next pass
-                                break
-                            next_item_to_process = self.task_queue.get_next_pending_tasks(
-                                local_only=get_local_pending_tasks_only,
-                                library_tags=library_tags)
-                            if next_item_to_process:
-                                available_worker_id = worker_id
-                                break
-                        # If no local worker ID was assigned to the given item, then try again in 2 seconds
-                        if not available_worker_id:
-                            allow_local_idle_worker_check = False
-                            self.event.wait(1)
-                            continue
-                    else:
-                        # For remote items, run a search matching an available remote installation library
-                        remote_library_names = self.get_available_remote_library_names()
-                        next_item_to_process = self.task_queue.get_next_pending_tasks(local_only=get_local_pending_tasks_only,
-                                                                                      library_names=remote_library_names)
-
-                    if next_item_to_process:
-                        try:
-                            source_abspath = next_item_to_process.get_source_abspath()
-                            task_library_name = next_item_to_process.get_task_library_name()
-                        except Exception as e:
-                            self._log("Exception in fetching task details", message2=str(e), level="exception")
-                            self.event.wait(3)
-                            continue
-
-                        self._log("Processing item - {}".format(source_abspath))
-                        success = self.hand_task_to_workers(next_item_to_process, local=process_local,
-                                                            library_name=task_library_name,
-                                                            worker_id=available_worker_id)
-                        if not success:
-                            self._log("Re-queueing tasks. Unable to find worker capable of processing task '{}'".format(
-                                next_item_to_process.get_source_abspath()), level="warning")
-                            # Re-queue item at the bottom
-                            self.task_queue.requeue_tasks_at_bottom(next_item_to_process.get_task_id())
+                # Hand out any pending tasks to the idle workers
+                self.dispatch_pending_tasks()
             except Exception as e:
                 raise Exception(e)
 
         self._log("Leaving Foreman Monitor loop...")
 
+    def get_worker_capacity(self):
+        """
+        Return the count of all workers, the idle workers that are not paused and the busy workers
+
+        :return:
+        """
+        capacity = {
+            'worker_count':      0,
+            'idle_worker_count': 0,
+            'busy_worker_count': 0,
+        }
+        for thread in list(self.worker_threads.values()):
+            capacity['worker_count'] += 1
+            if thread.idle and not thread.paused:
+                capacity['idle_worker_count'] += 1
+            elif not thread.idle:
+                capacity['busy_worker_count'] += 1
+        return capacity
+
     def get_all_worker_status(self):
         all_status = []
         for thread in self.worker_threads:
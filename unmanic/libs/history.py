@@ -32,10 +32,13 @@
 
 import os
 import json
+import threading
+from collections import Counter
 from operator import attrgetter
 
 from unmanic import config
-from unmanic.libs import common, unlogger
+from unmanic.libs import common, searchindex, unlogger
+from unmanic.libs.singleton import SingletonType
 from unmanic.libs.unmodels import CompletedTasks, CompletedTasksCommandLogs
 
 try:
@@ -44,6 +47,61 @@ except ImportError:
     JSONDecodeError = ValueError
 
 
+class FailedTaskPathCache(object, metaclass=SingletonType):
+    """
+    FailedTaskPathCache
+
+    Process-wide set of source paths that have a failed task in history.
+    The table is read once on first use and then kept up to date by the
+    History class as entries are created or removed.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.paths = None
+
+    def __load(self):
+        paths = Counter()
+        query = CompletedTasks.select(CompletedTasks.abspath).where(~CompletedTasks.task_success)
+        for abspath, in query.tuples():
+            paths[abspath] += 1
+        self.paths = paths
+
+    def contains(self, path):
+        """
+        Check if the given path has failed in history
+
+        :param path:
+        :return:
+        """
+        if self.paths is None:
+            with self.lock:
+                if self.paths is None:
+                    self.__load()
+        return path in self.paths
+
+    def add(self, path):
+        with self.lock:
+            if self.paths is not None:
+                self.paths[path] += 1
+
+    def remove(self, path):
+        with self.lock:
+            if self.paths is not None and path in self.paths:
+                self.paths[path] -= 1
+                if self.paths[path] <= 0:
+                    del self.paths[path]
+
+    def reset(self):
+        """
+        Clear the cache forcing it to be re-read from the database on next use
+
+        :return:
+        """
+        with self.lock:
+            self.paths = None
+
+
 class History(object):
     """
     History
@@ -96,7 +154,7 @@ class History(object):
                 query = query.where(CompletedTasks.id.in_(id_list))
 
             if search_value:
-                query = query.where(CompletedTasks.task_label.contains(search_value))
+                query = query.where(searchindex.search_condition(CompletedTasks, search_value))
 
             if task_success is not None:
                 query = query.where(CompletedTasks.task_success.in_([task_success]))
@@ -175,7 +233,7 @@ class History(object):
             query = query.where(CompletedTasks.id.in_(id_list))
 
         if search_value:
-            query = query.where(CompletedTasks.task_label.contains(search_value))
+            query = query.where(searchindex.search_condition(CompletedTasks, search_value))
 
         if task_success is not None:
             query = query.where(CompletedTasks.task_success.in_([task_success]))
@@ -185,6 +243,16 @@ class History(object):
 
         return query.dicts()
 
+    @staticmethod
+    def path_failed_in_history(abspath):
+        """
+        Check if a path has a failed task recorded in history
+
+        :param abspath:
+        :return:
+        """
+        return FailedTaskPathCache().contains(abspath)
+
     def get_historic_task_data_dictionary(self, task_id):
         """
         Read all data for a task and return a dictionary of that data
@@ -220,9 +288,12 @@ class History(object):
             if id_list:
                 query = query.where(CompletedTasks.id.in_(id_list))
 
+            failed_task_paths = FailedTaskPathCache()
             for historic_task_id in query:
                 try:
                     historic_task_id.delete_instance(recursive=True)
+                    if not historic_task_id.task_success:
+                        failed_task_paths.remove(historic_task_id.abspath)
                 except Exception as e:
                     # Catch delete exceptions
                     self._log("An error occurred while deleting historic task ID: {}.".format(historic_task_id), str(e),
@@ -289,5 +360,8 @@ class History(object):
                                                   task_success=task_data['task_success'],
                                                   start_time=task_data['start_time'],
                                                   finish_time=task_data['finish_time'],
-                                                  processed_by_worker=task_data['processed_by_worker'])
+                                                  processed_by_worker=task_data['processed_by_worker'],
+                                                  checksum=task_data.get('checksum'))
+        if not new_historic_task.task_success:
+            FailedTaskPathCache().add(new_historic_task.abspath)
         return new_historic_task
@@ -29,11 +29,13 @@
            OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
+import hashlib
 import json
 import os.path
 import queue
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from requests.auth import HTTPBasicAuth
@@ -41,7 +43,9 @@ from requests_toolbelt import MultipartEncoder
 
 from unmanic import config
 from unmanic.libs import common, session, task, unlogger
+from unmanic.libs.chunkedtransfer import CHUNK_HASH_HEADER, CHUNK_SIZE, MAX_CHUNK_SIZE, chunk_hash, split_ranges
 from unmanic.libs.library import Library
+from unmanic.libs.remotesessions import RemoteSessionPool
 from unmanic.libs.session import Session
 from unmanic.libs.singleton import SingletonType
 
@@ -66,17 +70,36 @@ class RequestHandler:
         return request_auth
 
     def get(self, url, **kwargs):
-        return requests.get(url, auth=self.__get_request_auth(), **kwargs)
+        return RemoteSessionPool().request('GET', url, auth=self.__get_request_auth(), **kwargs)
 
     def post(self, url, **kwargs):
-        return requests.post(url, auth=self.__get_request_auth(), **kwargs)
+        return RemoteSessionPool().request('POST', url, auth=self.__get_request_auth(), **kwargs)
+
+    def put(self, url, **kwargs):
+        return RemoteSessionPool().request('PUT', url, auth=self.__get_request_auth(), **kwargs)
 
     def delete(self, url, **kwargs):
-        return requests.delete(url, auth=self.__get_request_auth(), **kwargs)
+        return RemoteSessionPool().request('DELETE', url, auth=self.__get_request_auth(), **kwargs)
 
 
 class Links(object, metaclass=SingletonType):
     _network_transfer_lock = {}
+    _upload_sessions = {}
+    _remote_capacity_cache = {}
+    _link_sync_cache = {}
+    _available_installations = {}
+    _available_installations_updated = 0
+    _available_installations_lock = threading.Lock()
+
+    # Seconds after which the cached table of installations with available workers is considered stale
+    available_installations_max_age = 60
+    max_capacity_probes = 8
+
+    # Number of consecutive failed chunk requests before a transfer is abandoned
+    transfer_retries = 5
+    max_transfer_streams = 16
+    transfer_retry_delay = 5
+    transfer_chunk_timeout = 120
 
     def __init__(self, *args, **kwargs):
         self.settings = config.Config()
@@ -119,6 +142,8 @@ class Links(object, metaclass=SingletonType):
             "enable_checksum_validation":      config_dict.get('enable_checksum_validation', False),
             "enable_config_missing_libraries": config_dict.get('enable_config_missing_libraries', False),
             "enable_distributed_worker_count": config_dict.get('enable_distributed_worker_count', False),
+            "transfer_stream_count":           config_dict.get('transfer_stream_count', 1),
+            "transfer_chunk_size_mb":          config_dict.get('transfer_chunk_size_mb', CHUNK_SIZE // (1024 * 1024)),
             "name":                            config_dict.get('name', '???'),
             "version":                         config_dict.get('version', '???'),
             "uuid":                            config_dict.get('uuid', '???'),
@@ -127,6 +152,36 @@ class Links(object, metaclass=SingletonType):
             "last_updated":                    config_dict.get('last_updated', time.time()),
         }
 
+    def __get_transfer_options(self, remote_config: dict):
+        """
+        Return the chunk size in bytes and the number of concurrent streams configured for a link
+
+        :param remote_config:
+        :return:
+        """
+        try:
+            chunk_size = int(remote_config.get('transfer_chunk_size_mb') or 0) * 1024 * 1024
+        except (TypeError, ValueError):
+            chunk_size = 0
+        if chunk_size <= 0:
+            chunk_size = CHUNK_SIZE
+        chunk_size = min(chunk_size, MAX_CHUNK_SIZE)
+        try:
+            stream_count = int(remote_config.get('transfer_stream_count') or 1)
+        except (TypeError, ValueError):
+            stream_count = 1
+        stream_count = max(1, min(stream_count, self.max_transfer_streams))
+        return chunk_size, stream_count
+
+    def get_remote_api_metrics(self, address: str):
+        """
+        Return the request latency metrics for each API endpoint of a remote installation
+
+        :param address:
+        :return:
+        """
+        return RemoteSessionPool().get_metrics(self.__format_address(address))
+
     def acquire_network_transfer_lock(self, url, transfer_limit=1, lock_type='send'):
         """
         Limit transfers to each installation to 1 at a time
@@ -261,6 +316,101 @@ class Links(object, metaclass=SingletonType):
                 message2=json_data.get('traceback', []), level='error')
         return {}
 
+    def remote_api_post_file_chunked(self, remote_config: dict, path: str):
+        """
+        Send a file to the remote installation in chunks using a resumable upload session.
+        Chunks are sent over the number of concurrent streams configured for the link.
+        A failed chunk is retried on its own.
+        Sessions are remembered per file so a later attempt to send the same
+        unchanged file resumes the existing session.
+        Returns None if the remote installation does not support upload sessions.
+
+        :param remote_config:
+        :param path:
+        :return:
+        """
+        request_handler = RequestHandler(
+            auth=remote_config.get('auth'),
+            username=remote_config.get('username'),
+            password=remote_config.get('password'),
+        )
+        address = self.__format_address(remote_config.get('address'))
+        sessions_url = "{}/unmanic/api/v2/transfer/upload/session".format(address)
+        file_stat = os.stat(path)
+        file_size = file_stat.st_size
+        session_key = (address, os.path.abspath(path), file_size, file_stat.st_mtime_ns)
+
+        # Resume an existing session for this file if the remote installation still has it
+        session_data = {}
+        session_id = self._upload_sessions.get(session_key)
+        if session_id:
+            res = request_handler.get("{}/{}".format(sessions_url, session_id), timeout=10)
+            if res.status_code == 200:
+                session_data = res.json()
+                self._log("Resuming upload of '{}' from byte {}".format(path, session_data.get('offset')),
+                          level='debug')
+        if not session_data:
+            res = request_handler.post(sessions_url, json={'filename': os.path.basename(path), 'size': file_size},
+                                       timeout=10)
+            if res.status_code != 200:
+                # The remote installation does not support resumable uploads
+                return None
+            session_data = res.json()
+            session_id = session_data.get('session_id')
+            self._upload_sessions[session_key] = session_id
+
+        # Send every chunk the remote installation has not yet received over the configured number of streams
+        chunk_size, stream_count = self.__get_transfer_options(remote_config)
+        chunks = split_ranges(file_size, chunk_size, session_data.get('received', [[0, session_data.get('offset', 0)]]))
+        abort_flag = threading.Event()
+
+        def send_chunk(start, end):
+            with open(path, 'rb') as f:
+                f.seek(start)
+                data = f.read(end - start)
+            chunk_url = "{}/{}/chunk/{}".format(sessions_url, session_id, start)
+            headers = {
+                'Content-Type':    'application/octet-stream',
+                CHUNK_HASH_HEADER: chunk_hash(data),
+            }
+            failures = 0
+            while not abort_flag.is_set():
+                try:
+                    # Chunks are retried here, so the session pool must not also resend them
+                    res = request_handler.put(chunk_url, data=data, headers=headers, timeout=self.transfer_chunk_timeout,
+                                              max_retries=0)
+                    if res.status_code == 200:
+                        return True
+                    self._log("Remote installation rejected chunk at offset {}".format(start),
+                              message2=res.json().get('error'), level='warning')
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    self._log("Failed to upload chunk at offset {}".format(start), message2=str(e), level='warning')
+                failures += 1
+                if failures > self.transfer_retries:
+                    abort_flag.set()
+                    break
+                time.sleep(self.transfer_retry_delay)
+            return False
+
+        with ThreadPoolExecutor(max_workers=stream_count) as executor:
+            results = list(executor.map(lambda chunk: send_chunk(*chunk), chunks))
+        if not all(results):
+            # The session is kept so the next attempt to send this file can resume it
+            self._log("Giving up on upload of '{}'".format(path), level='error')
+            return {}
+
+        # No timeout is set on completion as the remote installation calculates the file checksum before responding
+        res = request_handler.post("{}/{}/complete".format(sessions_url, session_id))
+        self._upload_sessions.pop(session_key, None)
+        if res.status_code == 200:
+            return res.json()
+        elif res.status_code in [400, 404, 405, 500]:
+            json_data = res.json()
+            self._log("Error while completing upload to remote installation. Message: '{}'".format(
+                json_data.get('error')),
+                message2=json_data.get('traceback', []), level='error')
+        return {}
+
     def remote_api_delete(self, remote_config: dict, endpoint: str, data: dict, timeout=2):
         """
         DELETE to remote installation API
@@ -289,9 +439,69 @@ class Links(object, metaclass=SingletonType):
                 message2=json_data.get('traceback', []), level='error')
         return {}
 
+    def __download_range(self, request_handler, url, fd, start, end, abort_flag=None):
+        """
+        Download the [start, end) range of a file into an open file descriptor.
+        Each range is verified against the hash sent with it and retried on failure.
+        Returns the total size of the remote file, or None if the remote installation
+        does not support ranges and the whole file was written instead.
+
+        :param request_handler:
+        :param url:
+        :param fd:
+        :param start:
+        :param end:
+        :param abort_flag:
+        :return:
+        """
+        failures = 0
+        total_size = None
+        while abort_flag is None or not abort_flag.is_set():
+            try:
+                headers = {'Range': 'bytes={}-{}'.format(start, end - 1)}
+                with request_handler.get(url, headers=headers, stream=True, timeout=self.transfer_chunk_timeout,
+                                         max_retries=0) as r:
+                    if r.status_code == 416:
+                        # Requested range is past the end of the file
+                        return int(r.headers.get('Content-Range', '').split('/')[-1])
+                    r.raise_for_status()
+                    if r.status_code != 206:
+                        # Ranges are not supported. Stream the whole file
+                        os.ftruncate(fd, 0)
+                        position = 0
+                        for chunk in r.iter_content(chunk_size=None):
+                            if chunk:
+                                os.pwrite(fd, chunk, position)
+                                position += len(chunk)
+                        return None
+                    data = r.content
+                    expected_hash = r.headers.get(CHUNK_HASH_HEADER)
+                    if not data or (expected_hash and chunk_hash(data) != expected_hash):
+                        raise requests.exceptions.ContentDecodingError(
+                            "Chunk at offset {} failed hash verification".format(start))
+                    total_size = int(r.headers.get('Content-Range', '').split('/')[-1])
+                os.pwrite(fd, data, start)
+                start += len(data)
+                failures = 0
+                if start >= min(end, total_size):
+                    return total_size
+            except (requests.exceptions.RequestException, ValueError) as e:
+                failures += 1
+                if failures > self.transfer_retries:
+                    if abort_flag is not None:
+                        abort_flag.set()
+                    raise
+                self._log("Failed to download chunk at offset {}. Retrying...".format(start), message2=str(e),
+                          level='warning')
+                time.sleep(self.transfer_retry_delay)
+        return total_size
+
     def remote_api_get_download(self, remote_config: dict, endpoint: str, path: str):
         """
-        Download a file from a remote installation
+        Download a file from a remote installation.
+        The file is requested in ranges over the number of concurrent streams configured
+        for the link. If the remote installation does not support ranges, the whole file
+        is streamed.
 
         :param remote_config:
         :param endpoint:
@@ -305,12 +515,24 @@ class Links(object, metaclass=SingletonType):
         )
         address = self.__format_address(remote_config.get('address'))
         url = "{}{}".format(address, endpoint)
-        with request_handler.get(url, stream=True) as r:
-            r.raise_for_status()
-            with open(path, 'wb') as f:
-                for chunk in r.iter_content(chunk_size=None):
-                    if chunk:
-                        f.write(chunk)
+        chunk_size, stream_count = self.__get_transfer_options(remote_config)
+        with open(path, 'wb') as f:
+            fd = f.fileno()
+            # The first chunk also returns the size of the file and whether ranges are supported
+            total_size = self.__download_range(request_handler, url, fd, 0, chunk_size)
+            if total_size is None:
+                return True
+            os.ftruncate(fd, total_size)
+            abort_flag = threading.Event()
+            with ThreadPoolExecutor(max_workers=stream_count) as executor:
+                futures = [
+                    executor.submit(self.__download_range, request_handler, url, fd, start, end, abort_flag)
+                    for start, end in split_ranges(total_size, chunk_size, [[0, min(chunk_size, total_size)]])
+                ]
+                for future in futures:
+                    future.result()
+            if abort_flag.is_set():
+                raise requests.exceptions.RequestException("Download of '{}' was abandoned".format(url))
         return True
 
     def validate_remote_installation(self, address: str, **kwargs):
@@ -331,9 +553,12 @@ class Links(object, metaclass=SingletonType):
             password=kwargs.get('password'),
         )
 
+        # These requests are not retried so that an unreachable installation fails fast.
+        # It is validated again on the next link sync.
+
         # Fetch config
         url = "{}/unmanic/api/v2/settings/configuration".format(address)
-        res = request_handler.get(url, timeout=2)
+        res = request_handler.get(url, timeout=2, max_retries=0)
         if res.status_code != 200:
             if res.status_code in [400, 404, 405, 500]:
                 json_data = res.json()
@@ -344,7 +569,7 @@ class Links(object, metaclass=SingletonType):
 
         # Fetch settings
         url = "{}/unmanic/api/v2/settings/read".format(address)
-        res = request_handler.get(url, timeout=2)
+        res = request_handler.get(url, timeout=2, max_retries=0)
         if res.status_code != 200:
             if res.status_code in [400, 404, 405, 500]:
                 json_data = res.json()
@@ -355,7 +580,7 @@ class Links(object, metaclass=SingletonType):
 
         # Fetch version
         url = "{}/unmanic/api/v2/version/read".format(address)
-        res = request_handler.get(url, timeout=2)
+        res = request_handler.get(url, timeout=2, max_retries=0)
         if res.status_code != 200:
             if res.status_code in [400, 404, 405, 500]:
                 json_data = res.json()
@@ -366,7 +591,7 @@ class Links(object, metaclass=SingletonType):
 
         # Fetch version
         url = "{}/unmanic/api/v2/session/state".format(address)
-        res = request_handler.get(url, timeout=2)
+        res = request_handler.get(url, timeout=2, max_retries=0)
         if res.status_code != 200:
             if res.status_code in [400, 404, 405, 500]:
                 json_data = res.json()
@@ -382,7 +607,7 @@ class Links(object, metaclass=SingletonType):
             "length": 1
         }
         url = "{}/unmanic/api/v2/pending/tasks".format(address)
-        res = request_handler.post(url, json=data, timeout=2)
+        res = request_handler.post(url, json=data, timeout=2, max_retries=0)
         if res.status_code != 200:
             if res.status_code in [400, 404, 405, 500]:
                 json_data = res.json()
@@ -435,46 +660,35 @@ class Links(object, metaclass=SingletonType):
                 save_settings = True
                 continue
 
-            # Fetch updated data
-            installation_data = None
+            # Fetch updated data. Only the sections that changed since the last run are transferred
+            sync_data = None
             try:
-                installation_data = self.validate_remote_installation(local_config.get('address'),
-                                                                      auth=local_config.get('auth'),
-                                                                      username=local_config.get('username'),
-                                                                      password=local_config.get('password'))
-            except Exception:
-                pass
+                sync_data = self.sync_remote_installation_link(local_config)
+            except requests.exceptions.RequestException as e:
+                self._log("Request to sync remote installation link failed", message2=str(e), level='debug')
+            except Exception as e:
+                self._log("Failed to sync remote installation link", message2=str(e), level='error')
 
             # Generate updated configured values
             updated_config = self.__generate_default_config(local_config)
             updated_config["available"] = False
-            if installation_data:
+            if sync_data:
                 # Mark the installation as available
                 updated_config["available"] = True
 
                 # Append the current task count
-                updated_config["task_count"] = installation_data.get('task_count', 0)
+                updated_config["task_count"] = sync_data.get('task_count', 0)
 
+                installation_info = sync_data['sections'].get('installation', {})
                 merge_dict = {
-                    "name":    installation_data.get('settings', {}).get('installation_name'),
-                    "version": installation_data.get('version'),
-                    "uuid":    installation_data.get('session', {}).get('uuid'),
+                    "name":    installation_info.get('name'),
+                    "version": installation_info.get('version'),
+                    "uuid":    installation_info.get('uuid'),
                 }
                 self.__merge_config_dicts(updated_config, merge_dict)
 
-                # Fetch the corresponding remote configuration for this local installation
-                remote_config = {}
-                try:
-                    remote_config = self.fetch_remote_installation_link_config_for_this(local_config)
-                except requests.exceptions.Timeout:
-                    self._log("Request to fetch remote installation config timed out", level='warning')
-                    updated_config["available"] = False
-                except requests.exceptions.RequestException as e:
-                    self._log("Request to fetch remote installation config failed", message2=str(e), level='warning')
-                    updated_config["available"] = False
-                except Exception as e:
-                    self._log("Failed to fetch remote installation config", message2=str(e), level='error')
-                    updated_config["available"] = False
+                # The corresponding remote configuration for this local installation
+                remote_config = sync_data['sections'].get('link_config', {})
 
                 # If the remote configuration is newer than this one, use those values
                 # The remote installation will do the same and this will synchronise
@@ -514,18 +728,25 @@ class Links(object, metaclass=SingletonType):
 
                 # Push library configurations for missing remote libraries (if configured to do so)
                 if local_config.get('enable_sending_tasks') and local_config.get('enable_config_missing_libraries'):
-                    # Fetch remote installation library name list
-                    results = self.remote_api_get(local_config, '/unmanic/api/v2/settings/libraries')
-                    existing_library_names = []
-                    for library in results.get('libraries', []):
-                        existing_library_names.append(library.get('name'))
-                    # Loop over local libraries and create an import object for each one that is missing
-                    for library in Library.get_all_libraries():
-                        # Ignore local libraries that are configured for remote only
-                        if library.get('enable_remote_only'):
-                            continue
-                        # For each of the missing libraries, create a new remote library with that config.
-                        if library.get('name') not in existing_library_names:
+                    # Only compare library lists when either side has changed since they were last found to match
+                    address = self.__format_address(local_config.get('address'))
+                    local_library_names = [library.get('name') for library in Library.get_all_libraries() if
+                                           not library.get('enable_remote_only')]
+                    local_libraries_revision = self.section_revision(local_library_names)
+                    cached = self._link_sync_cache.setdefault(address, {})
+                    libraries_changed = 'libraries' in sync_data['changed']
+                    if libraries_changed or cached.get('local_libraries_revision') != local_libraries_revision:
+                        all_libraries_configured = True
+                        existing_library_names = sync_data['sections'].get('libraries', [])
+                        # Loop over local libraries and create an import object for each one that is missing
+                        for library in Library.get_all_libraries():
+                            # Ignore local libraries that are configured for remote only
+                            if library.get('enable_remote_only'):
+                                continue
+                            # For each of the missing libraries, create a new remote library with that config.
+                            if library.get('name') in existing_library_names:
+                                continue
+                            all_libraries_configured = False
                             # Export library config
                             import_data = Library.export(library.get('id'))
                             # Set library ID to 0 to generate new library from this import
@@ -546,6 +767,8 @@ class Links(object, metaclass=SingletonType):
                                 continue
                             self._log("Failed to import library config '{}'".format(library.get('name')),
                                       message2=result.get('error'), level='error')
+                        if all_libraries_configured:
+                            cached['local_libraries_revision'] = local_libraries_revision
 
             # Only save to file if the settings have been updated
             remote_installations.append(updated_config)
@@ -636,6 +859,10 @@ class Links(object, metaclass=SingletonType):
             if remote_installation.get('uuid') == uuid:
                 # Mark the task as having successfully remoted the installation
                 removed = True
+                # Close any pooled connections to the installation
+                RemoteSessionPool().close_session(self.__format_address(remote_installation.get('address', '')))
+                # Forget the last synced state of the installation
+                self._link_sync_cache.pop(self.__format_address(remote_installation.get('address', '')), None)
                 continue
             # Only add remote installations that do not match
             updated_list.append(remote_installation)
@@ -673,6 +900,167 @@ class Links(object, metaclass=SingletonType):
                       message2=json_data.get('traceback', []), level='error')
         return {}
 
+    @staticmethod
+    def section_revision(data):
+        """
+        Returns a revision hash of a section of link sync data
+
+        :param data:
+        :return:
+        """
+        return hashlib.sha1(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def read_remote_installation_link_sync_state(self, uuid: str, revisions: dict = None):
+        """
+        Returns the link sync state of this installation for the remote installation with the given uuid.
+        Every section revision is returned, but only the data of sections that differ from the given revisions.
+
+        :param uuid:
+        :param revisions:
+        :return:
+        """
+        if revisions is None:
+            revisions = {}
+
+        link_config = {}
+        distributed_worker_count_target = 0
+        for remote_installation in self.settings.get_remote_installations():
+            if remote_installation.get('uuid') == uuid:
+                data = self.__generate_default_config(remote_installation)
+                link_config = {
+                    "address":                         data.get('address'),
+                    "auth":                            data.get('auth'),
+                    "username":                        data.get('username'),
+                    "password":                        data.get('password'),
+                    "available":                       data.get('available', False),
+                    "name":                            data.get('name'),
+                    "version":                         data.get('version'),
+                    "last_updated":                    data.get('last_updated', 1),
+                    "enable_receiving_tasks":          data.get('enable_receiving_tasks'),
+                    "enable_sending_tasks":            data.get('enable_sending_tasks'),
+                    "enable_task_preloading":          data.get('enable_task_preloading'),
+                    "preloading_count":                data.get('preloading_count'),
+                    "enable_checksum_validation":      data.get('enable_checksum_validation'),
+                    "enable_config_missing_libraries": data.get('enable_config_missing_libraries'),
+                    "enable_distributed_worker_count": data.get('enable_distributed_worker_count', False),
+                    "transfer_stream_count":           data.get('transfer_stream_count', 1),
+                    "transfer_chunk_size_mb":          data.get('transfer_chunk_size_mb', 8),
+                }
+                distributed_worker_count_target = data.get('distributed_worker_count_target', 0)
+                break
+
+        sections = {
+            'installation': {
+                "name":    self.settings.get_installation_name(),
+                "version": self.settings.read_version(),
+                "uuid":    self.session.uuid,
+            },
+            'link_config':  {
+                "link_config":                     link_config,
+                "distributed_worker_count_target": distributed_worker_count_target,
+            },
+            'libraries':    [library.get('name') for library in Library.get_all_libraries()],
+        }
+
+        section_revisions = {}
+        changed_sections = {}
+        for section, section_data in sections.items():
+            section_revisions[section] = self.section_revision(section_data)
+            if revisions.get(section) != section_revisions[section]:
+                changed_sections[section] = section_data
+
+        return {
+            'revision':   self.section_revision(section_revisions),
+            'revisions':  section_revisions,
+            'sections':   changed_sections,
+            'task_count': task.Task().get_total_task_list_count(),
+        }
+
+    def sync_remote_installation_link(self, local_config: dict):
+        """
+        Fetch the installation info, link config and library names of a remote installation.
+        The revisions of the last synced sections are sent with the request, so only the sections that
+        have changed since then are transferred. Unchanged sections are read from the cache.
+        Returns None if the remote installation could not be synced.
+
+        :param local_config:
+        :return:
+        """
+        request_handler = RequestHandler(
+            auth=local_config.get('auth'),
+            username=local_config.get('username'),
+            password=local_config.get('password'),
+        )
+        address = self.__format_address(local_config.get('address'))
+        url = "{}/unmanic/api/v2/settings/link/sync".format(address)
+        cached = self._link_sync_cache.get(address, {})
+        data = {
+            "uuid":      self.session.uuid,
+            "revisions": cached.get('revisions', {}),
+        }
+        res = request_handler.post(url, json=data, timeout=2)
+        if res.status_code == 404:
+            # This installation is running an older version without the link sync endpoint
+            return self.__sync_remote_installation_link_from_legacy(local_config)
+        elif res.status_code != 200:
+            if res.status_code in [400, 405, 500]:
+                json_data = res.json()
+                self._log("Error while syncing remote installation link. Message: '{}'".format(json_data.get('error')),
+                          message2=json_data.get('traceback', []), level='error')
+            return None
+        sync_state = res.json()
+
+        # Merge the changed sections into those from the last sync
+        sections = dict(cached.get('sections', {}))
+        sections.update(sync_state.get('sections', {}))
+        self._link_sync_cache[address] = {
+            'revisions':                sync_state.get('revisions', {}),
+            'sections':                 sections,
+            'local_libraries_revision': cached.get('local_libraries_revision'),
+        }
+        return {
+            'sections':   sections,
+            'changed':    list(sync_state.get('sections', {}).keys()),
+            'task_count': sync_state.get('task_count', 0),
+        }
+
+    def __sync_remote_installation_link_from_legacy(self, local_config: dict):
+        """
+        Fetch the link sync sections of a remote installation that does not support link sync.
+        Every section is fetched in full and reported as changed.
+
+        :param local_config:
+        :return:
+        """
+        installation_data = self.validate_remote_installation(local_config.get('address'),
+                                                              auth=local_config.get('auth'),
+                                                              username=local_config.get('username'),
+                                                              password=local_config.get('password'))
+        if not installation_data:
+            return None
+
+        # Only fetch the library list if it is needed
+        library_names = []
+        if local_config.get('enable_sending_tasks') and local_config.get('enable_config_missing_libraries'):
+            results = self.remote_api_get(local_config, '/unmanic/api/v2/settings/libraries')
+            for library in results.get('libraries', []):
+                library_names.append(library.get('name'))
+
+        sections = {
+            'installation': {
+                "name":    installation_data.get('settings', {}).get('installation_name'),
+                "version": installation_data.get('version'),
+                "uuid":    installation_data.get('session', {}).get('uuid'),
+            },
+            'link_config':  self.fetch_remote_installation_link_config_for_this(local_config),
+            'libraries':    library_names,
+        }
+        return {
+            'sections':   sections,
+            'changed':    list(sections.keys()),
+            'task_count': installation_data.get('task_count', 0),
+        }
+
     def push_remote_installation_link_config(self, configuration: dict):
         """
         Pushes the given link config to the remote installation returns the corresponding link configuration from a remote installation
@@ -724,9 +1112,131 @@ class Links(object, metaclass=SingletonType):
                       message2=json_data.get('traceback', []), level='error')
         return False
 
-    def check_remote_installation_for_available_workers(self):
+    def __fetch_remote_installation_capacity_from_status(self, remote_config: dict):
         """
-        Return a list of installations with workers available for a remote task.
+        Build the capacity of a remote installation that does not provide the capacity endpoint
+        from its worker status, pending tasks and library list
+
+        :param remote_config:
+        :return:
+        """
+        capacity = {
+            'worker_count':      0,
+            'idle_worker_count': 0,
+            'busy_worker_count': 0,
+            'pending_count':     0,
+            'library_names':     [],
+        }
+        results = self.remote_api_get(remote_config, '/unmanic/api/v2/workers/status')
+        for worker in results.get('workers_status', []):
+            capacity['worker_count'] += 1
+            if worker.get('idle') and not worker.get('paused'):
+                capacity['idle_worker_count'] += 1
+            elif not worker.get('idle'):
+                capacity['busy_worker_count'] += 1
+        results = self.remote_api_post(remote_config, '/unmanic/api/v2/pending/tasks', {
+            "start":  0,
+            "length": 1
+        })
+        if results.get('error'):
+            return None
+        capacity['pending_count'] = int(results.get('recordsFiltered', 0))
+        results = self.remote_api_get(remote_config, '/unmanic/api/v2/settings/libraries')
+        for library in results.get('libraries', []):
+            capacity['library_names'].append(library.get('name'))
+        return capacity
+
+    def fetch_remote_installation_capacity(self, remote_config: dict):
+        """
+        Fetch the worker, pending task and library capacity of a remote installation.
+        The last response is cached with its ETag so that an unchanged capacity is not sent again.
+
+        :param remote_config:
+        :return:
+        """
+        request_handler = RequestHandler(
+            auth=remote_config.get('auth'),
+            username=remote_config.get('username'),
+            password=remote_config.get('password'),
+        )
+        address = self.__format_address(remote_config.get('address'))
+        url = "{}/unmanic/api/v2/workers/capacity".format(address)
+        cached = self._remote_capacity_cache.get(address, {})
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached.get('etag')
+        res = request_handler.get(url, headers=headers, timeout=2)
+        if res.status_code == 304 and cached.get('capacity'):
+            return cached.get('capacity')
+        elif res.status_code == 200:
+            capacity = res.json()
+            self._remote_capacity_cache[address] = {
+                'etag':     res.headers.get('Etag'),
+                'capacity': capacity,
+            }
+            return capacity
+        elif res.status_code == 404:
+            # This installation is running an older version without the capacity endpoint
+            return self.__fetch_remote_installation_capacity_from_status(remote_config)
+        self._log("Error while fetching capacity of remote installation '{}'. Status: {}".format(address,
+                                                                                                 res.status_code),
+                  level='warning')
+        return None
+
+    def __build_available_installation_info(self, local_config: dict, capacity: dict):
+        """
+        Build the available installation info for a remote installation from its capacity.
+        Returns None if the installation can not take on any tasks.
+
+        :param local_config:
+        :param capacity:
+        :return:
+        """
+        # Only add installations that have not got pending tasks. This is unless we are configured to preload the queue
+        max_pending_tasks = 0
+        if local_config.get('enable_task_preloading'):
+            # Preload with the number of workers (regardless of the worker status) plus an additional one to account
+            # for delays in the downloads
+            max_pending_tasks = local_config.get('preloading_count')
+        current_pending_tasks = int(capacity.get('pending_count', 0))
+        if local_config.get('enable_task_preloading') and current_pending_tasks >= max_pending_tasks:
+            self._log("Remote installation has exceeded the max remote pending task count ({})".format(
+                current_pending_tasks), level='debug')
+            return None
+
+        # Ensure that worker count is more than 0
+        if not capacity.get('worker_count'):
+            return None
+        installation_info = {
+            "address":                local_config.get('address'),
+            "auth":                   local_config.get('auth'),
+            "username":               local_config.get('username'),
+            "password":               local_config.get('password'),
+            "enable_task_preloading": local_config.get('enable_task_preloading'),
+            "preloading_count":       local_config.get('preloading_count'),
+            "library_names":          list(capacity.get('library_names', [])),
+            # Add a slot for each worker regardless of its status
+            "available_slots":        int(capacity.get('worker_count')),
+        }
+
+        # If any workers are idle and not paused, or are busy with a task, then we have an available worker slot
+        available_workers = False
+        if capacity.get('idle_worker_count') or capacity.get('busy_worker_count'):
+            available_workers = True
+            installation_info['available_workers'] = True
+
+        # Check if this installation is configured for preloading
+        if available_workers and local_config.get('enable_task_preloading'):
+            # Add more slots to fill up the pending task queue
+            while not current_pending_tasks > max_pending_tasks:
+                installation_info['available_slots'] += 1
+                current_pending_tasks += 1
+        return installation_info
+
+    def poll_remote_installations_capacity(self):
+        """
+        Fetch the capacity of all linked installations concurrently and update the cached
+        list of installations with workers available for a remote task.
         This list is filtered by:
             - Only installations that are available
             - Only installations that are configured for sending tasks to
@@ -735,7 +1245,7 @@ class Links(object, metaclass=SingletonType):
 
         :return:
         """
-        installations_with_info = {}
+        local_configs = []
         for lc in self.settings.get_remote_installations():
             local_config = self.__generate_default_config(lc)
 
@@ -751,76 +1261,43 @@ class Links(object, metaclass=SingletonType):
             if len(local_config.get('uuid', '')) < 20:
                 continue
 
-            try:
-                # Define auth
-                # Only installations that have at least one idle worker that is not paused
-                results = self.remote_api_get(local_config, '/unmanic/api/v2/workers/status')
-                worker_list = results.get('workers_status', [])
-
-                # Only add installations that have not got pending tasks. This is unless we are configured to preload the queue
-                max_pending_tasks = 0
-                if local_config.get('enable_task_preloading'):
-                    # Preload with the number of workers (regardless of the worker status) plus an additional one to account
-                    # for delays in the downloads
-                    max_pending_tasks = local_config.get('preloading_count')
-                results = self.remote_api_post(local_config, '/unmanic/api/v2/pending/tasks', {
-                    "start":  0,
-                    "length": 1
-                })
-                if results.get('error'):
-                    continue
-                current_pending_tasks = int(results.get('recordsFiltered', 0))
-                if local_config.get('enable_task_preloading') and current_pending_tasks >= max_pending_tasks:
-                    self._log("Remote installation has exceeded the max remote pending task count ({})".format(
-                        current_pending_tasks), level='debug')
-                    continue
-
-                # Fetch remote installation library name list
-                results = self.remote_api_get(local_config, '/unmanic/api/v2/settings/libraries')
-                library_names = []
-                for library in results.get('libraries', []):
-                    library_names.append(library.get('name'))
-
-                # Ensure that worker count is more than 0
-                if len(worker_list):
-                    installations_with_info[local_config.get('uuid')] = {
-                        "address":                local_config.get('address'),
-                        "auth":                   local_config.get('auth'),
-                        "username":               local_config.get('username'),
-                        "password":               local_config.get('password'),
-                        "enable_task_preloading": local_config.get('enable_task_preloading'),
-                        "preloading_count":       local_config.get('preloading_count'),
-                        "library_names":          library_names,
-                        "available_slots":        0,
-                    }
-
-                available_workers = False
-                for worker in worker_list:
-                    # Add a slot for each worker regardless of its status
-                    installations_with_info[local_config.get('uuid')]['available_slots'] += 1
-                    if worker.get('idle') and not worker.get('paused'):
-                        # If any workers are idle and not paused then we have an available worker slot
-                        available_workers = True
-                        installations_with_info[local_config.get('uuid')]['available_workers'] = True
-                    elif not worker.get('idle'):
-                        # If any workers are busy with a task then also mark that as an an available worker slot
-                        available_workers = True
-                        installations_with_info[local_config.get('uuid')]['available_workers'] = True
-
-                # Check if this installation is configured for preloading
-                if available_workers and local_config.get('enable_task_preloading'):
-                    # Add more slots to fill up the pending task queue
-                    while not current_pending_tasks > max_pending_tasks:
-                        installations_with_info[local_config.get('uuid')]['available_slots'] += 1
-                        current_pending_tasks += 1
+            local_configs.append(local_config)
 
+        def probe(local_config):
+            try:
+                capacity = self.fetch_remote_installation_capacity(local_config)
+                if capacity:
+                    return self.__build_available_installation_info(local_config, capacity)
             except Exception as e:
-                self._log("Failed to contact remote installation '{}'".format(local_config.get('address')), message2=str(e),
-                          level='warning')
-                continue
+                self._log("Failed to contact remote installation '{}'".format(local_config.get('address')),
+                          message2=str(e), level='warning')
+            return None
 
+        installations_with_info = {}
+        if local_configs:
+            with ThreadPoolExecutor(max_workers=min(len(local_configs), self.max_capacity_probes)) as executor:
+                for local_config, installation_info in zip(local_configs, executor.map(probe, local_configs)):
+                    if installation_info:
+                        installations_with_info[local_config.get('uuid')] = installation_info
+
+        with self._available_installations_lock:
+            Links._available_installations = installations_with_info
+            Links._available_installations_updated = time.time()
         return installations_with_info
 
+    def check_remote_installation_for_available_workers(self):
+        """
+        Return the list of installations with workers available for a remote task.
+        This is read from the list cached by the last poll of the linked installations and does not block.
+        Returns an empty list if the cached list is stale.
+
+        :return:
+        """
+        with self._available_installations_lock:
+            if (time.time() - self._available_installations_updated) > self.available_installations_max_age:
+                return {}
+            return dict(self._available_installations)
+
     def within_enabled_link_limits(self, frontend_messages=None):
         """
         Ensure enabled plugins are within limits
@@ -908,7 +1385,10 @@ class Links(object, metaclass=SingletonType):
         :return:
         """
         try:
-            results = self.remote_api_post_file(remote_config, '/unmanic/api/v2/upload/pending/file', path)
+            results = self.remote_api_post_file_chunked(remote_config, path)
+            if results is None:
+                # Fall back to a single multipart upload for installations without resumable upload sessions
+                results = self.remote_api_post_file(remote_config, '/unmanic/api/v2/upload/pending/file', path)
             if results.get('error'):
                 results = {}
             return results
@@ -1652,3 +2132,42 @@ class RemoteTaskManager(threading.Thread):
 
         self.__write_failure_to_worker_log()
         return False
+
+
+class RemoteCapacityPoller(threading.Thread):
+    """
+    RemoteCapacityPoller
+
+    Periodically polls the capacity of all linked installations so that the
+    Foreman can read the list of installations with available workers
+    without waiting on the network.
+
+    """
+
+    poll_interval = 5
+
+    def __init__(self):
+        super(RemoteCapacityPoller, self).__init__(name='RemoteCapacityPoller')
+        self.links = Links()
+        self.abort_flag = threading.Event()
+        self.abort_flag.clear()
+        unmanic_logging = unlogger.UnmanicLogger.__call__()
+        self.logger = unmanic_logging.get_logger(self.name)
+
+    def _log(self, message, message2='', level="info"):
+        message = common.format_message(message, message2)
+        getattr(self.logger, level)(message)
+
+    def stop(self):
+        self.abort_flag.set()
+
+    def run(self):
+        self._log("Starting RemoteCapacityPoller loop", level='debug')
+        while not self.abort_flag.is_set():
+            try:
+                self.links.poll_remote_installations_capacity()
+            except Exception as e:
+                self._log("Exception while polling the capacity of linked installations", message2=str(e),
+                          level="exception")
+            self.abort_flag.wait(self.poll_interval)
+        self._log("Leaving RemoteCapacityPoller loop...", level='debug')
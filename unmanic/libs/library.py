@@ -33,6 +33,7 @@ import random
 
 from unmanic.config import Config
 from unmanic.libs import common
+from unmanic.libs.pluginflowcache import PluginFlowCache
 from unmanic.libs.unmodels import EnabledPlugins, Libraries, LibraryPluginFlow, Plugins, Tags, Tasks
 
 
@@ -240,7 +241,9 @@ class Library(object):
         """
         query = EnabledPlugins.delete()
         query = query.where(EnabledPlugins.library_id == self.model.id)
-        return query.execute()
+        result = query.execute()
+        PluginFlowCache().invalidate()
+        return result
 
     def __trim_plugin_flow(self, plugin_ids: list):
         """
@@ -251,7 +254,9 @@ class Library(object):
         """
         query = LibraryPluginFlow.delete()
         query = query.where((LibraryPluginFlow.library_id == self.model.id) & (LibraryPluginFlow.plugin_id.not_in(plugin_ids)))
-        return query.execute()
+        result = query.execute()
+        PluginFlowCache().invalidate()
+        return result
 
     def __remove_associated_tasks(self):
         """
@@ -460,6 +465,7 @@ class Library(object):
 
         # Insert plugins
         EnabledPlugins.insert_many(data).execute()
+        PluginFlowCache().invalidate()
 
         # Add default flow for newly added plugins
         self.__set_default_plugin_flow_priority(plugin_list)
@@ -30,7 +30,6 @@
 
 """
 import gc
-import json
 import os
 import queue
 import threading
@@ -41,8 +40,10 @@ import schedule
 
 from unmanic import config
 from unmanic.libs import common, unlogger
-from unmanic.libs.filetest import FileTesterThread
+from unmanic.libs.filestateindex import FileStateIndex
+from unmanic.libs.filetest import FileTesterThread, FileTestProcessPool
 from unmanic.libs.library import Library
+from unmanic.libs.librarywalker import LibraryWalker
 from unmanic.libs.plugins import PluginsHandler
 
 
@@ -195,9 +196,11 @@ class LibraryScannerManager(threading.Thread):
             'priority_score': priority_score,
         })
 
-    def start_results_manager_thread(self, manager_id, status_updates, library_id):
+    def start_results_manager_thread(self, manager_id, status_updates, library_id, file_index=None,
+                                     process_pool=None):
         manager = FileTesterThread("FileTesterThread-{}".format(manager_id), self.files_to_test,
-                                   self.files_to_process, status_updates, library_id, self.event)
+                                   self.files_to_process, status_updates, library_id, self.event,
+                                   file_index=file_index, process_pool=process_pool)
         manager.daemon = True
         manager.start()
         self.file_test_managers[manager_id] = manager
@@ -223,12 +226,30 @@ class LibraryScannerManager(threading.Thread):
         # Push status notification to frontend
         frontend_messages = self.data_queues.get('frontend_messages')
 
-        # Start X number of FileTesterThread threads
+        # Load the index of files tested in previous scans
+        file_index = FileStateIndex(library_id)
+        try:
+            file_index.load()
+        except Exception as e:
+            self._log("Unable to load file index for library ID {}".format(library_id), message2=str(e), level="exception")
+            file_index = None
+
+        # Optionally run the file test plugins in a pool of worker processes
         concurrent_file_testers = self.settings.get_concurrent_file_testers()
+        process_pool = None
+        if self.settings.get_enable_file_test_process_pool():
+            try:
+                process_pool = FileTestProcessPool(library_id, concurrent_file_testers)
+            except Exception as e:
+                self._log("Unable to start file test process pool. Testing files in threads", message2=str(e),
+                          level="exception")
+
+        # Start X number of FileTesterThread threads
         status_updates = queue.Queue()
         self.file_test_managers = {}
         for results_manager_id in range(int(concurrent_file_testers)):
-            self.start_results_manager_thread(results_manager_id, status_updates, library_id)
+            self.start_results_manager_thread(results_manager_id, status_updates, library_id, file_index=file_index,
+                                              process_pool=process_pool)
 
         start_time = time.time()
 
@@ -242,37 +263,19 @@ class LibraryScannerManager(threading.Thread):
             }
         )
 
-        follow_symlinks = self.settings.get_follow_symlinks()
+        # Walk the library path in the background, streaming discovered files into the test queue
+        # Each file is queued with its stat result so that the file index does not need to stat it again
+        walker = LibraryWalker(library_path, lambda path, file_stat: self.files_to_test.put((path, file_stat)),
+                               self.abort_flag,
+                               follow_symlinks=self.settings.get_follow_symlinks(),
+                               concurrency=self.settings.get_concurrent_directory_scanners(),
+                               debugging=self.settings.get_debugging(),
+                               stat_files=file_index is not None)
+        walker.start()
+
         total_file_count = 0
         current_file = ''
         percent_completed_string = ''
-        for root, subFolders, files in os.walk(library_path, followlinks=follow_symlinks):
-            if self.abort_flag.is_set():
-                break
-            if self.settings.get_debugging():
-                self._log(json.dumps(files, indent=2), level="debug")
-            # Add all files in this path that match our container filter
-            for file_path in files:
-                if self.abort_flag.is_set():
-                    break
-
-                # Place file's full path in queue to be tested
-                self.files_to_test.put(os.path.join(root, file_path))
-                total_file_count += 1
-
-                # Update status messages while fetching file list
-                if not status_updates.empty():
-                    current_file = status_updates.get()
-                    percent_completed_string = 'Testing: {}'.format(current_file)
-                    frontend_messages.update(
-                        {
-                            'id':      'libraryScanProgress',
-                            'type':    'status',
-                            'code':    'libraryScanProgress',
-                            'message': percent_completed_string,
-                            'timeout': 0
-                        }
-                    )
 
         # Loop while waiting for all threads to finish
         double_check = 0
@@ -286,8 +289,10 @@ class LibraryScannerManager(threading.Thread):
                     'timeout': 0
                 }
             )
-            # Check if all files have been tested
-            if self.files_to_test.empty() and self.files_to_process.empty() and status_updates.empty():
+            # Check if all files have been found and tested
+            walk_finished = walker.is_finished()
+            total_file_count = walker.file_count
+            if walk_finished and self.files_to_test.empty() and self.files_to_process.empty() and status_updates.empty():
                 percent_completed_string = '100%'
                 # Add a "double check" section.
                 # This is used to ensure that the loop does not prematurely exit when the last file tests still
@@ -301,7 +306,9 @@ class LibraryScannerManager(threading.Thread):
                 continue
 
             # Calculate percent of files tested
-            if not self.files_to_test.empty():
+            if not walk_finished:
+                percent_completed_string = 'Testing: {}'.format(current_file)
+            elif not self.files_to_test.empty():
                 current_queue_size = self.files_to_test.qsize()
                 if int(total_file_count) > 0 and int(current_queue_size) > 0:
                     percent_remaining = int((int(current_queue_size) / int(total_file_count)) * 100)
@@ -322,9 +329,17 @@ class LibraryScannerManager(threading.Thread):
                 self.event.wait(.1)
 
         # Wait for threads to finish
+        walker.join(2)
         for manager_id in self.file_test_managers:
             self.file_test_managers[manager_id].abort_flag.set()
             self.file_test_managers[manager_id].join(2)
+        if process_pool is not None:
+            process_pool.shutdown()
+
+        # Save the file index. Only prune entries for missing files if the scan was not aborted
+        if file_index is not None:
+            file_index.finish(prune=not self.abort_flag.is_set())
+            self._log("Skipped testing {} unchanged files".format(file_index.skipped_count), level="debug")
 
         self._log("Library scan completed in {} seconds".format((time.time() - start_time)), level="warning")
 
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.librarywalker.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (11:05 AM)
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import queue
+import threading
+
+from unmanic.libs import common, unlogger
+from unmanic.libs.unmanicignore import UnmanicIgnoreCache
+
+
+class LibraryWalker(object):
+    """
+    LibraryWalker
+
+    Walks a library path using a pool of threads.
+    Each thread lists a single directory at a time with os.scandir and pushes
+    any sub-directories back onto a shared queue for the other threads to pick up.
+    Discovered files are passed to the given callback as soon as they are found, along with
+    their os.stat_result if stat_files is set (otherwise None).
+
+    Symlinks are handled the same as os.walk:
+        - A symlink to a directory is only descended into if follow_symlinks is set.
+          A directory that can be reached through more than one symlink is walked under each path.
+        - Anything that is not a directory is reported as a file.
+    When following symlinks, a directory is not entered if it is already one of its own parents (a symlink loop).
+
+    Sub-directories listed in a '.unmanicignore' file are skipped without being listed.
+
+    """
+
+    def __init__(self, library_path, file_callback, abort_flag, follow_symlinks=True, concurrency=1, debugging=False,
+                 stat_files=False):
+        unmanic_logging = unlogger.UnmanicLogger.__call__()
+        self.logger = unmanic_logging.get_logger(__class__.__name__)
+
+        self.library_path = library_path
+        self.file_callback = file_callback
+        self.abort_flag = abort_flag
+        self.follow_symlinks = follow_symlinks
+        self.stat_files = stat_files
+        self.concurrency = max(1, int(concurrency))
+        self.debugging = debugging
+
+        self.directories = queue.Queue()
+        self.lock = threading.Lock()
+        self.pending_directories = 0
+        self.finished = threading.Event()
+        self.threads = []
+        self.file_count = 0
+        self.ignore_cache = UnmanicIgnoreCache()
+
+    def _log(self, message, message2='', level="info"):
+        message = common.format_message(message, message2)
+        getattr(self.logger, level)(message)
+
+    def __queue_directory(self, path, parent_directories=()):
+        if self.follow_symlinks:
+            # Guard against symlink loops by not entering a directory that is already one of its own parents.
+            # The real directories of the current path are tracked rather than every directory walked so that,
+            # like os.walk, a directory is walked under each path that it can be reached by
+            try:
+                dir_stat = os.stat(path)
+            except OSError:
+                return
+            dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+            if dir_key in parent_directories:
+                if self.debugging:
+                    self._log("Skipping symlink loop at directory '{}'".format(path), level="debug")
+                return
+            parent_directories = parent_directories + (dir_key,)
+        with self.lock:
+            self.pending_directories += 1
+        self.directories.put((path, parent_directories))
+
+    def __directory_done(self):
+        with self.lock:
+            self.pending_directories -= 1
+            if self.pending_directories <= 0:
+                self.finished.set()
+
+    def __scan_directory(self, path, parent_directories):
+        files = []
+        ignore_rules = self.ignore_cache.get_rules(path)
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if self.abort_flag.is_set():
+                        break
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(entry.name)
+                        file_stat = None
+                        if self.stat_files:
+                            try:
+                                file_stat = entry.stat()
+                            except OSError:
+                                pass
+                        self.file_callback(entry.path, file_stat)
+                        continue
+                    if not self.follow_symlinks:
+                        try:
+                            if entry.is_symlink():
+                                continue
+                        except OSError:
+                            continue
+                    if ignore_rules is not None and ignore_rules.matches(entry.name, is_dir=True):
+                        if self.debugging:
+                            self._log("Skipping ignored directory '{}'".format(entry.path), level="debug")
+                        continue
+                    self.__queue_directory(entry.path, parent_directories)
+        except OSError as e:
+            self._log("Unable to scan directory '{}'".format(path), message2=str(e), level="warning")
+        with self.lock:
+            self.file_count += len(files)
+        if self.debugging:
+            self._log("Scanned directory '{}' - {}".format(path, files), level="debug")
+
+    def __worker(self):
+        while not self.abort_flag.is_set() and not self.finished.is_set():
+            try:
+                path, parent_directories = self.directories.get(timeout=.2)
+            except queue.Empty:
+                continue
+            try:
+                self.__scan_directory(path, parent_directories)
+            finally:
+                self.__directory_done()
+
+    def start(self):
+        """
+        Start walking the library path in the background
+
+        :return:
+        """
+        self.__queue_directory(self.library_path)
+        if self.pending_directories == 0:
+            self.finished.set()
+            return
+        for i in range(self.concurrency):
+            thread = threading.Thread(target=self.__worker, name="LibraryWalker-{}".format(i), daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def is_finished(self):
+        """
+        Returns True once all directories have been scanned or the walk was aborted
+
+        :return:
+        """
+        return self.finished.is_set() or self.abort_flag.is_set()
+
+    def join(self, timeout=None):
+        for thread in self.threads:
+            thread.join(timeout)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.pluginflowcache.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (3:15 PM)
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import threading
+
+from unmanic.libs.singleton import SingletonType
+
+
+class PluginFlowCache(object, metaclass=SingletonType):
+    """
+    PluginFlowCache
+
+    In-memory cache of the resolved plugin modules for each (library_id, plugin_type) flow.
+
+    The cache is versioned. Any change to installed plugins, enabled plugins or plugin
+    flows must call invalidate(), which bumps the version and drops all entries.
+    A flow that was resolved while an invalidation happened is not stored.
+
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = 0
+        self.flows = {}
+
+    def get(self, library_id, plugin_type):
+        """
+        Return the cached plugin modules for a flow, or None if it is not cached
+
+        :param library_id:
+        :param plugin_type:
+        :return:
+        """
+        plugin_modules = self.flows.get((library_id, plugin_type))
+        if plugin_modules is None:
+            return None
+        return list(plugin_modules)
+
+    def get_version(self):
+        return self.version
+
+    def set(self, library_id, plugin_type, plugin_modules, version):
+        """
+        Store the resolved plugin modules for a flow.
+        Ignored if the cache was invalidated since the given version was read.
+
+        :param library_id:
+        :param plugin_type:
+        :param plugin_modules:
+        :param version:
+        :return:
+        """
+        with self.lock:
+            if version != self.version:
+                return
+            self.flows[(library_id, plugin_type)] = list(plugin_modules)
+
+    def invalidate(self):
+        """
+        Drop all cached plugin flows
+
+        :return:
+        """
+        with self.lock:
+            self.version += 1
+            self.flows = {}
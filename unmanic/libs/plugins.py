@@ -42,6 +42,7 @@ import requests
 from unmanic import config
 from unmanic.libs import common, unlogger
 from unmanic.libs.library import Library
+from unmanic.libs.pluginflowcache import PluginFlowCache
 from unmanic.libs.session import Session
 from unmanic.libs.singleton import SingletonType
 from unmanic.libs.unmodels import EnabledPlugins, LibraryPluginFlow, Plugins, PluginRepos
@@ -498,6 +499,9 @@ class PluginsHandler(object, metaclass=SingletonType):
             # Insert a new entry
             Plugins.insert(plugin_data).execute()
 
+        # Plugin metadata is included in the cached plugin flows
+        PluginFlowCache().invalidate()
+
         return True
 
     def get_total_plugin_list_count(self):
@@ -620,7 +624,9 @@ class PluginsHandler(object, metaclass=SingletonType):
         EnabledPlugins.delete().where(EnabledPlugins.plugin_id.in_(plugin_table_ids)).execute()
 
         # Delete by ID in DB
-        if not Plugins.delete().where(Plugins.id.in_(plugin_table_ids)).execute():
+        result = Plugins.delete().where(Plugins.id.in_(plugin_table_ids)).execute()
+        PluginFlowCache().invalidate()
+        if not result:
             return False
 
         return True
@@ -671,6 +677,7 @@ class PluginsHandler(object, metaclass=SingletonType):
             if not plugin_flow:
                 success = False
 
+        PluginFlowCache().invalidate()
         return success
 
     @staticmethod
@@ -694,10 +701,11 @@ class PluginsHandler(object, metaclass=SingletonType):
             'position':    priority,
         }
         plugin_flow = LibraryPluginFlow.create(**flow_dict)
+        PluginFlowCache().invalidate()
 
         return plugin_flow
 
-    def get_enabled_plugin_modules_by_type(self, plugin_type, library_id=None):
+    def get_enabled_plugin_modules_by_type(self, plugin_type, library_id=None, refresh_session=True):
         """
         Return a list of enabled plugin modules when given a plugin type
 
@@ -707,13 +715,23 @@ class PluginsHandler(object, metaclass=SingletonType):
         If no library ID is provided, this will return all installed plugins for that type.
         This case should only be used for plugin runner types that are not associated with a library.
 
+        Resolved flows are cached until the installed plugins, enabled plugins or plugin flows change.
+
         :param plugin_type:
         :param library_id:
+        :param refresh_session:
         :return:
         """
+        plugin_flow_cache = PluginFlowCache()
+        plugin_data = plugin_flow_cache.get(library_id, plugin_type)
+        if plugin_data is not None:
+            return plugin_data
+        cache_version = plugin_flow_cache.get_version()
+
         # Refresh session
-        s = Session()
-        s.register_unmanic()
+        if refresh_session:
+            s = Session()
+            s.register_unmanic()
 
         # First fetch all enabled plugins
         order = [
@@ -732,6 +750,7 @@ class PluginsHandler(object, metaclass=SingletonType):
         # Fetch all plugin modules from the given list of enabled plugins
         plugin_executor = PluginExecutor()
         plugin_data = plugin_executor.get_plugin_data_by_type(enabled_plugins, plugin_type)
+        plugin_flow_cache.set(library_id, plugin_type, plugin_data, cache_version)
 
         # Return modules
         return plugin_data
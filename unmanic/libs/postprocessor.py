@@ -35,7 +35,7 @@ import threading
 import time
 
 from unmanic import config
-from unmanic.libs import common, history
+from unmanic.libs import common, filecopy, history
 from unmanic.libs.library import Library
 from unmanic.libs.notifications import Notifications
 from unmanic.libs.plugins import PluginsHandler
@@ -74,6 +74,8 @@ class PostProcessor(threading.Thread):
         self.task_queue = task_queue
         self.abort_flag = threading.Event()
         self.current_task = None
+        self.current_task_checksum = None
+        self.unusable_checksum_algorithm = None
         self.ffmpeg = None
         self.abort_flag.clear()
 
@@ -96,6 +98,7 @@ class PostProcessor(threading.Thread):
             while not self.abort_flag.is_set() and not self.task_queue.task_list_processed_is_empty():
                 self.event.wait(.2)
                 self.current_task = self.task_queue.get_next_processed_tasks()
+                self.current_task_checksum = None
                 if self.current_task:
                     try:
                         self._log("Post-processing task - {}".format(self.current_task.get_source_abspath()))
@@ -134,6 +137,9 @@ class PostProcessor(threading.Thread):
                         except Exception as e:
                             self._log("Exception in marking remote task as complete", message2=str(e), level="exception")
 
+                    # Let the Foreman know that the post-processor queue has drained by one
+                    self.task_queue.trigger_dispatch()
+
         self._log("Leaving PostProcessor Monitor loop...")
 
     def system_configuration_is_valid(self):
@@ -330,6 +336,26 @@ class PostProcessor(threading.Thread):
             except Exception as e:
                 self._log("Exception while clearing cache path '{}'".format(str(e)), level='error')
 
+    def __get_checksum_algorithm(self):
+        """
+        Return the configured checksum algorithm for file movements.
+        If the algorithm can not be used, a warning is logged and None is returned so that files are moved without one.
+
+        :return:
+        """
+        checksum_algorithm = self.settings.get_file_checksum_algorithm()
+        if not checksum_algorithm:
+            return None
+        try:
+            common.get_file_hasher(checksum_algorithm)
+        except ValueError as e:
+            # Only warn once for each unusable setting
+            if self.unusable_checksum_algorithm != checksum_algorithm:
+                self.unusable_checksum_algorithm = checksum_algorithm
+                self._log("Files will be moved without a checksum", message2=str(e), level='warning')
+            return None
+        return checksum_algorithm
+
     def __copy_file(self, file_in, file_out, destination_files, plugin_id, move=False):
         if move:
             self._log("Move file triggered by ({}) {} --> {}".format(plugin_id, file_in, file_out))
@@ -343,33 +369,40 @@ class PostProcessor(threading.Thread):
                           level="warning")
                 return False
 
-            # Get a checksum prior to copy
             if not os.path.exists(file_in):
                 self._log("The file_in path does not exist! '{}'".format(file_in), level="warning")
                 self.event.wait(1)
-            self._log("Fetching checksum of source file '{}'.".format(file_in), level='debug')
 
             # Use a '.part' suffix for the file movement, then rename it after
             part_file_out = os.path.join("{}.unmanic.part".format(file_out))
-
-            # Carry out the file movement
+            if os.path.exists(part_file_out):
+                os.remove(part_file_out)
+
+            # Carry out the file movement.
+            # The data is written once to the '.part' file which is in the same directory as the final destination
+            buffer_size = int(self.settings.get_file_copy_buffer_size_mb()) * 1024 * 1024
+            # If configured, a checksum of the data is calculated while it is copied
+            checksum_algorithm = self.__get_checksum_algorithm()
             if move:
                 self._log("Moving file '{}' --> '{}'.".format(file_in, part_file_out), level='debug')
-                if os.path.exists(part_file_out):
-                    os.remove(part_file_out)
-                shutil.move(file_in, part_file_out, copy_function=shutil.copyfile)
+                copy_result = filecopy.move_file_data(file_in, part_file_out, buffer_size=buffer_size,
+                                                      checksum_algorithm=checksum_algorithm)
             else:
                 self._log("Copying file '{}' --> '{}'.".format(file_in, part_file_out), level='debug')
-                shutil.copyfile(file_in, part_file_out)
-
-            # Remove dest file if it already exists (required only for moves)
-            if os.path.exists(file_out):
-                self._log("The file_out path already exists. Removing file '{}'".format(file_out), level="debug")
-                os.remove(file_out)
-
-            # Move file from part to final destination
+                copy_result = filecopy.copy_file_data(file_in, part_file_out, buffer_size=buffer_size,
+                                                      checksum_algorithm=checksum_algorithm)
+            if copy_result.get('checksum'):
+                self.current_task_checksum = "{}:{}".format(checksum_algorithm, copy_result.get('checksum'))
+            copy_summary = filecopy.format_copy_result(copy_result)
+            self._log("File {} complete ({}).".format('move' if move else 'copy', copy_summary), level='debug')
+
+            # Move file from part to final destination. This replaces the destination file if it already exists
             self._log("Renaming file '{}' --> '{}'.".format(part_file_out, file_out), level='debug')
-            shutil.move(part_file_out, file_out, copy_function=shutil.copyfile)
+            os.replace(part_file_out, file_out)
+
+            # Record the copy method and throughput in the task log
+            self.__append_to_task_log("\n\nPOST-PROCESSOR FILE {} ({}):\n'{}' --> '{}'\n{}\n".format(
+                'MOVE' if move else 'COPY', plugin_id, file_in, file_out, copy_summary))
             # Write final path to destination_files list
             destination_files.append(file_out)
             # Mark move process a success
@@ -381,6 +414,18 @@ class PostProcessor(threading.Thread):
 
         return file_move_processes_success
 
+    def __append_to_task_log(self, text):
+        """
+        Append a line to the current task's log so that it is included in the history log
+
+        :param text:
+        :return:
+        """
+        try:
+            self.current_task.save_command_log([text])
+        except Exception as e:
+            self._log("Exception while appending to task log", message2=str(e), level="exception")
+
     def write_history_log(self):
         """
         Record task history
@@ -418,6 +463,7 @@ class PostProcessor(threading.Thread):
                 'finish_time':         task_dump.get('finish_time', ''),
                 'processed_by_worker': task_dump.get('processed_by_worker', ''),
                 'log':                 task_dump.get('log', ''),
+                'checksum':            self.current_task_checksum,
             }
         )
 
@@ -437,7 +483,7 @@ class PostProcessor(threading.Thread):
                 'finish_time':         task_dump.get('finish_time', ''),
                 'processed_by_worker': task_dump.get('processed_by_worker', ''),
                 'log':                 task_dump.get('log', ''),
-                'checksum':            'UNKNOWN',
+                'checksum':            self.current_task_checksum or 'UNKNOWN',
             }
             , tasks_data_file)
         if not result['success']:
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.probecache.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (10:24 AM)
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from unmanic import config
+from unmanic.libs import common, unlogger
+from unmanic.libs.singleton import SingletonType
+from unmanic.libs.unffmpeg.lib import cli
+
+
+class ProbeCache(object, metaclass=SingletonType):
+    """
+    ProbeCache
+
+    Cache of ffprobe results keyed by the path, size, mtime and inode of a file.
+    A file is only probed again once its content changes.
+
+    Results are held in an in-memory LRU backed by one JSON file per path in
+    the config directory. The disk tier is shared between processes and is
+    pruned of its least recently used entries once it grows beyond
+    'disk_max_entries'.
+
+    """
+
+    memory_max_entries = 1000
+    disk_max_entries = 20000
+    disk_prune_interval = 500
+
+    def __init__(self):
+        self.logger = None
+        self.lock = threading.Lock()
+        self.memory = OrderedDict()
+        self.cache_directory = None
+        self.disk_writes = 0
+
+    def _log(self, message, message2='', level="info"):
+        if not self.logger:
+            unmanic_logging = unlogger.UnmanicLogger.__call__()
+            self.logger = unmanic_logging.get_logger(__class__.__name__)
+        message = common.format_message(message, message2)
+        getattr(self.logger, level)(message)
+
+    @staticmethod
+    def stat_file(path):
+        """
+        Return the (size, mtime, inode) tuple used to identify the content of a file.
+        Returns None if the file could not be read.
+
+        :param path:
+        :return:
+        """
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return None
+        return file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino
+
+    def get_cache_directory(self):
+        if self.cache_directory is None:
+            settings = config.Config()
+            self.cache_directory = os.path.join(settings.get_config_path(), 'probe_cache')
+        return self.cache_directory
+
+    def __disk_entry_path(self, path):
+        name = hashlib.sha1(path.encode('utf8', 'surrogateescape')).hexdigest()
+        return os.path.join(self.get_cache_directory(), name[:2], '{}.json'.format(name))
+
+    def __set_memory_entry(self, path, file_stat, probe):
+        with self.lock:
+            self.memory[path] = (file_stat, probe)
+            self.memory.move_to_end(path)
+            while len(self.memory) > self.memory_max_entries:
+                self.memory.popitem(last=False)
+
+    def __read_disk_entry(self, path, file_stat):
+        entry_path = self.__disk_entry_path(path)
+        try:
+            with open(entry_path, 'r') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._log("Unable to read probe cache entry '{}'".format(entry_path), message2=str(e), level="debug")
+            return None
+        if entry.get('path') != path or tuple(entry.get('stat', [])) != file_stat:
+            # The file has changed since this entry was written
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+            return None
+        # Mark this entry as recently used
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return entry.get('probe')
+
+    def __write_disk_entry(self, path, file_stat, probe):
+        entry_path = self.__disk_entry_path(path)
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), prefix='.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({'path': path, 'stat': list(file_stat), 'probe': probe}, f)
+                os.replace(tmp_path, entry_path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+        except Exception as e:
+            self._log("Unable to write probe cache entry '{}'".format(entry_path), message2=str(e), level="debug")
+            return
+        with self.lock:
+            self.disk_writes += 1
+            prune = (self.disk_writes % self.disk_prune_interval) == 0
+        if prune:
+            self.prune_disk()
+
+    def prune_disk(self):
+        """
+        Remove the least recently used disk entries once there are more than 'disk_max_entries'
+
+        :return:
+        """
+        entries = []
+        cache_directory = self.get_cache_directory()
+        if not os.path.exists(cache_directory):
+            return
+        for shard in os.scandir(cache_directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+        if len(entries) <= self.disk_max_entries:
+            return
+        # Trim to 90% of the limit so that pruning does not run on every subsequent write
+        entries.sort()
+        remove_count = len(entries) - int(self.disk_max_entries * 0.9)
+        for mtime, entry_path in entries[:remove_count]:
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+        self._log("Pruned {} entries from the probe cache".format(remove_count), level="debug")
+
+    def get(self, path, file_stat=None):
+        """
+        Return the cached probe for a file, or None if the current content of the file has not been probed
+
+        :param path:
+        :param file_stat:
+        :return:
+        """
+        if file_stat is None:
+            file_stat = self.stat_file(path)
+            if file_stat is None:
+                return None
+        with self.lock:
+            entry = self.memory.get(path)
+            if entry is not None:
+                if entry[0] == file_stat:
+                    self.memory.move_to_end(path)
+                    return copy.deepcopy(entry[1])
+                del self.memory[path]
+        probe = self.__read_disk_entry(path, file_stat)
+        if probe is None:
+            return None
+        self.__set_memory_entry(path, file_stat, probe)
+        return copy.deepcopy(probe)
+
+    def set(self, path, probe, file_stat=None):
+        """
+        Store the probe of a file
+
+        :param path:
+        :param probe:
+        :param file_stat:
+        :return:
+        """
+        if file_stat is None:
+            file_stat = self.stat_file(path)
+            if file_stat is None:
+                return
+        probe = copy.deepcopy(probe)
+        self.__set_memory_entry(path, file_stat, probe)
+        self.__write_disk_entry(path, file_stat, probe)
+
+    def probe(self, path):
+        """
+        Return the ffprobe result for a file, only running ffprobe if the file has not been probed before
+
+        :param path:
+        :return:
+        """
+        file_stat = self.stat_file(path)
+        if file_stat is not None:
+            probe = self.get(path, file_stat=file_stat)
+            if probe is not None:
+                return probe
+        probe = cli.ffprobe_file(path)
+        if file_stat is not None:
+            # Use the stat taken before probing. If the file changed in the mean time it will be probed again next time.
+            self.set(path, probe, file_stat=file_stat)
+        return probe
+
+    def populate_shared_info(self, path, shared_info):
+        """
+        Add a cached probe of the file to a plugin runner's 'shared_info' under the 'ffprobe' key.
+        This does not run ffprobe if no cached probe exists.
+
+        :param path:
+        :param shared_info:
+        :return:
+        """
+        if shared_info.get('ffprobe'):
+            return
+        probe = self.get(path)
+        if probe is not None:
+            shared_info['ffprobe'] = probe
+
+    def store_shared_info(self, path, shared_info):
+        """
+        Store a probe of the file that a plugin runner added to 'shared_info' under the 'ffprobe' key.
+        Only probes that ffprobe reports were run against this path are stored.
+
+        :param path:
+        :param shared_info:
+        :return:
+        """
+        probe = shared_info.get('ffprobe')
+        if not isinstance(probe, dict):
+            return
+        probe_format = probe.get('format')
+        if not isinstance(probe_format, dict) or probe_format.get('filename') != path:
+            return
+        file_stat = self.stat_file(path)
+        if file_stat is None:
+            return
+        with self.lock:
+            entry = self.memory.get(path)
+        if entry is not None and entry[0] == file_stat:
+            # Already cached
+            return
+        self.set(path, probe, file_stat=file_stat)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.remotesessions.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (12:30 PM)
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import re
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from unmanic.libs.singleton import SingletonType
+
+
+def endpoint_pattern(path):
+    """
+    Reduce a request path to a pattern shared by all requests to the same endpoint
+    by replacing numeric and hex IDs with '{id}'
+
+    :param path:
+    :return:
+    """
+    parts = []
+    for part in path.split('/'):
+        if re.match(r'^(\d+|[0-9a-f]{32}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$', part):
+            part = '{id}'
+        parts.append(part)
+    return '/'.join(parts)
+
+
+class RemoteSessionPool(object, metaclass=SingletonType):
+    """
+    RemoteSessionPool
+
+    One pooled 'requests' session per remote installation so that repeated API
+    calls reuse keep-alive connections rather than opening a new connection
+    for every request.
+
+    Failed connections are retried with a backoff. GET and DELETE requests are
+    also retried on read errors and on 502, 503 and 504 responses. PUT requests
+    are only retried when the connection could not be made as their request
+    body may already have been sent.
+
+    Callers that retry on their own, or that need to fail fast, can pass
+    'max_retries' to a request to override the number of retries.
+
+    The latency of every request is recorded per installation and endpoint.
+
+    """
+
+    pool_maxsize = 20
+    retry_total = 3
+    retry_backoff_factor = 0.5
+    retry_status_forcelist = (502, 503, 504)
+    retry_allowed_methods = frozenset(['GET', 'DELETE'])
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.metrics = {}
+
+    @staticmethod
+    def get_base_url(url):
+        split_url = urlsplit(url)
+        return "{}://{}".format(split_url.scheme, split_url.netloc.lower())
+
+    def __new_session(self, max_retries=None):
+        total = self.retry_total if max_retries is None else max_retries
+        retries = Retry(
+            total=total,
+            backoff_factor=self.retry_backoff_factor,
+            status_forcelist=self.retry_status_forcelist,
+            allowed_methods=self.retry_allowed_methods,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=retries)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def get_session(self, url, max_retries=None):
+        """
+        Return the pooled session for the installation serving the given URL.
+        Each number of retries requested for an installation has its own session.
+
+        :param url:
+        :param max_retries:
+        :return:
+        """
+        session_key = (self.get_base_url(url), max_retries)
+        with self.lock:
+            session = self.sessions.get(session_key)
+            if session is None:
+                session = self.__new_session(max_retries=max_retries)
+                self.sessions[session_key] = session
+            return session
+
+    def close_session(self, url):
+        """
+        Close the pooled sessions for an installation.
+        A new session is created the next time a request is made.
+
+        :param url:
+        :return:
+        """
+        base_url = self.get_base_url(url)
+        with self.lock:
+            session_keys = [key for key in self.sessions if key[0] == base_url]
+            sessions = [self.sessions.pop(key) for key in session_keys]
+        for session in sessions:
+            session.close()
+
+    def request(self, method, url, max_retries=None, **kwargs):
+        """
+        Send a request through the pooled session for the installation and record its latency
+
+        :param method:
+        :param url:
+        :param max_retries:
+        :param kwargs:
+        :return:
+        """
+        session = self.get_session(url, max_retries=max_retries)
+        start_time = time.monotonic()
+        error = True
+        try:
+            res = session.request(method, url, **kwargs)
+            error = res.status_code >= 500
+            return res
+        finally:
+            self.__record(method, url, time.monotonic() - start_time, error)
+
+    def __record(self, method, url, elapsed, error):
+        base_url = self.get_base_url(url)
+        endpoint = "{} {}".format(method, endpoint_pattern(urlsplit(url).path))
+        elapsed_ms = elapsed * 1000
+        with self.lock:
+            endpoint_metrics = self.metrics.setdefault(base_url, {}).setdefault(endpoint, {
+                'count':          0,
+                'errors':         0,
+                'total_ms':       0.0,
+                'max_ms':         0.0,
+                'last_ms':        0.0,
+                'last_requested': 0,
+            })
+            endpoint_metrics['count'] += 1
+            if error:
+                endpoint_metrics['errors'] += 1
+            endpoint_metrics['total_ms'] += elapsed_ms
+            endpoint_metrics['max_ms'] = max(endpoint_metrics['max_ms'], elapsed_ms)
+            endpoint_metrics['last_ms'] = elapsed_ms
+            endpoint_metrics['last_requested'] = time.time()
+
+    def get_metrics(self, url):
+        """
+        Return the request latency metrics for each endpoint of an installation
+
+        :param url:
+        :return:
+        """
+        with self.lock:
+            installation_metrics = self.metrics.get(self.get_base_url(url), {})
+            results = []
+            for endpoint in sorted(installation_metrics):
+                endpoint_metrics = installation_metrics[endpoint]
+                results.append({
+                    'endpoint':       endpoint,
+                    'count':          endpoint_metrics['count'],
+                    'errors':         endpoint_metrics['errors'],
+                    'avg_ms':         round(endpoint_metrics['total_ms'] / endpoint_metrics['count'], 2),
+                    'max_ms':         round(endpoint_metrics['max_ms'], 2),
+                    'last_ms':        round(endpoint_metrics['last_ms'], 2),
+                    'last_requested': endpoint_metrics['last_requested'],
+                })
+            return results
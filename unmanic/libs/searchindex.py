@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.searchindex.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (10:52 AM)
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import threading
+
+from peewee import SQL
+
+# The text columns of each table that are indexed for substring search
+SEARCH_INDEXES = {
+    'tasks':          'abspath',
+    'completedtasks': 'task_label',
+}
+
+# The trigram tokenizer cannot match search values shorter than this
+MIN_SEARCH_LENGTH = 3
+
+_available_indexes = {}
+_available_indexes_lock = threading.Lock()
+
+
+def search_index_name(table_name):
+    return '{}_fts'.format(table_name)
+
+
+def create_search_indexes(database, logger=None):
+    """
+    Create an FTS5 trigram index for each table in SEARCH_INDEXES.
+
+    The indexes are external content tables kept in sync with their source table
+    by triggers, so every insert, update and delete (including bulk and cascading
+    ones) is applied without any changes to the code writing the rows.
+    An index is rebuilt from the existing rows whenever it or any of its triggers
+    had to be created.
+
+    If this SQLite build does not support FTS5 or the trigram tokenizer,
+    no indexes are created and searches fall back to LIKE.
+
+    :param database:
+    :param logger:
+    :return:
+    """
+    for table_name, column in SEARCH_INDEXES.items():
+        index_name = search_index_name(table_name)
+        statements = {
+            index_name:             "CREATE VIRTUAL TABLE {index} USING fts5("
+                                    "{column}, content='{table}', content_rowid='id', tokenize='trigram')",
+            index_name + '_insert': "CREATE TRIGGER {index}_insert AFTER INSERT ON {table} BEGIN "
+                                    "INSERT INTO {index}(rowid, {column}) VALUES (new.id, new.{column}); "
+                                    "END",
+            index_name + '_delete': "CREATE TRIGGER {index}_delete AFTER DELETE ON {table} BEGIN "
+                                    "INSERT INTO {index}({index}, rowid, {column}) "
+                                    "VALUES ('delete', old.id, old.{column}); "
+                                    "END",
+            index_name + '_update': "CREATE TRIGGER {index}_update AFTER UPDATE OF {column} ON {table} BEGIN "
+                                    "INSERT INTO {index}({index}, rowid, {column}) "
+                                    "VALUES ('delete', old.id, old.{column}); "
+                                    "INSERT INTO {index}(rowid, {column}) VALUES (new.id, new.{column}); "
+                                    "END",
+        }
+        try:
+            cursor = database.execute_sql("SELECT name FROM sqlite_master WHERE name IN ({})".format(
+                ', '.join('?' for _ in statements)), list(statements))
+            existing = set(row[0] for row in cursor.fetchall())
+            if len(existing) == len(statements):
+                continue
+            with database.atomic():
+                for name, statement in statements.items():
+                    if name not in existing:
+                        database.execute_sql(statement.format(index=index_name, table=table_name, column=column))
+                # Index all existing rows
+                database.execute_sql("INSERT INTO {index}({index}) VALUES ('rebuild')".format(index=index_name))
+        except Exception as e:
+            if logger:
+                logger.warning(
+                    "Unable to create search index for table '{}'. Falling back to LIKE searches - {}".format(
+                        table_name, str(e)))
+
+
+def search_index_available(model):
+    """
+    Check if a search index exists for the given model's table
+
+    :param model:
+    :return:
+    """
+    table_name = model._meta.table_name
+    with _available_indexes_lock:
+        if table_name not in _available_indexes:
+            available = False
+            if table_name in SEARCH_INDEXES:
+                available = model._meta.database.table_exists(search_index_name(table_name))
+            _available_indexes[table_name] = available
+        return _available_indexes[table_name]
+
+
+def search_condition(model, search_value):
+    """
+    Return a query condition matching rows of the model whose indexed column contains the search value.
+    Uses the table's search index when possible, otherwise a LIKE '%value%' comparison.
+
+    :param model:
+    :param search_value:
+    :return:
+    """
+    field = getattr(model, SEARCH_INDEXES[model._meta.table_name])
+    if len(search_value) < MIN_SEARCH_LENGTH or not search_index_available(model):
+        return field.contains(search_value)
+    # Quote the value so that it is matched as a literal substring rather than parsed as an FTS5 query
+    match_value = '"{}"'.format(search_value.replace('"', '""'))
+    index_name = search_index_name(model._meta.table_name)
+    return model.id.in_(
+        SQL("(SELECT rowid FROM {index} WHERE {index} MATCH ?)".format(index=index_name), [match_value]))
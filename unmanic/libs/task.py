@@ -35,10 +35,11 @@ import shutil
 import time
 from operator import attrgetter
 
+from peewee import Tuple
 from playhouse.shortcuts import model_to_dict
 
 from unmanic import config
-from unmanic.libs import common, unlogger
+from unmanic.libs import common, searchindex, unlogger
 from unmanic.libs.library import Library
 from unmanic.libs.unmodels.tasks import IntegrityError, Tasks
 
@@ -317,11 +318,28 @@ class Task(object):
         self.task.delete_instance()
 
     def get_total_task_list_count(self):
-        task_query = Tasks.select().order_by(Tasks.id.desc())
-        return task_query.count()
+        # The count does not need ordering, so do not sort the whole table to get it
+        return Tasks.select().count()
 
     def get_task_list_filtered_and_sorted(self, order=None, start=0, length=None, search_value=None, id_list=None,
-                                          status=None, task_type=None):
+                                          status=None, task_type=None, cursor=None):
+        """
+        Return a filtered and sorted query of tasks.
+
+        Results are ordered by the requested column and then by ID.
+        If a cursor of (column value, ID) from the last row of a previous page is given,
+        the page starts after that row rather than at the 'start' offset.
+
+        :param order:
+        :param start:
+        :param length:
+        :param search_value:
+        :param id_list:
+        :param status:
+        :param task_type:
+        :param cursor:
+        :return:
+        """
         try:
             query = (Tasks.select())
 
@@ -329,7 +347,7 @@ class Task(object):
                 query = query.where(Tasks.id.in_(id_list))
 
             if search_value:
-                query = query.where(Tasks.abspath.contains(search_value))
+                query = query.where(searchindex.search_condition(Tasks, search_value))
 
             if status:
                 query = query.where(Tasks.status.in_([status]))
@@ -340,13 +358,20 @@ class Task(object):
             # Get order by
             order_by = None
             if order:
+                order_column = attrgetter(order.get("column"))(Tasks)
                 if order.get("dir") == "asc":
-                    order_by = attrgetter(order.get("column"))(Tasks).asc()
+                    order_by = [order_column.asc(), Tasks.id.asc()]
+                    if cursor:
+                        query = query.where(Tuple(order_column, Tasks.id) > Tuple(*cursor))
                 else:
-                    order_by = attrgetter(order.get("column"))(Tasks).desc()
+                    order_by = [order_column.desc(), Tasks.id.desc()]
+                    if cursor:
+                        query = query.where(Tuple(order_column, Tasks.id) < Tuple(*cursor))
 
             if order_by and length:
-                query = query.order_by(order_by).limit(length).offset(start)
+                query = query.order_by(*order_by).limit(length)
+                if not cursor:
+                    query = query.offset(start)
 
         except Tasks.DoesNotExist:
             # No task entries exist yet
@@ -34,8 +34,11 @@ import queue
 import threading
 import time
 
+from peewee import chunked
+
 from unmanic import config
 from unmanic.libs import common, task
+from unmanic.libs.library import Library
 from unmanic.libs.unmodels.tasks import Tasks
 
 
@@ -54,6 +57,9 @@ class TaskHandler(threading.Thread):
             -
     """
 
+    bulk_insert_batch_size = 500
+    bulk_insert_chunk_size = 100
+
     def __init__(self, data_queues, task_queue, event):
         super(TaskHandler, self).__init__(name='TaskHandler')
         self.settings = config.Config()
@@ -77,6 +83,10 @@ class TaskHandler(threading.Thread):
 
     def run(self):
         self._log("Starting TaskHandler Monitor loop")
+        # Tasks are not created in a transaction. Remove any left incomplete by a previous run
+        removed_count = self.remove_incomplete_tasks()
+        if removed_count:
+            self._log("Removed {} incomplete tasks left by a previous run".format(removed_count), level='warning')
         while not self.abort_flag.is_set():
             self.event.wait(2)
             self.process_scheduledtasks_queue()
@@ -85,23 +95,37 @@ class TaskHandler(threading.Thread):
         self._log("Leaving TaskHandler Monitor loop...")
 
     def process_scheduledtasks_queue(self):
+        tasks_added = False
         while not self.abort_flag.is_set() and not self.scheduledtasks.empty():
             # Do not sleep at all here. Process this loop as quick as possible
+            # Drain the queue in batches
+            items = []
+            while len(items) < self.bulk_insert_batch_size:
+                try:
+                    items.append(self.scheduledtasks.get_nowait())
+                except queue.Empty:
+                    break
+            if not items:
+                continue
             try:
-                item = self.scheduledtasks.get_nowait()
+                added_paths = self.add_paths_to_task_queue(items)
+            except Exception as e:
+                self._log("Exception in bulk processing scheduledtasks. Adding files individually", str(e),
+                          level='exception')
+                added_paths = self.add_items_to_task_queue_individually(items)
+            for item in items:
                 pathname = item['pathname']
-                library_id = item['library_id']
-                priority_score = item.get('priority_score', 0)
-                if self.add_path_to_task_queue(pathname, library_id, priority_score=priority_score):
+                if os.path.abspath(pathname) in added_paths:
                     self._log("Adding file to task queue", pathname, level='info')
                 else:
                     self._log("Skipping file as it is already in the queue", pathname, level='info')
-            except queue.Empty:
-                continue
-            except Exception as e:
-                self._log("Exception in processing scheduledtasks", str(e), level='exception')
+            if added_paths:
+                tasks_added = True
+        if tasks_added:
+            self.task_queue.trigger_dispatch()
 
     def process_inotifytasks_queue(self):
+        tasks_added = False
         while not self.abort_flag.is_set() and not self.inotifytasks.empty():
             # Do not sleep at all here. Process this loop as quick as possible
             try:
@@ -113,12 +137,15 @@ class TaskHandler(threading.Thread):
                 #  If it is still being modified here, it is ok to wait for that to finish (should not matter much)
                 if self.add_path_to_task_queue(pathname, library_id, priority_score=priority_score):
                     self._log("Adding inotify job to queue", pathname, level='info')
+                    tasks_added = True
                 else:
                     self._log("Skipping inotify job already in the queue", pathname, level='info')
             except queue.Empty:
                 continue
             except Exception as e:
                 self._log("Exception in processing inotifytasks", str(e), level='exception')
+        if tasks_added:
+            self.task_queue.trigger_dispatch()
 
     def clear_tasks_on_startup(self):
         query = Tasks.delete()
@@ -160,6 +187,116 @@ class TaskHandler(threading.Thread):
             return False
         return True
 
+    def add_items_to_task_queue_individually(self, items):
+        """
+        Add a list of scheduled task items to the task queue one at a time.
+        Returns the set of absolute paths that were added.
+
+        :param items:
+        :return:
+        """
+        added_paths = set()
+        for item in items:
+            try:
+                pathname = item['pathname']
+                if self.add_path_to_task_queue(pathname, item['library_id'], priority_score=item.get('priority_score', 0)):
+                    added_paths.add(os.path.abspath(pathname))
+            except Exception as e:
+                self._log("Exception in processing scheduledtasks", str(e), level='exception')
+        return added_paths
+
+    def add_paths_to_task_queue(self, items):
+        """
+        Add a batch of scheduled task items to the task queue ensuring that each path is only added once.
+        Existing tasks are found with a single query and new tasks are written with multi-row inserts.
+        Returns the set of absolute paths that were added.
+
+        :param items:
+        :return:
+        """
+        # Remove duplicate paths within this batch. The first item for a path wins
+        batch = {}
+        for item in items:
+            batch.setdefault(os.path.abspath(item['pathname']), item)
+
+        # Skip paths that already have a task
+        existing_paths = set()
+        existing_task_query = Tasks.select(Tasks.abspath).where(Tasks.abspath.in_(list(batch)))
+        for (abspath,) in existing_task_query.tuples():
+            existing_paths.add(abspath)
+
+        library_priority_scores = {}
+        rows = []
+        for abspath, item in batch.items():
+            if abspath in existing_paths:
+                continue
+            library_id = item['library_id']
+            if library_id not in library_priority_scores:
+                library_priority_scores[library_id] = int(Library(library_id).get_priority_score())
+
+            # Generate the cache path for this task without writing it to the database
+            new_task = task.Task()
+            new_task.task = Tasks(abspath=abspath, library_id=library_id)
+            new_task.set_cache_path()
+
+            # The task ID is added to the priority once the rows are inserted
+            rows.append({
+                'abspath':    abspath,
+                'cache_path': new_task.task.cache_path,
+                'library_id': library_id,
+                'priority':   library_priority_scores[library_id] + int(item.get('priority_score', 0)),
+                'type':       'local',
+                'status':     'creating',
+            })
+        if not rows:
+            return set()
+
+        # The SqliteQueueDatabase does not support transactions, so the rows are written as 'creating' and only
+        # marked as 'pending' once they are all written. If anything fails in between, the 'creating' rows are removed
+        try:
+            # Create the tasks. Any path that was added since the query above is ignored
+            for rows_chunk in chunked(rows, self.bulk_insert_chunk_size):
+                Tasks.insert_many(rows_chunk).on_conflict_ignore().execute()
+
+            # Set the default priority to the ID of each task and mark them as pending.
+            # Only then will they be picked up by a worker.
+            # Only the paths of rows that are moved from 'creating' to 'pending' here were added.
+            # A path skipped by the insert above may belong to a task that already exists.
+            added_paths = set()
+            for rows_chunk in chunked(rows, self.bulk_insert_batch_size):
+                paths = [row['abspath'] for row in rows_chunk]
+                created_query = Tasks.select(Tasks.abspath).where(
+                    (Tasks.abspath.in_(paths)) & (Tasks.status == 'creating'))
+                created_paths = [abspath for (abspath,) in created_query.tuples()]
+                if not created_paths:
+                    continue
+                Tasks.update(priority=(Tasks.priority + Tasks.id), status='pending').where(
+                    (Tasks.abspath.in_(created_paths)) & (Tasks.status == 'creating')
+                ).execute()
+                added_paths.update(created_paths)
+        except Exception:
+            self.remove_incomplete_tasks(paths=[row['abspath'] for row in rows])
+            raise
+        return added_paths
+
+    def remove_incomplete_tasks(self, paths=None):
+        """
+        Remove local tasks that were left in the 'creating' status.
+        If a list of paths is given, only tasks for those paths are removed.
+        Returns the number of tasks removed.
+
+        :param paths:
+        :return:
+        """
+        if paths is None:
+            return Tasks.delete().where((Tasks.status == 'creating') & (Tasks.type == 'local')).execute()
+        removed_count = 0
+        for paths_chunk in chunked(paths, self.bulk_insert_batch_size):
+            removed_count += Tasks.delete().where(
+                (Tasks.abspath.in_(paths_chunk)) & (Tasks.status == 'creating') & (Tasks.type == 'local')
+            ).execute()
+        return removed_count
+
     def create_task_from_path(self, pathname, library_id, priority_score=0):
         """
         Generate a Task object from a pathname
@@ -29,6 +29,9 @@
            OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
+import threading
+
+from peewee import fn
 
 from unmanic.libs import task
 from unmanic.libs import common
@@ -128,6 +131,84 @@ def build_tasks_query_full_task_list(status, sort_by='id', sort_order='asc', lim
     return query.dicts()
 
 
+def build_tasks_query_with_library_tags(status, sort_by='id', sort_order='asc', local_only=False, limit=None, offset=None,
+                                        worker_tags=None):
+    """
+    Return task items filtered by status along with the tags of the library they belong to.
+    Each returned task has a 'library_tag_names' attribute containing a set of tag names.
+
+    If a list of worker tag sets is given, only tasks that at least one of those workers could process are returned.
+    That is, tasks of libraries with a tag in any of the sets, and tasks of untagged libraries if any set is empty.
+
+    :param status:
+    :param sort_by:
+    :param sort_order:
+    :param local_only:
+    :param limit:
+    :param offset:
+    :param worker_tags:
+    :return:
+    """
+    separator = '\x1f'
+    query = Tasks.select(Tasks, fn.GROUP_CONCAT(Tags.name, separator).alias('library_tag_names_concat'))
+    query = query.where((Tasks.status == status))
+    if local_only:
+        query = query.where((Tasks.type == 'local'))
+    if worker_tags is not None:
+        # Filter libraries with subqueries so that the joined tags below still include all of a library's tags
+        all_worker_tags = set().union(*worker_tags)
+        library_filter = None
+        if all_worker_tags:
+            tagged_library_ids = LibraryTags.select(LibraryTags.libraries).join(Tags).where(
+                Tags.name.in_(list(all_worker_tags)))
+            library_filter = Tasks.library_id.in_(tagged_library_ids)
+        if any(not tags for tags in worker_tags):
+            untagged_libraries = Tasks.library_id.not_in(LibraryTags.select(LibraryTags.libraries))
+            library_filter = untagged_libraries if library_filter is None else (library_filter | untagged_libraries)
+        if library_filter is None:
+            # No workers were given
+            return []
+        query = query.where(library_filter)
+    query = query.join(Libraries, on=(Libraries.id == Tasks.library_id))
+    query = query.join(LibraryTags, join_type='LEFT OUTER JOIN')
+    query = query.join(Tags, join_type='LEFT OUTER JOIN')
+    query = query.group_by(Tasks.id)
+
+    # Set the sort order
+    if sort_order == 'asc':
+        query = query.order_by(sort_by.asc())
+    else:
+        query = query.order_by(sort_by.desc())
+
+    # Set query limit if one was given
+    if limit:
+        query = query.limit(limit)
+        if offset:
+            query = query.offset(offset)
+
+    results = []
+    for task_item in query:
+        tag_names = task_item.library_tag_names_concat
+        task_item.library_tag_names = set(tag_names.split(separator)) if tag_names else set()
+        results.append(task_item)
+    return results
+
+
+def library_tags_match_worker_tags(library_tags, worker_tags):
+    """
+    Check if a library with the given tags may be processed by a worker configured with the given tags.
+    Workers with tags process libraries with any matching tag.
+    Workers without tags only process libraries that have no tags.
+
+    :param library_tags:
+    :param worker_tags:
+    :return:
+    """
+    if worker_tags:
+        return not library_tags.isdisjoint(worker_tags)
+    return not library_tags
+
+
 def fetch_next_task_filtered(status, sort_by='id', sort_order='asc', local_only=False, library_names=None, library_tags=None):
     """
     Returns the next task in the task list for a given status
@@ -172,10 +253,42 @@ class TaskQueue(object):
         self.sort_by = Tasks.priority
         self.sort_order = 'desc'
 
+        # Number of pending tasks fetched per query when reserving tasks for idle workers
+        self.reserve_batch_size = 50
+        # Maximum number of queries run for one reservation. Any workers left without a task wait for the next pass
+        self.reserve_max_batches = 5
+
+        # Event used to wake the Foreman when there may be tasks to hand out to workers
+        self.dispatch_event = threading.Event()
+
     def _log(self, message, message2='', level="info"):
         message = common.format_message(message, message2)
         getattr(self.logger, level)(message)
 
+    """
+    Notify the Foreman of changes to the task list
+    """
+
+    def trigger_dispatch(self):
+        """
+        Wake the Foreman so that it can hand out pending tasks to any idle workers.
+        Called when tasks are added, when workers become idle and when the post-processor drains.
+
+        :return:
+        """
+        self.dispatch_event.set()
+
+    def wait_for_dispatch_trigger(self, timeout):
+        """
+        Block until a dispatch is triggered or the timeout expires.
+
+        :param timeout:
+        :return:
+        """
+        triggered = self.dispatch_event.wait(timeout)
+        self.dispatch_event.clear()
+        return triggered
+
     """
     Last task based on status pending, in_progress or processed
     """
@@ -238,6 +351,65 @@ class TaskQueue(object):
                                              local_only=local_only, library_names=library_names, library_tags=library_tags)
         return task_item
 
+    def reserve_next_pending_tasks(self, worker_tags, local_only=False):
+        """
+        Reserve pending tasks for a number of idle workers in as few database round trips as possible.
+
+        The top pending tasks of libraries that match any of the workers' tags are fetched in batches (up to
+        'reserve_max_batches') along with their library tags and matched to the given workers in memory.
+        Each matched task is then marked as 'in_progress' only if it is still pending.
+        Tasks that were taken by another thread or a remote link manager since they were fetched are not returned.
+
+        Returns a list of (worker_id, task) tuples.
+
+        :param worker_tags: A dict of worker IDs mapped to the set of tags configured for that worker
+        :param local_only:
+        :return:
+        """
+        unassigned_workers = dict(worker_tags)
+        reserved_items = []
+        batch_size = max(self.reserve_batch_size, len(unassigned_workers))
+        offset = 0
+        # Only fetch tasks that one of the workers could process.
+        # The filter is the same for every batch so that the offset pages through a consistent result set
+        worker_tag_sets = list(worker_tags.values())
+        for _ in range(self.reserve_max_batches):
+            if not unassigned_workers:
+                break
+            task_items = build_tasks_query_with_library_tags('pending', sort_by=self.sort_by, sort_order=self.sort_order,
+                                                             local_only=local_only, limit=batch_size, offset=offset,
+                                                             worker_tags=worker_tag_sets)
+            for task_item in task_items:
+                for worker_id in unassigned_workers:
+                    if library_tags_match_worker_tags(task_item.library_tag_names, unassigned_workers[worker_id]):
+                        reserved_items.append((worker_id, task_item))
+                        del unassigned_workers[worker_id]
+                        break
+                if not unassigned_workers:
+                    break
+            if len(task_items) < batch_size:
+                # There are no more pending tasks to check
+                break
+            offset += batch_size
+
+        if not reserved_items:
+            return []
+
+        # Mark each matched task as 'in_progress' so it is not handed out again.
+        # A single update for all tasks could not tell which of them were taken elsewhere in the meantime,
+        # so each task is only reserved if its own update changed the row.
+        results = []
+        for worker_id, task_item in reserved_items:
+            updated_count = Tasks.update(status='in_progress').where(
+                (Tasks.id == task_item.id) & (Tasks.status == 'pending')).execute()
+            if not updated_count:
+                continue
+            task_item.status = 'in_progress'
+            next_task = task.Task()
+            next_task.task = task_item
+            results.append((worker_id, next_task))
+        return results
+
     def get_next_processed_tasks(self):
         # Fetch Task item matching the filters specified
         task_item = fetch_next_task_filtered('processed', sort_by=self.sort_by, sort_order=self.sort_order)
@@ -35,7 +35,7 @@ import socket
 import threading
 import asyncio
 import logging
-from queue import Queue
+from collections import OrderedDict
 
 from tornado.httpserver import HTTPServer
 from tornado.ioloop import IOLoop
@@ -59,10 +59,12 @@ tornado_settings = {
     'static_js':       os.path.join(public_directory, "js"),
     'debug':           True,
     'autoreload':      False,
+    # Gzip compressible responses for clients that accept it. This keeps API calls between linked installations small
+    'compress_response': True,
 }
 
 
-class FrontendPushMessages(Queue, metaclass=SingletonType):
+class FrontendPushMessages(object, metaclass=SingletonType):
     """
     Handles messages passed to the frontend.
 
@@ -73,22 +75,33 @@ class FrontendPushMessages(Queue, metaclass=SingletonType):
         - 'message'     : Additional message string that can be appended to the I18n string displayed on the frontend.
         - 'timeout'     : The timeout for this message. If set to 0, then the message will persist until manually dismissed.
 
+    Messages are stored in insertion order keyed by their ID.
+    The version is incremented on every change so that readers can wait for changes rather than poll.
+
     """
 
-    def _init(self, maxsize):
-        self.all_items = set()
-        Queue._init(self, maxsize)
+    def __init__(self):
+        self.items = OrderedDict()
+        self.version = 0
+        self.changed = threading.Condition()
+
+    def __notify(self):
+        # Must be called while holding the 'changed' lock
+        self.version += 1
+        self.changed.notify_all()
 
     def put(self, item):
         # Ensure received item is valid
         self.__validate_item(item)
-        # If it is not already in message list, add it to the list and the queue
-        if item.get('id') not in self.all_items:
-            self.all_items.add(item.get('id'))
-            self.add_to_queue(item)
+        # If it is not already in message list, add it to the list
+        self.add_to_queue(item)
 
     def add_to_queue(self, item, block=True, timeout=None):
-        Queue.put(self, item, block, timeout)
+        with self.changed:
+            if item.get('id') in self.items:
+                return
+            self.items[item.get('id')] = item
+            self.__notify()
 
     @staticmethod
     def __validate_item(item):
@@ -106,10 +119,26 @@ class FrontendPushMessages(Queue, metaclass=SingletonType):
             )
         return True
 
+    def empty(self):
+        return not self.items
+
+    def qsize(self):
+        return len(self.items)
+
+    def get_version(self):
+        return self.version
+
     def get_all_items(self):
-        items = []
-        while not self.empty():
-            items.append(self.get())
+        """
+        Remove and return all items
+
+        :return:
+        """
+        with self.changed:
+            items = list(self.items.values())
+            if items:
+                self.items.clear()
+                self.__notify()
         return items
 
     def requeue_items(self, items):
@@ -117,52 +146,36 @@ class FrontendPushMessages(Queue, metaclass=SingletonType):
             self.add_to_queue(item)
 
     def remove_item(self, item_id):
-        # Get all items out of queue
-        current_items = self.get_all_items()
-        # Create list of items that will be queued again
-        requeue_items = []
-        for current_item in current_items:
-            if current_item.get('id') != item_id:
-                requeue_items.append(current_item)
-        # Remove the requested item ID from the all_items set
-        lock = threading.RLock()
-        lock.acquire()
-        if item_id in self.all_items:
-            self.all_items.remove(item_id)
-        lock.release()
-        # Add all requeue_items items back into the queue
-        self.requeue_items(requeue_items)
+        with self.changed:
+            if self.items.pop(item_id, None) is not None:
+                self.__notify()
 
     def read_all_items(self):
-        # Get all items out of queue
-        current_items = self.get_all_items()
-        # Add all requeue_items items back into the queue
-        self.requeue_items(current_items)
-        # Return items list
-        return current_items
+        with self.changed:
+            return list(self.items.values())
 
     def update(self, item):
         # Ensure received item is valid
         self.__validate_item(item)
-        # If it is not already in message list, add it to the list and the queue
-        if item.get('id') not in self.all_items:
-            self.all_items.add(item.get('id'))
-            self.add_to_queue(item)
-        else:
-            # Get all items out of queue
-            current_items = self.get_all_items()
-            # Create list of items that will be queued again
-            # This will not include the item requested for update
-            lock = threading.RLock()
-            lock.acquire()
-            requeue_items = []
-            for current_item in current_items:
-                if current_item.get('id') != item.get('id'):
-                    requeue_items.append(current_item)
-                    continue
-                requeue_items.append(item)
-            # Add all requeue_items items back into the queue
-            self.requeue_items(requeue_items)
+        # Add the item, or replace the existing item with the same ID keeping its position in the list
+        with self.changed:
+            if self.items.get(item.get('id')) == item:
+                return
+            self.items[item.get('id')] = item
+            self.__notify()
+
+    def wait_for_change(self, version, timeout=None):
+        """
+        Block until the version differs from the given version or the timeout expires.
+        Returns the current version.
+
+        :param version:
+        :param timeout:
+        :return:
+        """
+        with self.changed:
+            self.changed.wait_for(lambda: self.version != version, timeout=timeout)
+            return self.version
 
 
 class UnmanicDataQueues(object, metaclass=SingletonType):
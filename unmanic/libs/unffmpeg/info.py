@@ -56,13 +56,15 @@ class Info(object):
 
     def file_probe(self, vid_file_path):
         """
-        Probe media file and return result dictionary
+        Probe media file and return result dictionary.
+        Results are cached until the file changes.
 
         :param vid_file_path:
         :return:
         """
         # TODO: Move this to a new "Probe" class
-        return cli.ffprobe_file(vid_file_path)
+        from unmanic.libs.probecache import ProbeCache
+        return ProbeCache().probe(vid_file_path)
 
     def get_available_ffmpeg_encoders(self):
         """
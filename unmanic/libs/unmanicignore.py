@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.unmanicignore.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (11:48 AM)
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import fnmatch
+import os
+import threading
+
+from unmanic.libs.singleton import SingletonType
+
+
+class UnmanicIgnoreRules(object):
+    """
+    UnmanicIgnoreRules
+
+    The parsed contents of a single '.unmanicignore' file.
+
+    Each non-empty line that does not start with '#' is a rule matching the name
+    of an item in the same directory as the ignore file:
+        - Lines without glob characters are matched exactly against the name.
+        - Lines containing '*', '?' or '[' are matched as glob patterns.
+        - Lines ending with '/' only match directories.
+    Directories that match are ignored along with everything beneath them.
+
+    """
+
+    def __init__(self, lines=None):
+        self.names = set()
+        self.patterns = []
+        self.directory_names = set()
+        self.directory_patterns = []
+        for line in (lines or []):
+            self.add_rule(line)
+
+    def add_rule(self, line):
+        rule = line.strip()
+        if not rule or rule.startswith('#'):
+            return
+        directories_only = rule.endswith('/')
+        rule = rule.rstrip('/')
+        if not rule:
+            return
+        is_pattern = any(c in rule for c in '*?[')
+        if directories_only:
+            if is_pattern:
+                self.directory_patterns.append(rule)
+            else:
+                self.directory_names.add(rule)
+        elif is_pattern:
+            self.patterns.append(rule)
+        else:
+            self.names.add(rule)
+
+    def is_empty(self):
+        return not (self.names or self.patterns or self.directory_names or self.directory_patterns)
+
+    def matches(self, name, is_dir=False):
+        """
+        Check if the given name matches any rule in this ignore file
+
+        :param name:
+        :param is_dir:
+        :return:
+        """
+        if name in self.names:
+            return True
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in self.patterns):
+            return True
+        if is_dir:
+            if name in self.directory_names:
+                return True
+            if any(fnmatch.fnmatchcase(name, pattern) for pattern in self.directory_patterns):
+                return True
+        return False
+
+
+class UnmanicIgnoreCache(object, metaclass=SingletonType):
+    """
+    UnmanicIgnoreCache
+
+    Process-wide cache of parsed '.unmanicignore' files keyed by directory.
+    A cached entry is re-read only when the ignore file's mtime or size changes.
+
+    """
+
+    ignore_file_name = '.unmanicignore'
+    max_entries = 20000
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    def get_rules(self, directory):
+        """
+        Return the parsed ignore rules for a directory.
+        Returns None if the directory has no ignore file.
+
+        :param directory:
+        :return:
+        """
+        ignore_file = os.path.join(directory, self.ignore_file_name)
+        try:
+            file_stat = os.stat(ignore_file)
+        except OSError:
+            if directory in self.entries:
+                with self.lock:
+                    self.entries.pop(directory, None)
+            return None
+
+        file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+        entry = self.entries.get(directory)
+        if entry is not None and entry[0] == file_version:
+            return entry[1]
+
+        try:
+            with open(ignore_file) as f:
+                rules = UnmanicIgnoreRules(f.readlines())
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        with self.lock:
+            if len(self.entries) >= self.max_entries:
+                self.entries.clear()
+            self.entries[directory] = (file_version, rules)
+        return rules
+
+    def file_is_ignored(self, path):
+        """
+        Check if a file is listed in the ignore file of its parent directory
+
+        :param path:
+        :return:
+        """
+        rules = self.get_rules(os.path.dirname(path))
+        if rules is None:
+            return False
+        return rules.matches(os.path.basename(path), is_dir=False)
+
+    def directory_is_ignored(self, path, parent_rules=None):
+        """
+        Check if a directory is listed in the ignore file of its parent directory.
+        The parent's rules may be passed in if they have already been fetched.
+
+        :param path:
+        :param parent_rules:
+        :return:
+        """
+        if parent_rules is None:
+            parent_rules = self.get_rules(os.path.dirname(path))
+        if parent_rules is None:
+            return False
+        return parent_rules.matches(os.path.basename(path), is_dir=True)
+
+    def parent_directory_is_ignored(self, path, root_directory):
+        """
+        Check if any directory between the root directory and the given file is ignored.
+        A library scan does not enter ignored directories, so files within them are also ignored.
+
+        :param path:
+        :param root_directory:
+        :return:
+        """
+        root_directory = os.path.abspath(root_directory)
+        directory = os.path.dirname(os.path.abspath(path))
+        while directory != root_directory and directory.startswith(os.path.join(root_directory, '')):
+            if self.directory_is_ignored(directory):
+                return True
+            directory = os.path.dirname(directory)
+        return False
+
+    def clear(self):
+        with self.lock:
+            self.entries = {}
@@ -39,6 +39,7 @@ from .installation import Installation
 from .pluginrepos import PluginRepos
 from .plugins import Plugins
 from .libraries import Libraries, LibraryTags
+from .libraryfileindex import LibraryFileIndex
 from .librarypluginflow import LibraryPluginFlow
 from .tags import Tags
 from .tasks import Tasks
@@ -46,3 +46,4 @@ class CompletedTasks(BaseModel):
     start_time = DateTimeField(null=False, default=datetime.datetime.now)
     finish_time = DateTimeField(null=False, default=datetime.datetime.now)
     processed_by_worker = TextField(null=False)
+    checksum = TextField(null=True)
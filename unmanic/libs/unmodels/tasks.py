@@ -51,3 +51,9 @@ class Tasks(BaseModel):
     finish_time = DateTimeField(null=True, default=datetime.datetime.now)
     processed_by_worker = TextField(null=True)
     log = TextField(null=False, default='')
+
+    class Meta:
+        indexes = (
+            (('status', 'priority', 'id'), False),
+            (('library_id',), False),
+        )
@@ -38,6 +38,7 @@ import sys
 
 from . import plugin_types
 from unmanic.libs import unlogger, common
+from unmanic.libs.pluginflowcache import PluginFlowCache
 from ..unmodels import LibraryPluginFlow
 
 
@@ -178,6 +179,8 @@ class PluginExecutor(object):
                     self._log("Exception encountered while trying to reload module '{}'".format(module_name),
                               level="exception")
                     del sys.modules[module_name]
+                    # Cached plugin flows may still reference the removed module
+                    PluginFlowCache().invalidate()
 
     @staticmethod
     def unload_plugin_module(plugin_id):
@@ -195,6 +198,7 @@ class PluginExecutor(object):
 
         if module_name in sys.modules:
             del sys.modules[module_name]
+        PluginFlowCache().invalidate()
 
     @staticmethod
     def get_plugin_type_meta(plugin_type):
@@ -48,6 +48,8 @@ class ProcessItem(PluginType):
         file_out                - String, the destination that the command should output (may be the same as the file_in if necessary).
         original_file_path      - String, the absolute path to the original file.
         repeat                  - Boolean, should this runner be executed again once completed with the same variables.
+        shared_info             - Dictionary, information provided by previous plugin runners.
+                                  This can be appended to for subsequent runners.
 
     :param data:
     :return:
@@ -85,6 +87,10 @@ class ProcessItem(PluginType):
             "required": False,
             "type":     bool,
         },
+        "shared_info":             {
+            "required": False,
+            "type":     dict,
+        },
     }
     test_data = {
         'worker_log':              [],
@@ -95,4 +101,5 @@ class ProcessItem(PluginType):
         'file_out':                '{cache_path}/{test_file_out}',
         'original_file_path':      '{library_path}/{test_file_in}',
         'repeat':                  False,
+        'shared_info':             {},
     }
@@ -29,14 +29,96 @@
            OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
+import copy
 import json
 import os
 import sys
+import threading
 
 from unmanic import config
 from unmanic.libs.singleton import SingletonType
 
 
+class PluginSettingsCache(object, metaclass=SingletonType):
+    """
+    A process-wide cache of the parsed plugin settings files.
+
+    Entries are keyed by (plugin_id, library_id) and record the settings file that
+    was read along with its mtime and size. A file is only parsed again if it changes.
+
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    @staticmethod
+    def __stat_file(path):
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    def read(self, plugin_id, library_id, plugin_settings_file):
+        """
+        Return the parsed contents of a plugin settings file.
+        The file is only read from disk if it has changed since it was last read.
+
+        :param plugin_id:
+        :param library_id:
+        :param plugin_settings_file:
+        :return:
+        """
+        key = (plugin_id, library_id)
+        file_stat = self.__stat_file(plugin_settings_file)
+        if file_stat is None:
+            raise FileNotFoundError(plugin_settings_file)
+        entry = self.entries.get(key)
+        if entry and entry['path'] == plugin_settings_file and entry['stat'] == file_stat:
+            return entry['settings']
+
+        # Read plugin settings from file
+        with open(plugin_settings_file) as infile:
+            plugin_settings = json.load(infile)
+        self.update(plugin_id, library_id, plugin_settings_file, plugin_settings, file_stat=file_stat)
+        return plugin_settings
+
+    def update(self, plugin_id, library_id, plugin_settings_file, plugin_settings, file_stat=None):
+        """
+        Update the cached settings for a plugin after they have been written to disk
+
+        :param plugin_id:
+        :param library_id:
+        :param plugin_settings_file:
+        :param plugin_settings:
+        :param file_stat:
+        :return:
+        """
+        if file_stat is None:
+            file_stat = self.__stat_file(plugin_settings_file)
+        with self.lock:
+            self.entries[(plugin_id, library_id)] = {
+                'path':     plugin_settings_file,
+                'stat':     file_stat,
+                'settings': plugin_settings,
+            }
+
+    def remove(self, plugin_id, library_id=None):
+        """
+        Remove the cached settings for a plugin.
+        If no library ID is given, the cached settings for all libraries are removed.
+
+        :param plugin_id:
+        :param library_id:
+        :return:
+        """
+        with self.lock:
+            for key in list(self.entries):
+                if key[0] == plugin_id and (library_id is None or key[1] == library_id):
+                    del self.entries[key]
+
+
 class PluginSettings(object):
     """
     A dictionary of settings accessible to the Plugin class and able
@@ -105,6 +187,10 @@ class PluginSettings(object):
         with open(plugin_settings_file, 'w') as f:
             json.dump(self.settings_configured, f, indent=2)
 
+        # Update the cached copy of the settings file
+        PluginSettingsCache().update(self.get_plugin_id(), self.library_id, plugin_settings_file,
+                                     copy.deepcopy(self.settings_configured))
+
     def __import_configured_settings(self):
         """
         Read settings from settings file
@@ -123,14 +209,14 @@ class PluginSettings(object):
         if not os.path.exists(plugin_settings_file):
             self.__export_configured_settings()
 
-        # Read plugin settings from file
-        with open(plugin_settings_file) as infile:
-            plugin_settings = json.load(infile)
+        # Read plugin settings from the cache. This will only re-read the file if it was modified
+        plugin_settings = PluginSettingsCache().read(self.get_plugin_id(), self.library_id, plugin_settings_file)
 
         # Loop over settings
+        # Values are copied out of the cache so that changes to them are not shared with other instances
         for key in self.settings:
             if key in plugin_settings:
-                self.settings_configured[key] = plugin_settings.get(key)
+                self.settings_configured[key] = copy.deepcopy(plugin_settings.get(key))
 
     def reset_settings_to_defaults(self):
         """
@@ -148,6 +234,7 @@ class PluginSettings(object):
         # if the file does not yet exist, create it
         if os.path.exists(plugin_settings_file):
             os.remove(plugin_settings_file)
+        PluginSettingsCache().remove(self.get_plugin_id(), library_id=self.library_id)
 
         if not os.path.exists(plugin_settings_file):
             return True
@@ -162,6 +249,14 @@ class PluginSettings(object):
         """
         return os.path.dirname(os.path.abspath(sys.modules[self.__class__.__module__].__file__))
 
+    def get_plugin_id(self):
+        """
+        Return the ID of the Plugin. This is the name of the Plugin's directory.
+
+        :return:
+        """
+        return os.path.basename(self.get_plugin_directory())
+
     def get_profile_directory(self):
         """
         Return the absolute path to the Plugin's profile directory.
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.workerlog.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (11:05 AM)
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import collections
+import os
+import tempfile
+import threading
+
+
+class WorkerLog(object):
+    """
+    WorkerLog
+
+    A bounded command log for a worker.
+    Only the most recent lines are kept in memory. The full log is spilled
+    to a temporary file on disk and can be read back once the task completes.
+
+    Behaves enough like a list (append, +=, len, iteration and slicing of the
+    tail) for plugin runners that append to 'data["worker_log"]'.
+
+    """
+
+    def __init__(self, max_lines=500, spill_directory=None):
+        self.lines = collections.deque(maxlen=max_lines)
+        self.line_count = 0
+        self.lock = threading.Lock()
+        self.spill_directory = spill_directory
+        self.spill_path = None
+        self.spill_file = None
+
+    def __open_spill_file(self):
+        if self.spill_file is not None:
+            return
+        spill_directory = self.spill_directory
+        if spill_directory and not os.path.exists(spill_directory):
+            os.makedirs(spill_directory, exist_ok=True)
+        fd, self.spill_path = tempfile.mkstemp(prefix='unmanic_worker_log_', suffix='.log', dir=spill_directory)
+        self.spill_file = os.fdopen(fd, 'w', encoding='utf-8', errors='replace')
+
+    def append(self, text):
+        """
+        Append a string to the log
+
+        :param text:
+        :return:
+        """
+        if not isinstance(text, str):
+            text = str(text)
+        with self.lock:
+            self.__open_spill_file()
+            self.spill_file.write(text)
+            self.lines.append(text)
+            self.line_count += 1
+
+    def extend(self, items):
+        for text in items:
+            self.append(text)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __len__(self):
+        return self.line_count
+
+    def __iter__(self):
+        with self.lock:
+            return iter(list(self.lines))
+
+    def __getitem__(self, item):
+        with self.lock:
+            return list(self.lines)[item]
+
+    def tail(self, count):
+        """
+        Return the last <count> lines of the log
+
+        :param count:
+        :return:
+        """
+        with self.lock:
+            return list(self.lines)[-count:]
+
+    def read(self):
+        """
+        Read back the full log from disk
+
+        :return:
+        """
+        with self.lock:
+            if self.spill_file is None:
+                return ''
+            self.spill_file.flush()
+            with open(self.spill_path, 'r', encoding='utf-8', errors='replace') as f:
+                return f.read()
+
+    def close(self):
+        """
+        Close and remove the spill file
+
+        :return:
+        """
+        with self.lock:
+            if self.spill_file is not None:
+                self.spill_file.close()
+                self.spill_file = None
+            if self.spill_path and os.path.exists(self.spill_path):
+                os.remove(self.spill_path)
+            self.spill_path = None
+            self.lines.clear()
+            self.line_count = 0
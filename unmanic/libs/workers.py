@@ -29,9 +29,12 @@
            OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
+import codecs
+import copy
 import hashlib
 import os
 import queue
+import re
 import shutil
 import subprocess
 import threading
@@ -39,8 +42,14 @@ import time
 
 import psutil
 
+from unmanic import config
 from unmanic.libs import common, unlogger
 from unmanic.libs.plugins import PluginsHandler
+from unmanic.libs.probecache import ProbeCache
+from unmanic.libs.workerlog import WorkerLog
+
+# Subprocess output is split into lines on either '\n' or '\r' (used by ffmpeg for progress updates)
+SUBPROCESS_LINE_SPLIT_REGEX = re.compile(r'\r\n|\r|\n')
 
 
 def default_progress_parser(line_text):
@@ -68,15 +77,38 @@ class Worker(threading.Thread):
     worker_subprocess_pid = None
     worker_subprocess_percent = None
     worker_subprocess_elapsed = None
+    worker_subprocess_line_count = 0
+    worker_subprocess_parser_calls = 0
+    worker_subprocess_parser_time = 0
 
     worker_runners_info = {}
 
-    def __init__(self, thread_id, name, worker_group_id, pending_queue, complete_queue, event):
+    # Incremented each time the status returned by get_status() differs from the previous one
+    status_sequence = 0
+
+    # Number of lines of the worker log to keep in memory. The full log is spilled to disk
+    worker_log_buffer_lines = 500
+    # Max size of chunks read from a subprocess's output
+    subprocess_read_chunk_size = 65536
+    # Max length of a partial line held while waiting for a line ending
+    subprocess_max_line_length = 65536
+
+    def __init__(self, thread_id, name, worker_group_id, pending_queue, complete_queue, event, dispatch_event=None):
         super(Worker, self).__init__(name=name)
         self.thread_id = thread_id
         self.name = name
         self.worker_group_id = worker_group_id
         self.event = event
+        self.settings = config.Config()
+        self.worker_log = self.__new_worker_log()
+
+        self.status_lock = threading.Lock()
+        self.last_status = None
+
+        # Event set by the Foreman when a task is assigned to this worker
+        self.task_event = threading.Event()
+        # Event used to notify the Foreman when this worker becomes idle
+        self.dispatch_event = dispatch_event
 
         self.current_task = None
         self.pending_queue = pending_queue
@@ -101,7 +133,9 @@ class Worker(threading.Thread):
     def run(self):
         self._log("Starting worker")
         while not self.redundant_flag.is_set():
-            self.event.wait(1)  # Add delay for preventing loop maxing compute resources
+            # Wait for the Foreman to set a task. Timeout to re-check the worker flags
+            self.task_event.wait(1)
+            self.task_event.clear()
 
             # If the Foreman has paused this worker, then don't do anything
             if self.paused_flag.is_set():
@@ -109,58 +143,77 @@ class Worker(threading.Thread):
                 # If the worker is paused, wait for 5 seconds before continuing the loop
                 self.event.wait(5)
                 continue
-            self.paused = False
+            if self.paused:
+                self.paused = False
+                self.__notify_idle()
 
             # Set the worker as Idle - This will announce to the Foreman that it's ready for a task
-            self.idle = True
+            if not self.current_task:
+                self.idle = True
 
-            # Wait for task
+            # Process the set task
             while not self.redundant_flag.is_set() and self.current_task:
-                self.event.wait(.5)  # Add delay for preventing loop maxing compute resources
-
                 try:
-                    # Process the set task
                     self.__process_task_queue_item()
                 except queue.Empty:
                     continue
                 except Exception as e:
                     self._log("Exception in processing job with {}:".format(self.name), message2=str(e),
                               level="exception")
+                    self.event.wait(.5)  # Add delay for preventing loop maxing compute resources
 
         self._log("Stopping worker")
 
     def set_task(self, new_task):
-        """Sets the given task to the worker class"""
+        """Sets the given task to the worker class. Returns False if the worker already has a task"""
         # Ensure only one task can be set for a worker
         if self.current_task:
-            return
+            return False
         # Set the task
         self.current_task = new_task
-        self.worker_log = []
+        self.worker_log.close()
         self.idle = False
+        # Wake the worker
+        self.task_event.set()
+        return True
+
+    def __new_worker_log(self):
+        """Create an empty worker log that spills to the cache directory"""
+        spill_directory = os.path.join(self.settings.get_cache_path(), 'worker_logs')
+        return WorkerLog(max_lines=self.worker_log_buffer_lines, spill_directory=spill_directory)
+
+    def __notify_idle(self):
+        """Let the Foreman know that this worker is ready for another task"""
+        if self.dispatch_event is not None:
+            self.dispatch_event.set()
 
     def get_status(self):
         """
         Fetch the status of this worker.
 
+        The 'sequence' is incremented whenever any other part of the status has changed since it was last fetched.
+        The 'worker_log_count' is the total number of lines appended to the worker log for the current task.
+
         TODO: Fetch subprocess pid
 
         :return:
         """
         status = {
-            'id':              str(self.thread_id),
-            'name':            self.name,
-            'idle':            self.idle,
-            'paused':          self.paused,
-            'start_time':      None if not self.start_time else str(self.start_time),
-            'current_task':    None,
-            'current_file':    "",
-            'worker_log_tail': [],
-            'runners_info':    {},
-            'subprocess':      {
+            'id':               str(self.thread_id),
+            'name':             self.name,
+            'idle':             self.idle,
+            'paused':           self.paused,
+            'start_time':       None if not self.start_time else str(self.start_time),
+            'current_task':     None,
+            'current_file':     "",
+            'worker_log_tail':  [],
+            'worker_log_count': 0,
+            'runners_info':     {},
+            'subprocess':       {
                 'pid':     self.ident,
                 'percent': str(self.worker_subprocess_percent),
                 'elapsed': str(self.worker_subprocess_elapsed),
+                'stats':   self.__get_subprocess_stats(),
             },
         }
         if self.current_task:
@@ -180,26 +233,64 @@ class Worker(threading.Thread):
 
             # Append the worker log tail
             try:
-                if self.worker_log and len(self.worker_log) > 20:
-                    status['worker_log_tail'] = self.worker_log[-19:]
-                else:
-                    status['worker_log_tail'] = self.worker_log
+                status['worker_log_count'] = len(self.worker_log)
+                status['worker_log_tail'] = self.worker_log.tail(19)
             except Exception as e:
                 self._log("Exception in fetching log tail of worker: ", message2=str(e),
                           level="exception")
 
             # Append the runners info
             try:
-                status['runners_info'] = self.worker_runners_info
+                status['runners_info'] = copy.deepcopy(self.worker_runners_info)
             except Exception as e:
                 self._log("Exception in runners info of worker {}:".format(self.name), message2=str(e),
                           level="exception")
+
+        # Version the status
+        with self.status_lock:
+            if status != self.last_status:
+                self.status_sequence += 1
+                self.last_status = status
+            status = dict(status, sequence=self.status_sequence)
         return status
 
+    def __get_subprocess_stats(self):
+        """Return the output throughput and progress parser cost of the current subprocess"""
+        lines_per_second = 0
+        try:
+            elapsed = float(self.worker_subprocess_elapsed)
+            if elapsed > 0:
+                lines_per_second = round(self.worker_subprocess_line_count / elapsed, 2)
+        except (TypeError, ValueError):
+            pass
+        parser_avg_ms = 0
+        if self.worker_subprocess_parser_calls:
+            parser_avg_ms = round((self.worker_subprocess_parser_time / self.worker_subprocess_parser_calls) * 1000, 3)
+        return {
+            'output_lines':            self.worker_subprocess_line_count,
+            'output_lines_per_second': lines_per_second,
+            'parser_calls':            self.worker_subprocess_parser_calls,
+            'parser_avg_ms':           parser_avg_ms,
+        }
+
+    def __parse_command_progress(self, command_progress_parser, line_text, proc_start_time, proc_pause_time):
+        """Run the plugin's progress parser against a line of output and record the time it took"""
+        parse_start_time = time.perf_counter()
+        try:
+            progress_dict = command_progress_parser(line_text)
+            self.worker_subprocess_percent = progress_dict.get('percent', '0')
+            self.worker_subprocess_elapsed = str(time.time() - proc_start_time - proc_pause_time)
+        except Exception as e:
+            # Only need to show any sort of exception if we have debugging enabled.
+            # So we should log it as a debug rather than an exception.
+            self._log("Exception while parsing command progress", str(e), level='debug')
+        self.worker_subprocess_parser_calls += 1
+        self.worker_subprocess_parser_time += time.perf_counter() - parse_start_time
+
     def __unset_current_task(self):
         self.current_task = None
         self.worker_runners_info = {}
-        self.worker_log = []
+        self.worker_log.close()
 
     def __process_task_queue_item(self):
         """
@@ -240,6 +331,11 @@ class Worker(threading.Thread):
         # Reset the current file info for the next task
         self.__unset_current_task()
 
+        # Announce to the Foreman that this worker is ready for another task
+        if not self.paused_flag.is_set():
+            self.idle = True
+            self.__notify_idle()
+
     def __set_start_task_stats(self):
         """Sets the initial stats for the start of a task"""
         # Set the start time to now
@@ -314,7 +410,9 @@ class Worker(threading.Thread):
             "file_out":                None,
             "original_file_path":      original_abspath,
             "repeat":                  False,
+            "shared_info":             {},
         }
+        probe_cache = ProbeCache()
 
         for plugin_module in plugin_modules:
             # Increment the runners count (first runner will be set as #1)
@@ -350,6 +448,12 @@ class Worker(threading.Thread):
                 data['original_file_path'] = original_abspath
                 data['repeat'] = False
 
+                # Only share a probe of the current input file with the runner
+                shared_probe = data['shared_info'].get('ffprobe')
+                if isinstance(shared_probe, dict) and shared_probe.get('format', {}).get('filename') != file_in:
+                    del data['shared_info']['ffprobe']
+                probe_cache.populate_shared_info(file_in, data['shared_info'])
+
                 self.event.wait(.2)  # Add delay for preventing loop maxing compute resources
                 self.worker_log.append("\n\nRUNNER: \n{} [Pass #{}]\n\n".format(plugin_module.get('name'), runner_pass_count))
                 self.worker_log.append("\nExecuting plugin runner... Please wait\n")
@@ -367,6 +471,10 @@ class Worker(threading.Thread):
                     self.worker_log.append("\nCheck Unmanic logs for more information")
                     break
 
+                # Keep any probe of the original file made by the runner. Cache files are too short-lived to store.
+                if file_in == original_abspath:
+                    probe_cache.store_shared_info(file_in, data['shared_info'])
+
                 # Log the in and out files returned by the plugin runner for debugging
                 self._log("Worker process '{}' (in)".format(plugin_module.get('plugin_id')), data.get("file_in"),
                           level='debug')
@@ -460,7 +568,7 @@ class Worker(threading.Thread):
             self.worker_log.append("\n\nNo Plugin requested for Unmanic to run commands for this file '{}'".format(original_abspath))
 
         # Save the completed command log
-        self.current_task.save_command_log(self.worker_log)
+        self.current_task.save_command_log([self.worker_log.read()])
 
         # If all plugins that were executed completed successfully, then this was overall a successful task.
         # At this point we need to move the final out file to the original task cache path so the postprocessor can collect it.
@@ -583,11 +691,9 @@ class Worker(threading.Thread):
             proc_start_time = time.time()
             # Execute command
             if isinstance(exec_command, list):
-                sub_proc = subprocess.Popen(exec_command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                                            universal_newlines=True, errors='replace')
+                sub_proc = subprocess.Popen(exec_command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
             elif isinstance(exec_command, str):
-                sub_proc = subprocess.Popen(exec_command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                                            universal_newlines=True, errors='replace', shell=True)
+                sub_proc = subprocess.Popen(exec_command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, shell=True)
             else:
                 raise Exception(
                     "Plugin's returned 'exec_command' object must be either a list or a string. Received type {}.".format(
@@ -611,27 +717,64 @@ class Worker(threading.Thread):
             self.worker_subprocess = sub_proc
             self.worker_subprocess_pid = sub_proc.pid
 
-            # Poll process for new output until finished
+            # Limit how often the progress parser is run. Only the most recent line is parsed on each interval
+            parser_interval = 0
+            try:
+                parser_rate = float(self.settings.get_worker_progress_parser_rate())
+                if parser_rate > 0:
+                    parser_interval = 1.0 / parser_rate
+            except (TypeError, ValueError):
+                pass
+            last_parse_time = 0
+            unparsed_line = None
+            self.worker_subprocess_line_count = 0
+            self.worker_subprocess_parser_calls = 0
+            self.worker_subprocess_parser_time = 0
+
+            # Poll process for new output until finished.
+            # Output is read in chunks of whatever is currently available so that partial lines never block the loop.
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            partial_line = ''
             while not self.redundant_flag.is_set():
-                line_text = sub_proc.stdout.readline()
+                chunk = sub_proc.stdout.read1(self.subprocess_read_chunk_size)
+
+                # Split the chunk into lines. Hold back any trailing partial line until the rest of it arrives
+                if chunk:
+                    lines = SUBPROCESS_LINE_SPLIT_REGEX.split(partial_line + decoder.decode(chunk))
+                    partial_line = lines.pop()
+                    if len(partial_line) > self.subprocess_max_line_length:
+                        lines.append(partial_line)
+                        partial_line = ''
+                else:
+                    # End of output. Flush whatever partial line remains
+                    lines = [partial_line + decoder.decode(b'', final=True)]
+                    partial_line = ''
 
-                # Fetch command stdout and append it to the current task object (to be saved during post process)
-                self.worker_log.append(line_text)
+                for line_text in lines:
+                    if not line_text:
+                        continue
+                    # Fetch command stdout and append it to the current task log (to be saved during post process)
+                    self.worker_log.append(line_text + '\n')
+                    self.worker_subprocess_line_count += 1
+                    unparsed_line = line_text + '\n'
+
+                # Parse the progress of the most recent line.
+                # Always parse the final line of output once the command's output has ended.
+                if unparsed_line is not None:
+                    time_now = time.monotonic()
+                    if not chunk or (time_now - last_parse_time) >= parser_interval:
+                        self.__parse_command_progress(command_progress_parser, unparsed_line, proc_start_time,
+                                                      proc_pause_time)
+                        last_parse_time = time_now
+                        unparsed_line = None
 
                 # Check if the command has completed. If it has, exit the loop
-                if line_text == '' and sub_proc.poll() is not None:
-                    self._log("Subprocess task completed!", level='debug')
-                    break
-
-                # Parse the progress
-                try:
-                    progress_dict = command_progress_parser(line_text)
-                    self.worker_subprocess_percent = progress_dict.get('percent', '0')
-                    self.worker_subprocess_elapsed = str(time.time() - proc_start_time - proc_pause_time)
-                except Exception as e:
-                    # Only need to show any sort of exception if we have debugging enabled.
-                    # So we should log it as a debug rather than an exception.
-                    self._log("Exception while parsing command progress", str(e), level='debug')
+                if not chunk:
+                    if sub_proc.poll() is not None:
+                        self._log("Subprocess task completed!", level='debug')
+                        break
+                    # The output was closed but the process is still running. Wait for it to exit
+                    self.event.wait(.1)
 
                 # Stop the process if the worker is paused
                 # Then resume it when the worker is resumed
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.workerstatus.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (11:32 AM)
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+
+
+def diff_worker_status(previous, current):
+    """
+    Return the fields of a worker's status that changed between two snapshots.
+
+    Changes to 'subprocess' and 'runners_info' only include the changed keys
+    ('runners_info' entries that were removed are set to None).
+    New worker log lines are returned as 'worker_log_append' rather than the
+    whole 'worker_log_tail', unless the worker started a different task, the
+    log was reset or more lines were added than the tail holds.
+
+    :param previous:
+    :param current:
+    :return:
+    """
+    if previous.get('sequence') == current.get('sequence'):
+        return {}
+    changes = {}
+    for key, value in current.items():
+        previous_value = previous.get(key)
+        if value == previous_value or key in ['worker_log_tail', 'worker_log_count']:
+            continue
+        if key in ['subprocess', 'runners_info'] and isinstance(value, dict) and isinstance(previous_value, dict):
+            changed = {k: v for k, v in value.items() if previous_value.get(k) != v}
+            changed.update({k: None for k in previous_value if k not in value})
+            changes[key] = changed
+        else:
+            changes[key] = value
+
+    # Send only the lines that were added to the worker log.
+    # If the worker has moved on to another task, the log belongs to that task and is sent in full
+    task_changed = any(current.get(key) != previous.get(key) for key in ('current_task', 'start_time'))
+    appended_count = current.get('worker_log_count', 0) - previous.get('worker_log_count', 0)
+    current_tail = current.get('worker_log_tail', [])
+    if task_changed or appended_count < 0 or appended_count > len(current_tail) or (
+            appended_count == 0 and current_tail != previous.get('worker_log_tail', [])):
+        changes['worker_log_tail'] = current_tail
+        changes['worker_log_count'] = current.get('worker_log_count', 0)
+    elif appended_count > 0:
+        changes['worker_log_append'] = current_tail[-appended_count:]
+        changes['worker_log_count'] = current.get('worker_log_count', 0)
+    return changes
+
+
+def diff_all_worker_status(previous, current):
+    """
+    Return the changes between two lists of worker status snapshots.
+    Returns None if nothing changed.
+
+    :param previous:
+    :param current:
+    :return:
+    """
+    previous_workers = {worker.get('id'): worker for worker in previous}
+    current_ids = set()
+    workers = {}
+    for worker in current:
+        worker_id = worker.get('id')
+        current_ids.add(worker_id)
+        if worker_id not in previous_workers:
+            # Send the full status of new workers
+            workers[worker_id] = worker
+            continue
+        changes = diff_worker_status(previous_workers[worker_id], worker)
+        if changes:
+            workers[worker_id] = changes
+    removed = [worker_id for worker_id in previous_workers if worker_id not in current_ids]
+    if not workers and not removed:
+        return None
+    return {
+        'workers': workers,
+        'removed': removed,
+    }
@@ -41,6 +41,7 @@ from .pending_api import ApiPendingHandler
 from .plugins_api import ApiPluginsHandler
 from .session_api import ApiSessionHandler
 from .settings_api import ApiSettingsHandler
+from .transfer_api import ApiTransferHandler
 from .upload_api import ApiUploadHandler
 from .version_api import ApiVersionHandler
 from .workers_api import ApiWorkersHandler
@@ -56,6 +57,7 @@ __all__ = (
     'ApiPluginsHandler',
     'ApiSessionHandler',
     'ApiSettingsHandler',
+    'ApiTransferHandler',
     'ApiUploadHandler',
     'ApiVersionHandler',
     'ApiWorkersHandler'
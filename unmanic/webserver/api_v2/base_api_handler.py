@@ -29,6 +29,7 @@
            OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
+import asyncio
 import json
 import re
 import sys
@@ -61,6 +62,7 @@ class BaseApiHandler(RequestHandler):
     routes = []
     route = {}
     error_messages = {}
+    io_loop = None
 
     """
     Valid API return status codes:
@@ -126,6 +128,25 @@ class BaseApiHandler(RequestHandler):
         data = schema.dump(response)
         return data
 
+    def finish(self, chunk=None):
+        """
+        Finish the response on the IOLoop.
+        API routes are executed in a thread pool, but RequestHandler is not thread safe. Writing to the
+        connection from the pool can corrupt a keep-alive connection that the client goes on to reuse.
+        This overwrites the RequestHandler method.
+
+        :param chunk:
+        :return:
+        """
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if self.io_loop is not None and running_loop is not self.io_loop.asyncio_loop:
+            self.io_loop.add_callback(super(BaseApiHandler, self).finish, chunk)
+            return
+        return super(BaseApiHandler, self).finish(chunk)
+
     def write_success(self, response=None):
         """
         Write data out as HTTP code 200
@@ -270,7 +291,8 @@ class BaseApiHandler(RequestHandler):
         :param path:
         :return:
         """
-        await IOLoop.current().run_in_executor(None, self.action_route)
+        self.io_loop = IOLoop.current()
+        await self.io_loop.run_in_executor(None, self.action_route)
 
     async def get(self, path):
         """
@@ -279,7 +301,8 @@ class BaseApiHandler(RequestHandler):
         :param path:
         :return:
         """
-        await IOLoop.current().run_in_executor(None, self.action_route)
+        self.io_loop = IOLoop.current()
+        await self.io_loop.run_in_executor(None, self.action_route)
 
     async def post(self, path):
         """
@@ -288,7 +311,8 @@ class BaseApiHandler(RequestHandler):
         :param path:
         :return:
         """
-        await IOLoop.current().run_in_executor(None, self.action_route)
+        self.io_loop = IOLoop.current()
+        await self.io_loop.run_in_executor(None, self.action_route)
 
     async def put(self, path):
         """
@@ -297,4 +321,5 @@ class BaseApiHandler(RequestHandler):
         :param path:
         :return:
         """
-        await IOLoop.current().run_in_executor(None, self.action_route)
+        self.io_loop = IOLoop.current()
+        await self.io_loop.run_in_executor(None, self.action_route)
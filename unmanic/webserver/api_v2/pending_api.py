@@ -158,6 +158,7 @@ class ApiPendingHandler(BaseApiHandler):
                 'start':        json_request.get('start', '0'),
                 'length':       json_request.get('length', '10'),
                 'search_value': json_request.get('search_value', ''),
+                'cursor':       json_request.get('cursor'),
                 'order':        {
                     "column": json_request.get('order_by', 'priority'),
                     "dir":    json_request.get('order_direction', 'desc'),
@@ -170,6 +171,7 @@ class ApiPendingHandler(BaseApiHandler):
                 {
                     "recordsTotal":    task_list.get('recordsTotal'),
                     "recordsFiltered": task_list.get('recordsFiltered'),
+                    "next_cursor":     task_list.get('next_cursor'),
                     "results":         task_list.get('results'),
                 }
             )
@@ -178,6 +180,9 @@ class ApiPendingHandler(BaseApiHandler):
         except BaseApiError as bae:
             tornado.log.app_log.error("BaseApiError.{}: {}".format(self.route.get('call_method'), str(bae)))
             return
+        except pending_tasks.InvalidCursorError as e:
+            self.set_status(self.STATUS_ERROR_EXTERNAL, reason=str(e))
+            self.write_error()
         except Exception as e:
             self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
             self.write_error()
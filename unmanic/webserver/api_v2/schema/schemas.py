@@ -453,6 +453,12 @@ class RequestPendingTableDataSchema(RequestTableDataSchema):
         example="priority",
         load_default="priority",
     )
+    cursor = fields.Str(
+        required=False,
+        description="The 'next_cursor' of the previous page. Replaces 'start' when ordering by priority or id",
+        example="1052:1003",
+        validate=validate.Regexp(r'^-?[0-9]+:[0-9]+$'),
+    )
 
 
 class PendingTasksTableResultsSchema(BaseSchema):
@@ -503,6 +509,12 @@ class PendingTasksTableResultsSchema(BaseSchema):
 class PendingTasksSchema(TableRecordsSuccessSchema):
     """Schema for returning a list of pending task results"""
 
+    next_cursor = fields.Str(
+        required=False,
+        description="Cursor for fetching the next page of results. Null if this is the last page",
+        example="1052:1003",
+        allow_none=True,
+    )
     results = fields.Nested(
         PendingTasksTableResultsSchema,
         required=True,
@@ -1234,6 +1246,8 @@ class SettingsRemoteInstallationLinkConfigSchema(BaseSchema):
             "preloading_count":                2,
             "enable_checksum_validation":      False,
             "enable_config_missing_libraries": False,
+            "transfer_stream_count":           1,
+            "transfer_chunk_size_mb":          8,
         },
     )
     distributed_worker_count_target = fields.Int(
@@ -1241,6 +1255,76 @@ class SettingsRemoteInstallationLinkConfigSchema(BaseSchema):
         description="The target count of workers to be distributed across any configured linked installations",
         example=4,
     )
+    api_metrics = fields.List(
+        fields.Dict(),
+        required=False,
+        description="Request latency metrics for each API endpoint of the remote installation called by this installation",
+        example=[
+            {
+                "endpoint":       "GET /unmanic/api/v2/workers/status",
+                "count":          120,
+                "errors":         0,
+                "avg_ms":         12.4,
+                "max_ms":         85.2,
+                "last_ms":        10.9,
+                "last_requested": 1636166593.013826,
+            },
+        ],
+    )
+
+
+class RequestRemoteInstallationLinkSyncSchema(BaseSchema):
+    """Schema to request the link sync state given the UUID of the requesting installation"""
+
+    uuid = fields.Str(
+        required=True,
+        description="The uuid of the requesting installation",
+        example="7cd35429-76ab-4a29-8649-8c91236b5f8b",
+    )
+    revisions = fields.Dict(
+        keys=fields.Str(),
+        values=fields.Str(),
+        required=False,
+        description="The revision of each section from the last sync. Sections with a matching revision are not returned",
+        example={
+            "installation": "5b1f8e8b4c3d4d3c96a1c8b9f8a7e6d5c4b3a291",
+        },
+    )
+
+
+class SettingsRemoteInstallationLinkSyncSchema(BaseSchema):
+    """Schema to display the link sync state of this installation"""
+
+    revision = fields.Str(
+        required=True,
+        description="The revision of all sections combined",
+        example="0c5d9f0f7e0b1a2b3c4d5e6f7a8b9c0d1e2f3a4b",
+    )
+    revisions = fields.Dict(
+        keys=fields.Str(),
+        values=fields.Str(),
+        required=True,
+        description="The current revision of each section",
+        example={
+            "installation": "5b1f8e8b4c3d4d3c96a1c8b9f8a7e6d5c4b3a291",
+            "link_config":  "e4d909c290d0fb1ca068ffaddf22cbd0a2b1c3d4",
+            "libraries":    "9a0364b9e99bb480dd25e1f0284c8555a1b2c3d4",
+        },
+    )
+    sections = fields.Dict(
+        required=True,
+        description="The data of each section that has changed since the requested revisions",
+        example={
+            "libraries": [
+                "Default",
+            ],
+        },
+    )
+    task_count = fields.Int(
+        required=True,
+        description="The total number of tasks",
+        example=12,
+    )
 
 
 class LibraryResultsSchema(BaseSchema):
@@ -1412,6 +1496,61 @@ class SettingsLibraryPluginConfigImportSchema(SettingsLibraryPluginConfigExportS
     )
 
 
+# TRANSFER
+# ========
+
+class RequestUploadSessionCreateSchema(BaseSchema):
+    """Schema for requesting a new resumable upload session"""
+
+    filename = fields.Str(
+        required=True,
+        description="The name of the file to upload",
+        example="example.mp4",
+    )
+    size = fields.Int(
+        required=True,
+        description="The size of the file to upload in bytes",
+        example=1073741824,
+        validate=validate.Range(min=0),
+    )
+
+
+class UploadSessionSchema(BaseSchema):
+    """Schema for returning the state of a resumable upload session"""
+
+    session_id = fields.Str(
+        required=True,
+        description="The ID of the upload session",
+        example="0b7c4a8de2a94b3b8a0e1b7c2f3d4e5f",
+    )
+    filename = fields.Str(
+        required=True,
+        description="The name of the file being uploaded",
+        example="example.mp4",
+    )
+    size = fields.Int(
+        required=True,
+        description="The size of the file being uploaded in bytes",
+        example=1073741824,
+    )
+    offset = fields.Int(
+        required=True,
+        description="The number of bytes received from the start of the file",
+        example=8388608,
+    )
+    received = fields.List(
+        fields.List(fields.Int()),
+        required=False,
+        description="The [start, end) byte ranges received so far. Chunks may be uploaded in any order",
+        example=[[0, 8388608], [16777216, 25165824]],
+    )
+    chunk_size = fields.Int(
+        required=True,
+        description="The preferred size of each chunk in bytes",
+        example=8388608,
+    )
+
+
 # VERSION
 # =======
 
@@ -1489,6 +1628,16 @@ class WorkerStatusResultsSchema(BaseSchema):
         ],
         validate=validate.Length(min=0),
     )
+    worker_log_count = fields.Int(
+        required=False,
+        description="The total number of log lines produced by the worker for the current task",
+        example=4,
+    )
+    sequence = fields.Int(
+        required=False,
+        description="Incremented each time the status of this worker changes",
+        example=12,
+    )
     runners_info = fields.Dict(
         required=True,
         description="The status of the plugin runner currently processing the file",
@@ -1511,7 +1660,13 @@ class WorkerStatusResultsSchema(BaseSchema):
         example={
             "pid":     140408939493120,
             "percent": "None",
-            "elapsed": "None"
+            "elapsed": "None",
+            "stats":   {
+                "output_lines":            1024,
+                "output_lines_per_second": 25.4,
+                "parser_calls":            160,
+                "parser_avg_ms":           0.042
+            }
         },
     )
 
@@ -1526,3 +1681,34 @@ class WorkerStatusSuccessSchema(BaseSchema):
         many=True,
         validate=validate.Length(min=0),
     )
+
+
+class WorkersCapacitySchema(BaseSchema):
+    """Schema for returning the capacity of this installation to take on tasks from a linked installation"""
+
+    worker_count = fields.Int(
+        required=True,
+        description="The number of workers",
+        example=4,
+    )
+    idle_worker_count = fields.Int(
+        required=True,
+        description="The number of workers that are idle and not paused",
+        example=1,
+    )
+    busy_worker_count = fields.Int(
+        required=True,
+        description="The number of workers that are processing a task",
+        example=2,
+    )
+    pending_count = fields.Int(
+        required=True,
+        description="The number of pending tasks",
+        example=0,
+    )
+    library_names = fields.List(
+        fields.Str(),
+        required=True,
+        description="The names of the configured libraries",
+        example=["Default"],
+    )
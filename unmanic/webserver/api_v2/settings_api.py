@@ -39,11 +39,12 @@ from unmanic.libs.uiserver import UnmanicDataQueues
 from unmanic.libs.worker_group import WorkerGroup
 from unmanic.webserver.api_v2.base_api_handler import BaseApiError, BaseApiHandler
 from unmanic.webserver.api_v2.schema.schemas import RequestDatabaseItemByIdSchema, RequestLibraryByIdSchema, \
-    RequestRemoteInstallationLinkConfigSchema, SettingsLibrariesListSchema, SettingsLibraryConfigReadAndWriteSchema, \
+    RequestRemoteInstallationLinkConfigSchema, RequestRemoteInstallationLinkSyncSchema, SettingsLibrariesListSchema, \
+    SettingsLibraryConfigReadAndWriteSchema, \
     SettingsLibraryPluginConfigExportSchema, \
     SettingsLibraryPluginConfigImportSchema, SettingsReadAndWriteSchema, \
     SettingsRemoteInstallationDataSchema, \
-    SettingsRemoteInstallationLinkConfigSchema, SettingsSystemConfigSchema, \
+    SettingsRemoteInstallationLinkConfigSchema, SettingsRemoteInstallationLinkSyncSchema, SettingsSystemConfigSchema, \
     RequestSettingsRemoteInstallationAddressValidationSchema, SettingsWorkerGroupConfigSchema, WorkerGroupsListSchema
 from unmanic.webserver.helpers import plugins
 
@@ -104,6 +105,11 @@ class ApiSettingsHandler(BaseApiHandler):
             "supported_methods": ["POST"],
             "call_method":       "write_link_config",
         },
+        {
+            "path_pattern":      r"/settings/link/sync",
+            "supported_methods": ["POST"],
+            "call_method":       "sync_link_config",
+        },
         {
             "path_pattern":      r"/settings/link/remove",
             "supported_methods": ["DELETE"],
@@ -722,8 +728,11 @@ class ApiSettingsHandler(BaseApiHandler):
                         "enable_checksum_validation":      data.get('enable_checksum_validation'),
                         "enable_config_missing_libraries": data.get('enable_config_missing_libraries'),
                         "enable_distributed_worker_count": data.get('enable_distributed_worker_count', False),
+                        "transfer_stream_count":           data.get('transfer_stream_count', 1),
+                        "transfer_chunk_size_mb":          data.get('transfer_chunk_size_mb', 8),
                     },
                     "distributed_worker_count_target": data.get('distributed_worker_count_target', 0),
+                    "api_metrics":                     links.get_remote_api_metrics(data.get('address') or ''),
                 }
             )
             self.write_success(response)
@@ -796,6 +805,71 @@ class ApiSettingsHandler(BaseApiHandler):
             self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
             self.write_error()
 
+    def sync_link_config(self):
+        """
+        Settings - sync the link state with a remote installation
+        ---
+        description: Returns the revision of each section of the link state of this installation for the requesting
+            remote installation. Only the data of sections that differ from the requested revisions are returned.
+        requestBody:
+            description: The UUID of the requesting installation and the section revisions from its last sync
+            required: True
+            content:
+                application/json:
+                    schema:
+                        RequestRemoteInstallationLinkSyncSchema
+        responses:
+            200:
+                description: 'Sample response: Returns the link sync state with only the changed sections.'
+                content:
+                    application/json:
+                        schema:
+                            SettingsRemoteInstallationLinkSyncSchema
+            400:
+                description: Bad request; Check `messages` for any validation errors
+                content:
+                    application/json:
+                        schema:
+                            BadRequestSchema
+            404:
+                description: Bad request; Requested endpoint not found
+                content:
+                    application/json:
+                        schema:
+                            BadEndpointSchema
+            405:
+                description: Bad request; Requested method is not allowed
+                content:
+                    application/json:
+                        schema:
+                            BadMethodSchema
+            500:
+                description: Internal error; Check `error` for exception
+                content:
+                    application/json:
+                        schema:
+                            InternalErrorSchema
+        """
+        try:
+            json_request = self.read_json_request(RequestRemoteInstallationLinkSyncSchema())
+
+            links = Links()
+            sync_state = links.read_remote_installation_link_sync_state(json_request.get('uuid'),
+                                                                        revisions=json_request.get('revisions', {}))
+
+            response = self.build_response(
+                SettingsRemoteInstallationLinkSyncSchema(),
+                sync_state
+            )
+            self.write_success(response)
+            return
+        except BaseApiError as bae:
+            tornado.log.app_log.error("BaseApiError.{}: {}".format(self.route.get('call_method'), str(bae)))
+            return
+        except Exception as e:
+            self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
+            self.write_error()
+
     def remove_link_config(self):
         """
         Settings - remove a configuration for a remote installation link
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.transfer_api.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (11:05 AM)
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import time
+
+import tornado.escape
+import tornado.log
+
+from unmanic import config
+from unmanic.libs import common
+from unmanic.libs.chunkedtransfer import CHUNK_HASH_HEADER, ChunkedTransferError, UploadSessions
+from unmanic.webserver.api_v2.base_api_handler import BaseApiHandler, BaseApiError
+from unmanic.webserver.api_v2.schema.schemas import PendingTasksTableResultsSchema, \
+    RequestUploadSessionCreateSchema, UploadSessionSchema
+from unmanic.webserver.helpers import pending_tasks
+
+
+class ApiTransferHandler(BaseApiHandler):
+    config = None
+    params = None
+    upload_sessions = None
+
+    routes = [
+        {
+            "path_pattern":      r"/transfer/upload/session",
+            "supported_methods": ["POST"],
+            "call_method":       "create_upload_session",
+        },
+        {
+            "path_pattern":      r"/transfer/upload/session/(?P<session_id>[0-9a-f]{32})",
+            "supported_methods": ["GET"],
+            "call_method":       "get_upload_session",
+        },
+        {
+            "path_pattern":      r"/transfer/upload/session/(?P<session_id>[0-9a-f]{32})",
+            "supported_methods": ["DELETE"],
+            "call_method":       "delete_upload_session",
+        },
+        {
+            "path_pattern":      r"/transfer/upload/session/(?P<session_id>[0-9a-f]{32})/chunk/(?P<offset>[0-9]+)",
+            "supported_methods": ["PUT"],
+            "call_method":       "upload_session_chunk",
+        },
+        {
+            "path_pattern":      r"/transfer/upload/session/(?P<session_id>[0-9a-f]{32})/complete",
+            "supported_methods": ["POST"],
+            "call_method":       "complete_upload_session",
+        },
+    ]
+
+    def initialize(self, **kwargs):
+        self.params = kwargs.get("params")
+        self.config = config.Config()
+        self.upload_sessions = UploadSessions()
+
+    def create_upload_session(self):
+        """
+        Transfer - create a resumable upload session
+        ---
+        description: Creates a session for uploading a file in chunks. Chunks are sent with PUT to
+            /transfer/upload/session/{session_id}/chunk/{offset}
+        requestBody:
+            description: The name and size of the file to upload
+            required: True
+            content:
+                application/json:
+                    schema:
+                        RequestUploadSessionCreateSchema
+        responses:
+            200:
+                description: 'Successful request; Returns the upload session'
+                content:
+                    application/json:
+                        schema:
+                            UploadSessionSchema
+            400:
+                description: Bad request; Check `messages` for any validation errors
+                content:
+                    application/json:
+                        schema:
+                            BadRequestSchema
+            404:
+                description: Bad request; Requested endpoint not found
+                content:
+                    application/json:
+                        schema:
+                            BadEndpointSchema
+            405:
+                description: Bad request; Requested method is not allowed
+                content:
+                    application/json:
+                        schema:
+                            BadMethodSchema
+            500:
+                description: Internal error; Check `error` for exception
+                content:
+                    application/json:
+                        schema:
+                            InternalErrorSchema
+        """
+        try:
+            json_request = self.read_json_request(RequestUploadSessionCreateSchema())
+
+            session_data = self.upload_sessions.create_session(json_request.get('filename'), json_request.get('size'))
+
+            response = self.build_response(UploadSessionSchema(), session_data)
+            self.write_success(response)
+            return
+        except BaseApiError as bae:
+            tornado.log.app_log.error("BaseApiError.{}: {}".format(self.route.get('call_method'), str(bae)))
+            return
+        except ChunkedTransferError as e:
+            self.set_status(self.STATUS_ERROR_EXTERNAL, reason=str(e))
+            self.write_error()
+        except Exception as e:
+            self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
+            self.write_error()
+
+    def get_upload_session(self, session_id=None):
+        """
+        Transfer - read a resumable upload session
+        ---
+        description: Returns the state of an upload session, including the byte ranges received so far.
+        responses:
+            200:
+                description: 'Successful request; Returns the upload session'
+                content:
+                    application/json:
+                        schema:
+                            UploadSessionSchema
+            400:
+                description: Bad request; Check `messages` for any validation errors
+                content:
+                    application/json:
+                        schema:
+                            BadRequestSchema
+            404:
+                description: Bad request; Requested endpoint not found
+                content:
+                    application/json:
+                        schema:
+                            BadEndpointSchema
+            405:
+                description: Bad request; Requested method is not allowed
+                content:
+                    application/json:
+                        schema:
+                            BadMethodSchema
+            500:
+                description: Internal error; Check `error` for exception
+                content:
+                    application/json:
+                        schema:
+                            InternalErrorSchema
+        """
+        try:
+            session_data = self.upload_sessions.get_session(tornado.escape.to_unicode(session_id))
+
+            response = self.build_response(UploadSessionSchema(), session_data)
+            self.write_success(response)
+            return
+        except BaseApiError as bae:
+            tornado.log.app_log.error("BaseApiError.{}: {}".format(self.route.get('call_method'), str(bae)))
+            return
+        except ChunkedTransferError as e:
+            self.set_status(self.STATUS_ERROR_EXTERNAL, reason=str(e))
+            self.write_error()
+        except Exception as e:
+            self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
+            self.write_error()
+
+    def delete_upload_session(self, session_id=None):
+        """
+        Transfer - remove a resumable upload session
+        ---
+        description: Removes an upload session and any data it has received
+        responses:
+            200:
+                description: 'Successful request; Returns success status'
+                content:
+                    application/json:
+                        schema:
+                            BaseSuccessSchema
+            400:
+                description: Bad request; Check `messages` for any validation errors
+                content:
+                    application/json:
+                        schema:
+                            BadRequestSchema
+            404:
+                description: Bad request; Requested endpoint not found
+                content:
+                    application/json:
+                        schema:
+                            BadEndpointSchema
+            405:
+                description: Bad request; Requested method is not allowed
+                content:
+                    application/json:
+                        schema:
+                            BadMethodSchema
+            500:
+                description: Internal error; Check `error` for exception
+                content:
+                    application/json:
+                        schema:
+                            InternalErrorSchema
+        """
+        try:
+            self.upload_sessions.remove_session(tornado.escape.to_unicode(session_id))
+
+            self.write_success()
+            return
+        except BaseApiError as bae:
+            tornado.log.app_log.error("BaseApiError.{}: {}".format(self.route.get('call_method'), str(bae)))
+            return
+        except ChunkedTransferError as e:
+            self.set_status(self.STATUS_ERROR_EXTERNAL, reason=str(e))
+            self.write_error()
+        except Exception as e:
+            self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
+            self.write_error()
+
+    def upload_session_chunk(self, session_id=None, offset=None):
+        """
+        Transfer - upload a chunk to a resumable upload session
+        ---
+        description: Writes the raw request body into an upload session at the given offset. Chunks may be sent
+            in any order and over several connections at once. If the X-Unmanic-Chunk-Sha256 header is set,
+            the chunk is rejected unless its SHA-256 digest matches.
+        requestBody:
+            description: The chunk data
+            required: True
+            content:
+                application/octet-stream:
+                    schema:
+                        type: string
+                        format: binary
+        responses:
+            200:
+                description: 'Successful request; Returns the upload session'
+                content:
+                    application/json:
+                        schema:
+                            UploadSessionSchema
+            400:
+                description: Bad request; Check `messages` for any validation errors
+                content:
+                    application/json:
+                        schema:
+                            BadRequestSchema
+            404:
+                description: Bad request; Requested endpoint not found
+                content:
+                    application/json:
+                        schema:
+                            BadEndpointSchema
+            405:
+                description: Bad request; Requested method is not allowed
+                content:
+                    application/json:
+                        schema:
+                            BadMethodSchema
+            500:
+                description: Internal error; Check `error` for exception
+                content:
+                    application/json:
+                        schema:
+                            InternalErrorSchema
+        """
+        try:
+            session_data = self.upload_sessions.write_chunk(tornado.escape.to_unicode(session_id), int(offset),
+                                                            self.request.body,
+                                                            expected_hash=self.request.headers.get(CHUNK_HASH_HEADER))
+
+            response = self.build_response(UploadSessionSchema(), session_data)
+            self.write_success(response)
+            return
+        except BaseApiError as bae:
+            tornado.log.app_log.error("BaseApiError.{}: {}".format(self.route.get('call_method'), str(bae)))
+            return
+        except ChunkedTransferError as e:
+            self.set_status(self.STATUS_ERROR_EXTERNAL, reason=str(e))
+            self.write_error()
+        except Exception as e:
+            self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
+            self.write_error()
+
+    def complete_upload_session(self, session_id=None):
+        """
+        Transfer - complete a resumable upload session
+        ---
+        description: Completes an upload session and adds the uploaded file to the pending tasks list
+        responses:
+            200:
+                description: 'Successful request; Returns data for the generated task'
+                content:
+                    application/json:
+                        schema:
+                            PendingTasksTableResultsSchema
+            400:
+                description: Bad request; Check `messages` for any validation errors
+                content:
+                    application/json:
+                        schema:
+                            BadRequestSchema
+            404:
+                description: Bad request; Requested endpoint not found
+                content:
+                    application/json:
+                        schema:
+                            BadEndpointSchema
+            405:
+                description: Bad request; Requested method is not allowed
+                content:
+                    application/json:
+                        schema:
+                            BadMethodSchema
+            500:
+                description: Internal error; Check `error` for exception
+                content:
+                    application/json:
+                        schema:
+                            InternalErrorSchema
+        """
+        try:
+            # Move the uploaded file to the same location used by the multipart upload API
+            out_folder = "unmanic_remote_pending_library-{}".format(time.time())
+            cache_directory = os.path.join(self.config.get_cache_path(), 'remote_library', out_folder)
+            pathname = self.upload_sessions.complete_session(tornado.escape.to_unicode(session_id), cache_directory)
+
+            # Create task entry for the file
+            task_info = pending_tasks.add_remote_tasks(pathname)
+            if not task_info:
+                self.set_status(self.STATUS_ERROR_INTERNAL, reason="Failed to create a task for the uploaded file")
+                self.write_error()
+                return
+
+            checksum = common.get_file_checksum(task_info.get('abspath'))
+
+            # Return the details of the generated task
+            response = self.build_response(
+                PendingTasksTableResultsSchema(),
+                {
+                    "id":       task_info.get('id'),
+                    "abspath":  task_info.get('abspath'),
+                    "priority": task_info.get('priority'),
+                    "type":     task_info.get('type'),
+                    "status":   task_info.get('status'),
+                    "checksum": checksum
+                }
+            )
+            self.write_success(response)
+            return
+        except BaseApiError as bae:
+            tornado.log.app_log.error("BaseApiError.{}: {}".format(self.route.get('call_method'), str(bae)))
+            return
+        except ChunkedTransferError as e:
+            self.set_status(self.STATUS_ERROR_EXTERNAL, reason=str(e))
+            self.write_error()
+        except Exception as e:
+            self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
+            self.write_error()
@@ -33,7 +33,8 @@
 import tornado.log
 from unmanic.libs.uiserver import UnmanicDataQueues, UnmanicRunningTreads
 from unmanic.webserver.api_v2.base_api_handler import BaseApiHandler, BaseApiError
-from unmanic.webserver.api_v2.schema.schemas import RequestWorkerByIdSchema, WorkerStatusSuccessSchema
+from unmanic.webserver.api_v2.schema.schemas import RequestWorkerByIdSchema, WorkerStatusSuccessSchema, \
+    WorkersCapacitySchema
 from unmanic.webserver.helpers import workers
 
 
@@ -78,6 +79,11 @@ class ApiWorkersHandler(BaseApiHandler):
             "supported_methods": ["GET"],
             "call_method":       "workers_status",
         },
+        {
+            "path_pattern":      r"/workers/capacity",
+            "supported_methods": ["GET"],
+            "call_method":       "workers_capacity",
+        },
     ]
 
     def initialize(self, **kwargs):
@@ -480,3 +486,55 @@ class ApiWorkersHandler(BaseApiHandler):
         except Exception as e:
             self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
             self.write_error()
+
+    def workers_capacity(self):
+        """
+        Workers - Return the capacity of this installation
+        ---
+        description: Returns a compact summary of the workers, pending tasks and libraries used by linked
+            installations to decide if tasks can be sent to this installation. The response carries an ETag.
+            Send it back in an If-None-Match header to receive a 304 response when nothing has changed.
+        responses:
+            200:
+                description: 'Sample response: Returns the capacity of this installation.'
+                content:
+                    application/json:
+                        schema:
+                            WorkersCapacitySchema
+            400:
+                description: Bad request; Check `messages` for any validation errors
+                content:
+                    application/json:
+                        schema:
+                            BadRequestSchema
+            404:
+                description: Bad request; Requested endpoint not found
+                content:
+                    application/json:
+                        schema:
+                            BadEndpointSchema
+            405:
+                description: Bad request; Requested method is not allowed
+                content:
+                    application/json:
+                        schema:
+                            BadMethodSchema
+            500:
+                description: Internal error; Check `error` for exception
+                content:
+                    application/json:
+                        schema:
+                            InternalErrorSchema
+        """
+        try:
+            capacity = workers.get_capacity()
+
+            response = self.build_response(WorkersCapacitySchema(), capacity)
+            self.write_success(response)
+            return
+        except BaseApiError as bae:
+            tornado.log.app_log.error("BaseApiError.{}: {}".format(self.route.get('call_method'), str(bae)))
+            return
+        except Exception as e:
+            self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
+            self.write_error()
@@ -35,7 +35,9 @@ import time
 import uuid
 
 from tornado import iostream, web
+from tornado.ioloop import IOLoop
 
+from unmanic.libs.chunkedtransfer import CHUNK_HASH_HEADER, chunk_hash, parse_range_header
 from unmanic.libs.singleton import SingletonType
 
 
@@ -70,7 +72,26 @@ class DownloadsLinks(object, metaclass=SingletonType):
     def get_download_link(self, link_id):
         # Find and remove expired links
         self.__remove_expired()
-        return self._download_links.get(link_id, {})
+        link_data = self._download_links.get(link_id, {})
+        if link_data:
+            # Extend the expiry so that a client can keep requesting ranges of a large file
+            link_data['expires'] = (time.time() + 60)
+        return link_data
+
+
+def read_file_range(abspath, start, end):
+    """
+    Read an inclusive byte range from a file and return the data with its hash
+
+    :param abspath:
+    :param start:
+    :param end:
+    :return:
+    """
+    with open(abspath, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start + 1)
+    return data, chunk_hash(data)
 
 
 class DownloadsHandler(web.RequestHandler):
@@ -91,6 +112,27 @@ class DownloadsHandler(web.RequestHandler):
 
         self.set_header('Content-Type', 'application/octet-stream')
         self.set_header('Content-Disposition', 'attachment; filename={}'.format(basename))
+        self.set_header('Accept-Ranges', 'bytes')
+
+        # Serve a single range of the file along with its hash so the client can verify and resume the download
+        file_size = os.path.getsize(abspath)
+        byte_range = parse_range_header(self.request.headers.get('Range'), file_size)
+        if byte_range is not None:
+            start, end = byte_range
+            if start >= file_size:
+                self.set_status(416)
+                self.set_header('Content-Range', 'bytes */{}'.format(file_size))
+                return
+            data, data_hash = await IOLoop.current().run_in_executor(None, read_file_range, abspath, start, end)
+            self.set_status(206)
+            self.set_header('Content-Range', 'bytes {}-{}/{}'.format(start, start + len(data) - 1, file_size))
+            self.set_header(CHUNK_HASH_HEADER, data_hash)
+            try:
+                self.write(data)
+                await self.flush()
+            except iostream.StreamClosedError:
+                pass
+            return
 
         # Serve file download in 1MB chunks
         with open(abspath, 'rb') as f:
@@ -30,10 +30,80 @@
 
 """
 import os
+import threading
+import time
 
 from unmanic.libs import task
 from unmanic.libs.library import Library
 
+# Task counts are cached for a few seconds so that each polling client does not count the whole task table
+task_counts_cache_seconds = 5
+task_counts_cache = {}
+task_counts_cache_lock = threading.Lock()
+
+# Columns that the pending task list can be paged through with a cursor
+cursor_order_columns = ['priority', 'id']
+
+
+def get_task_counts(search_value=''):
+    """
+    Returns a tuple of the total task count and the count of pending tasks matching the search value.
+    Counts are cached for 'task_counts_cache_seconds'. Expired counts are dropped when new counts are cached,
+    so counts for old search values are not kept for the life of the process.
+
+    :param search_value:
+    :return:
+    """
+    now = time.monotonic()
+    with task_counts_cache_lock:
+        cached = task_counts_cache.get(search_value)
+        if cached and (now - cached[0]) < task_counts_cache_seconds:
+            return cached[1]
+
+    task_handler = task.Task()
+    # Get total count
+    records_total_count = task_handler.get_total_task_list_count()
+    # Get quantity after filters (without pagination)
+    records_filtered_count = task_handler.get_task_list_filtered_and_sorted(search_value=search_value,
+                                                                            status='pending').count()
+    counts = (records_total_count, records_filtered_count)
+    with task_counts_cache_lock:
+        for cached_search_value in [k for k, v in task_counts_cache.items() if (now - v[0]) >= task_counts_cache_seconds]:
+            del task_counts_cache[cached_search_value]
+        task_counts_cache[search_value] = (now, counts)
+    return counts
+
+
+def invalidate_task_counts():
+    """
+    Clear the cached task counts
+
+    :return:
+    """
+    with task_counts_cache_lock:
+        task_counts_cache.clear()
+
+
+class InvalidCursorError(ValueError):
+    """
+    Raised when a pending task list cursor can not be decoded
+    """
+    pass
+
+
+def encode_cursor(pending_task, order_column):
+    return '{}:{}'.format(pending_task[order_column], pending_task['id'])
+
+
+def decode_cursor(cursor):
+    if not cursor:
+        return None
+    try:
+        value, task_id = str(cursor).split(':', 1)
+        return int(value), int(task_id)
+    except ValueError:
+        raise InvalidCursorError("Invalid cursor '{}'".format(cursor))
+
 
 def prepare_filtered_pending_tasks_for_table(request_dict):
     """
@@ -60,12 +130,7 @@ def prepare_filtered_pending_tasks_for_table(request_dict):
 
     # Fetch tasks
     task_handler = task.Task()
-    # Get total count
-    records_total_count = task_handler.get_total_task_list_count()
-    # Get quantity after filters (without pagination)
-    records_filtered_count = task_handler.get_task_list_filtered_and_sorted(order=order, start=0, length=0,
-                                                                            search_value=search_value,
-                                                                            status='pending').count()
+    records_total_count, records_filtered_count = get_task_counts(search_value)
     # Get filtered/sorted results
     pending_task_results = task_handler.get_task_list_filtered_and_sorted(order=order, start=start, length=length,
                                                                           search_value=search_value, status='pending')
@@ -100,6 +165,9 @@ def prepare_filtered_pending_tasks(params, include_library=False):
     Returns a object of records filtered and sorted
     according to the provided request.
 
+    If the results are ordered by priority or ID, a 'cursor' from the 'next_cursor'
+    of a previous page may be given in place of 'start' to fetch the following page.
+
     :param params:
     :param include_library:
     :return:
@@ -114,26 +182,29 @@ def prepare_filtered_pending_tasks(params, include_library=False):
         "dir":    'desc',
     })
 
+    cursor = None
+    if order.get('column') in cursor_order_columns:
+        cursor = decode_cursor(params.get('cursor'))
+
     # Fetch tasks
     task_handler = task.Task()
-    # Get total count
-    records_total_count = task_handler.get_total_task_list_count()
-    # Get quantity after filters (without pagination)
-    records_filtered_count = task_handler.get_task_list_filtered_and_sorted(order=order, start=0, length=0,
-                                                                            search_value=search_value,
-                                                                            status='pending').count()
+    records_total_count, records_filtered_count = get_task_counts(search_value)
     # Get filtered/sorted results
     pending_task_results = task_handler.get_task_list_filtered_and_sorted(order=order, start=start, length=length,
-                                                                          search_value=search_value, status='pending')
+                                                                          search_value=search_value, status='pending',
+                                                                          cursor=cursor)
 
     # Build return data
     return_data = {
         "recordsTotal":    records_total_count,
         "recordsFiltered": records_filtered_count,
+        "next_cursor":     None,
         "results":         []
     }
 
     # Iterate over tasks and append them to the task data
+    libraries = {}
+    pending_task = None
     for pending_task in pending_task_results:
         # Set params as required in template
         item = {
@@ -145,11 +216,18 @@ def prepare_filtered_pending_tasks(params, include_library=False):
         }
         if include_library:
             # Get library
-            library = Library(pending_task['library_id'])
+            library = libraries.get(pending_task['library_id'])
+            if library is None:
+                library = libraries[pending_task['library_id']] = Library(pending_task['library_id'])
             item['library_id'] = library.get_id()
             item['library_name'] = library.get_name()
         return_data["results"].append(item)
 
+    # Set a cursor to the next page if this one was full
+    if pending_task is not None and order.get('column') in cursor_order_columns:
+        if length and len(return_data["results"]) >= int(length):
+            return_data["next_cursor"] = encode_cursor(pending_task, order.get('column'))
+
     # Return results
     return return_data
 
@@ -163,7 +241,9 @@ def remove_pending_tasks(pending_task_ids):
     """
     # Delete by ID
     task_handler = task.Task()
-    return task_handler.delete_tasks_recursively(id_list=pending_task_ids)
+    result = task_handler.delete_tasks_recursively(id_list=pending_task_ids)
+    invalidate_task_counts()
+    return result
 
 
 def reorder_pending_tasks(pending_task_ids, direction="top"):
@@ -197,6 +277,7 @@ def add_remote_tasks(pathname):
         # File was not created.
         # Do not carry on.
         return False
+    invalidate_task_counts()
     return new_task.get_task_data()
 
 
@@ -29,7 +29,9 @@
            OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
+from unmanic.libs.library import Library
 from unmanic.libs.uiserver import UnmanicRunningTreads
+from unmanic.webserver.helpers import pending_tasks
 
 
 def pause_worker_by_id(worker_id: int):
@@ -99,3 +101,18 @@ def terminate_all_workers():
     urt = UnmanicRunningTreads()
     foreman = urt.get_unmanic_running_thread('foreman')
     return foreman.terminate_all_worker_threads()
+
+
+def get_capacity():
+    """
+    Return a compact summary of the capacity of this installation to take on tasks from a linked installation
+
+    :return:
+    """
+    urt = UnmanicRunningTreads()
+    foreman = urt.get_unmanic_running_thread('foreman')
+    capacity = foreman.get_worker_capacity()
+    records_total_count, records_filtered_count = pending_tasks.get_task_counts()
+    capacity['pending_count'] = records_filtered_count
+    capacity['library_names'] = [library.get('name') for library in Library.get_all_libraries()]
+    return capacity
@@ -30,40 +30,30 @@
 
 """
 import json
-import queue
-import time
-import uuid
 
 import tornado.web
 import tornado.locks
-import tornado.ioloop
 import tornado.websocket
-from tornado import gen, log
+from tornado import log
 
 from unmanic import config
-from unmanic.libs import common, history, session
-from unmanic.libs.uiserver import UnmanicDataQueues, UnmanicRunningTreads
-from unmanic.webserver.helpers import completed_tasks, pending_tasks
+from unmanic.libs import session
+from unmanic.libs.uiserver import UnmanicDataQueues
+from unmanic.webserver.websocket_publisher import WebsocketPublisher
 
 
 class UnmanicWebsocketHandler(tornado.websocket.WebSocketHandler):
     name = None
     config = None
-    sending_frontend_message = False
-    sending_system_logs = False
-    sending_worker_info = False
-    sending_pending_tasks_info = False
-    sending_completed_tasks_info = False
     close_event = False
 
     def __init__(self, *args, **kwargs):
         self.name = 'UnmanicWebsocketHandler'
         self.config = config.Config()
-        self.server_id = str(uuid.uuid4())
+        self.publisher = WebsocketPublisher()
+        self.server_id = self.publisher.server_id
         udq = UnmanicDataQueues()
-        urt = UnmanicRunningTreads()
         self.data_queues = udq.get_unmanic_data_queues()
-        self.foreman = urt.get_unmanic_running_thread('foreman')
         self.session = session.Session()
         super(UnmanicWebsocketHandler, self).__init__(*args, **kwargs)
 
@@ -83,10 +73,7 @@ class UnmanicWebsocketHandler(tornado.websocket.WebSocketHandler):
     def on_close(self):
         tornado.log.app_log.warning('WS Closed', exc_info=True)
         self.close_event.set()
-        self.stop_frontend_messages()
-        self.stop_workers_info()
-        self.stop_pending_tasks_info()
-        self.stop_completed_tasks_info()
+        self.publisher.unsubscribe_all(self)
 
     def default_failure_response(self, params=None):
         """
@@ -110,9 +97,7 @@ class UnmanicWebsocketHandler(tornado.websocket.WebSocketHandler):
         :return:
         :rtype:
         """
-        if not self.sending_frontend_message:
-            self.sending_frontend_message = True
-            tornado.ioloop.IOLoop.current().spawn_callback(self.async_frontend_message)
+        self.publisher.subscribe('frontend_message', self)
 
     def stop_frontend_messages(self, params=None):
         """
@@ -124,7 +109,7 @@ class UnmanicWebsocketHandler(tornado.websocket.WebSocketHandler):
         :return:
         :rtype:
         """
-        self.sending_frontend_message = False
+        self.publisher.unsubscribe('frontend_message', self)
 
     def start_system_logs(self, params=None):
         """
@@ -136,9 +121,7 @@ class UnmanicWebsocketHandler(tornado.websocket.WebSocketHandler):
         :return:
         :rtype:
         """
-        if not self.sending_system_logs:
-            self.sending_system_logs = True
-            tornado.ioloop.IOLoop.current().spawn_callback(self.async_system_logs)
+        self.publisher.subscribe('system_logs', self)
 
     def stop_system_logs(self, params=None):
         """
@@ -150,21 +133,26 @@ class UnmanicWebsocketHandler(tornado.websocket.WebSocketHandler):
         :return:
         :rtype:
         """
-        self.sending_system_logs = False
+        self.publisher.unsubscribe('system_logs', self)
 
     def start_workers_info(self, params=None):
         """
         WS Command - start_workers_info
         Start sending information pertaining to the workers
 
+        params:
+            - deltas    - If true, send 'workers_status' messages. The first is a full snapshot of all workers,
+                          following messages contain only the fields of each worker that changed
+
         :param params:
         :type params:
         :return:
         :rtype:
         """
-        if not self.sending_worker_info:
-            self.sending_worker_info = True
-            tornado.ioloop.IOLoop.current().spawn_callback(self.async_workers_info)
+        if params and params.get('deltas'):
+            self.publisher.subscribe('workers_status', self)
+        else:
+            self.publisher.subscribe('workers_info', self)
 
     def stop_workers_info(self, params=None):
         """
@@ -176,7 +164,8 @@ class UnmanicWebsocketHandler(tornado.websocket.WebSocketHandler):
         :return:
         :rtype:
         """
-        self.sending_worker_info = False
+        self.publisher.unsubscribe('workers_info', self)
+        self.publisher.unsubscribe('workers_status', self)
 
     def start_pending_tasks_info(self, params=None):
         """
@@ -188,9 +177,7 @@ class UnmanicWebsocketHandler(tornado.websocket.WebSocketHandler):
         :return:
         :rtype:
         """
-        if not self.sending_pending_tasks_info:
-            self.sending_pending_tasks_info = True
-            tornado.ioloop.IOLoop.current().spawn_callback(self.async_pending_tasks_info)
+        self.publisher.subscribe('pending_tasks', self)
 
     def stop_pending_tasks_info(self, params=None):
         """
@@ -202,7 +189,7 @@ class UnmanicWebsocketHandler(tornado.websocket.WebSocketHandler):
         :return:
         :rtype:
         """
-        self.sending_pending_tasks_info = False
+        self.publisher.unsubscribe('pending_tasks', self)
 
     def start_completed_tasks_info(self, params=None):
         """
@@ -214,9 +201,7 @@ class UnmanicWebsocketHandler(tornado.websocket.WebSocketHandler):
         :return:
         :rtype:
         """
-        if not self.sending_completed_tasks_info:
-            self.sending_completed_tasks_info = True
-            tornado.ioloop.IOLoop.current().spawn_callback(self.async_completed_tasks_info)
+        self.publisher.subscribe('completed_tasks', self)
 
     def stop_completed_tasks_info(self, params=None):
         """
@@ -228,7 +213,7 @@ class UnmanicWebsocketHandler(tornado.websocket.WebSocketHandler):
         :return:
         :rtype:
         """
-        self.sending_completed_tasks_info = False
+        self.publisher.unsubscribe('completed_tasks', self)
 
     def dismiss_message(self, params=None):
         """
@@ -249,144 +234,3 @@ class UnmanicWebsocketHandler(tornado.websocket.WebSocketHandler):
     async def send(self, message):
         if self.ws_connection:
             await self.write_message(message)
-
-    async def async_frontend_message(self):
-        while self.sending_frontend_message:
-            frontend_messages = self.data_queues.get('frontend_messages')
-            frontend_message_items = frontend_messages.read_all_items()
-            # Send message to client
-            await self.send(
-                {
-                    'success':   True,
-                    'server_id': self.server_id,
-                    'type':      'frontend_message',
-                    'data':      frontend_message_items,
-                }
-            )
-
-            # Sleep for X seconds
-            await gen.sleep(.2)
-
-    async def async_system_logs(self):
-        while self.sending_system_logs:
-            system_logs = self.config.read_system_logs(lines=35)
-
-            # Send message to client
-            await self.send(
-                {
-                    'success':   True,
-                    'server_id': self.server_id,
-                    'type':      'system_logs',
-                    'data':      {
-                        "logs_path":   self.config.get_log_path(),
-                        'system_logs': system_logs,
-                    },
-                }
-            )
-
-            # Sleep for X seconds
-            await gen.sleep(1)
-
-    async def async_workers_info(self):
-        while self.sending_worker_info:
-            workers_info = self.foreman.get_all_worker_status()
-
-            # Send message to client
-            await self.send(
-                {
-                    'success':   True,
-                    'server_id': self.server_id,
-                    'type':      'workers_info',
-                    'data':      workers_info,
-                }
-            )
-
-            # Sleep for X seconds
-            await gen.sleep(.2)
-
-    async def async_pending_tasks_info(self):
-        while self.sending_pending_tasks_info:
-            results = []
-            params = {
-                'start':        '0',
-                'length':       '10',
-                'search_value': '',
-                'order':        {
-                    "column": 'priority',
-                    "dir":    'desc',
-                }
-            }
-            task_list = pending_tasks.prepare_filtered_pending_tasks(params)
-
-            for task_result in task_list.get('results', []):
-                # Append the task to the results list
-                results.append(
-                    {
-                        'id':       task_result['id'],
-                        'label':    task_result['abspath'],
-                        'priority': task_result['priority'],
-                        'status':   task_result['status'],
-                    }
-                )
-
-            # Send message to client
-            await self.send(
-                {
-                    'success':   True,
-                    'server_id': self.server_id,
-                    'type':      'pending_tasks',
-                    'data':      {
-                        'results': results
-                    },
-                }
-            )
-
-            # Sleep for X seconds
-            await gen.sleep(3)
-
-    async def async_completed_tasks_info(self):
-        while self.sending_completed_tasks_info:
-            results = []
-            params = {
-                'start':        '0',
-                'length':       '10',
-                'search_value': '',
-                'order':        {
-                    "column": 'finish_time',
-                    "dir":    'desc',
-                }
-            }
-            task_list = completed_tasks.prepare_filtered_completed_tasks(params)
-
-            for task_result in task_list.get('results', []):
-                # Set human readable time
-                if (int(task_result['finish_time']) + 60) > int(time.time()):
-                    human_readable_time = 'Just Now'
-                else:
-                    human_readable_time = common.make_timestamp_human_readable(int(task_result['finish_time']))
-
-                # Append the task to the results list
-                results.append(
-                    {
-                        'id':                  task_result['id'],
-                        'label':               task_result['task_label'],
-                        'success':             task_result['task_success'],
-                        'finish_time':         task_result['finish_time'],
-                        'human_readable_time': human_readable_time,
-                    }
-                )
-
-            # Send message to client
-            await self.send(
-                {
-                    'success':   True,
-                    'server_id': self.server_id,
-                    'type':      'completed_tasks',
-                    'data':      {
-                        'results': results
-                    },
-                }
-            )
-
-            # Sleep for X seconds
-            await gen.sleep(3)
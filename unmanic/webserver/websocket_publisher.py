@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.websocket_publisher.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     18 Oct 2026, (11:15 AM)
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import time
+import uuid
+
+import tornado.escape
+import tornado.ioloop
+import tornado.websocket
+from tornado import gen, log
+
+from unmanic import config
+from unmanic.libs import common
+from unmanic.libs.singleton import SingletonType
+from unmanic.libs.uiserver import UnmanicDataQueues, UnmanicRunningTreads
+from unmanic.libs.workerstatus import diff_all_worker_status
+from unmanic.webserver.helpers import completed_tasks, pending_tasks
+
+
+def frontend_message_snapshot():
+    frontend_messages = UnmanicDataQueues().get_unmanic_data_queues().get('frontend_messages')
+    return frontend_messages.read_all_items()
+
+
+def frontend_message_wait(version, timeout):
+    frontend_messages = UnmanicDataQueues().get_unmanic_data_queues().get('frontend_messages')
+    return frontend_messages.wait_for_change(version, timeout=timeout)
+
+
+def system_logs_snapshot():
+    settings = config.Config()
+    return {
+        "logs_path":   settings.get_log_path(),
+        'system_logs': settings.read_system_logs(lines=35),
+    }
+
+
+def workers_info_snapshot():
+    foreman = UnmanicRunningTreads().get_unmanic_running_thread('foreman')
+    return foreman.get_all_worker_status()
+
+
+def pending_tasks_snapshot():
+    results = []
+    params = {
+        'start':        '0',
+        'length':       '10',
+        'search_value': '',
+        'order':        {
+            "column": 'priority',
+            "dir":    'desc',
+        }
+    }
+    task_list = pending_tasks.prepare_filtered_pending_tasks(params)
+
+    for task_result in task_list.get('results', []):
+        # Append the task to the results list
+        results.append(
+            {
+                'id':       task_result['id'],
+                'label':    task_result['abspath'],
+                'priority': task_result['priority'],
+                'status':   task_result['status'],
+            }
+        )
+    return {
+        'results': results
+    }
+
+
+def completed_tasks_snapshot():
+    results = []
+    params = {
+        'start':        '0',
+        'length':       '10',
+        'search_value': '',
+        'order':        {
+            "column": 'finish_time',
+            "dir":    'desc',
+        }
+    }
+    task_list = completed_tasks.prepare_filtered_completed_tasks(params)
+
+    for task_result in task_list.get('results', []):
+        # Set human readable time
+        if (int(task_result['finish_time']) + 60) > int(time.time()):
+            human_readable_time = 'Just Now'
+        else:
+            human_readable_time = common.make_timestamp_human_readable(int(task_result['finish_time']))
+
+        # Append the task to the results list
+        results.append(
+            {
+                'id':                  task_result['id'],
+                'label':               task_result['task_label'],
+                'success':             task_result['task_success'],
+                'finish_time':         task_result['finish_time'],
+                'human_readable_time': human_readable_time,
+            }
+        )
+    return {
+        'results': results
+    }
+
+
+class WebsocketTopic(object):
+    """
+    WebsocketTopic
+
+    A stream of snapshots published to all subscribed websocket connections.
+
+    If a delta function is given, subscribers are sent a full snapshot when they
+    subscribe and then only the changes returned by delta_function(previous, current).
+    Each message carries a 'sequence' (and deltas the 'previous_sequence') so that
+    clients can detect a missed message and subscribe again.
+
+    If a change waiter is given, the topic waits for change_waiter(version, timeout)
+    to return a new version between snapshots rather than polling. The interval is
+    then the minimum time between snapshots.
+
+    """
+
+    def __init__(self, name, interval, snapshot_function, blocking=False, delta_function=None, change_waiter=None):
+        self.name = name
+        self.interval = interval
+        self.snapshot_function = snapshot_function
+        # Blocking snapshots (DB queries, file reads) are taken in a thread pool rather than on the IOLoop
+        self.blocking = blocking
+        self.delta_function = delta_function
+        self.change_waiter = change_waiter
+        self.version = None
+        self.subscribers = set()
+        self.running = False
+        self.payload = None
+        self.payload_time = 0
+        self.data = None
+        self.sequence = 0
+
+
+class WebsocketPublisher(object, metaclass=SingletonType):
+    """
+    WebsocketPublisher
+
+    Takes a single snapshot of each topic per tick, no matter how many websocket
+    connections are subscribed to it, and sends the encoded message to every
+    subscriber. A message is only sent when the snapshot has changed, or at least
+    every 'keepalive_interval' seconds. New subscribers are sent the latest message
+    straight away.
+
+    A topic's loop only runs while it has subscribers.
+
+    """
+
+    keepalive_interval = 10
+    # Max time a change waiter blocks a thread pool worker before the topic checks its subscribers again
+    change_wait_timeout = 1
+
+    def __init__(self):
+        self.server_id = str(uuid.uuid4())
+        self.topics = {}
+        self.register_topic('frontend_message', .2, frontend_message_snapshot, change_waiter=frontend_message_wait)
+        self.register_topic('system_logs', 1, system_logs_snapshot, blocking=True)
+        self.register_topic('workers_info', .2, workers_info_snapshot)
+        self.register_topic('workers_status', .2, workers_info_snapshot, delta_function=diff_all_worker_status)
+        self.register_topic('pending_tasks', 3, pending_tasks_snapshot, blocking=True)
+        self.register_topic('completed_tasks', 3, completed_tasks_snapshot, blocking=True)
+
+    def register_topic(self, name, interval, snapshot_function, blocking=False, delta_function=None,
+                       change_waiter=None):
+        """
+        Register a topic that websocket connections may subscribe to
+
+        :param name:
+        :param interval:
+        :param snapshot_function:
+        :param blocking:
+        :param delta_function:
+        :param change_waiter:
+        :return:
+        """
+        self.topics[name] = WebsocketTopic(name, interval, snapshot_function, blocking=blocking,
+                                           delta_function=delta_function, change_waiter=change_waiter)
+
+    def __encode(self, topic, data):
+        return tornado.escape.json_encode(
+            {
+                'success':   True,
+                'server_id': self.server_id,
+                'type':      topic.name,
+                'data':      data,
+            }
+        )
+
+    def __full_payload(self, topic):
+        if topic.delta_function is None:
+            return topic.payload
+        if topic.data is None:
+            return None
+        return self.__encode(topic, {
+            'sequence': topic.sequence,
+            'full':     True,
+            'snapshot': topic.data,
+        })
+
+    def subscribe(self, name, handler):
+        """
+        Subscribe a websocket connection to a topic.
+        Must be called from the IOLoop.
+
+        :param name:
+        :param handler:
+        :return:
+        """
+        topic = self.topics[name]
+        if handler in topic.subscribers:
+            return
+        topic.subscribers.add(handler)
+        if not topic.running:
+            topic.running = True
+            tornado.ioloop.IOLoop.current().spawn_callback(self.__run_topic, topic)
+        else:
+            payload = self.__full_payload(topic)
+            if payload is not None:
+                tornado.ioloop.IOLoop.current().spawn_callback(self.__write, handler, payload)
+
+    def unsubscribe(self, name, handler):
+        """
+        Unsubscribe a websocket connection from a topic.
+        Must be called from the IOLoop.
+
+        :param name:
+        :param handler:
+        :return:
+        """
+        self.topics[name].subscribers.discard(handler)
+
+    def unsubscribe_all(self, handler):
+        for name in self.topics:
+            self.unsubscribe(name, handler)
+
+    async def __run_topic(self, topic):
+        io_loop = tornado.ioloop.IOLoop.current()
+        while topic.subscribers:
+            try:
+                if topic.blocking:
+                    data = await io_loop.run_in_executor(None, topic.snapshot_function)
+                else:
+                    data = topic.snapshot_function()
+                now = time.monotonic()
+                if topic.delta_function is not None:
+                    payload = self.__delta_payload(topic, data, now)
+                else:
+                    payload = self.__encode(topic, data)
+                    if payload == topic.payload and (now - topic.payload_time) < self.keepalive_interval:
+                        payload = None
+                    else:
+                        topic.payload = payload
+                        topic.payload_time = now
+                if payload is not None:
+                    await gen.multi([self.__write(handler, payload) for handler in list(topic.subscribers)])
+            except Exception as e:
+                log.app_log.error("Failed to publish websocket topic '{}' - {}".format(topic.name, str(e)), exc_info=True)
+
+            # Sleep for X seconds
+            await gen.sleep(topic.interval)
+            if topic.change_waiter is not None:
+                await self.__wait_for_change(topic)
+        # Drop the last message so that the next subscriber is not sent a stale snapshot
+        topic.running = False
+        topic.payload = None
+        topic.data = None
+        topic.version = None
+
+    async def __wait_for_change(self, topic):
+        """
+        Wait until the topic's data has changed, the keepalive is due or there are no subscribers left
+
+        :param topic:
+        :return:
+        """
+        io_loop = tornado.ioloop.IOLoop.current()
+        while topic.subscribers:
+            try:
+                version = await io_loop.run_in_executor(None, topic.change_waiter, topic.version,
+                                                        self.change_wait_timeout)
+            except Exception as e:
+                log.app_log.error("Failed to wait for websocket topic '{}' - {}".format(topic.name, str(e)),
+                                  exc_info=True)
+                return
+            if version != topic.version:
+                topic.version = version
+                return
+            if (time.monotonic() - topic.payload_time) >= self.keepalive_interval:
+                return
+
+    def __delta_payload(self, topic, data, now):
+        if topic.data is None:
+            # First snapshot. Send it in full
+            topic.data = data
+            topic.sequence += 1
+            topic.payload_time = now
+            return self.__full_payload(topic)
+        delta = topic.delta_function(topic.data, data)
+        topic.data = data
+        if delta is None:
+            if (now - topic.payload_time) < self.keepalive_interval:
+                return None
+            delta = {}
+        topic.payload_time = now
+        topic.sequence += 1
+        return self.__encode(topic, dict(delta, sequence=topic.sequence, previous_sequence=topic.sequence - 1,
+                                         full=False))
+
+    @staticmethod
+    async def __write(handler, payload):
+        if not handler.ws_connection:
+            return
+        try:
+            await handler.write_message(payload)
+        except tornado.websocket.WebSocketClosedError:
+            pass